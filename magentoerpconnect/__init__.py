@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 import setting
 import connector
+import queue_job
 import backend
 
 import magento_model
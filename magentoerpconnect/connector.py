@@ -23,6 +23,7 @@ from openerp.osv import orm, fields
 from openerp.addons.connector.connector import (Environment,
                                                 install_in_connector)
 from openerp.addons.connector.checkpoint import checkpoint
+from .unit.binder import binding_cache
 
 install_in_connector()
 
@@ -48,6 +49,11 @@ class magento_binding(orm.AbstractModel):
     _inherit = 'external.binding'
     _description = 'Magento Binding (abstract)'
 
+    # Number of seconds to wait after the last write on a binding
+    # before its export is run, the writes done in the meantime are
+    # merged in the same export. 0 exports as soon as possible.
+    _export_debounce = 0
+
     _columns = {
         # 'openerp_id': openerp-side id must be declared in concrete model
         'backend_id': fields.many2one(
@@ -57,11 +63,30 @@ class magento_binding(orm.AbstractModel):
             ondelete='restrict'),
         # fields.char because 0 is a valid Magento ID
         'magento_id': fields.char('ID on Magento'),
+        # JSON {scope: {key: hash}} of the values sent by the last
+        # exports, see MagentoExporter
+        'export_hashes': fields.text('Hashes of the Exported Values',
+                                     readonly=True),
     }
 
     # the _sql_contraints cannot be there due to this bug:
     # https://bugs.launchpad.net/openobject-server/+bug/1151703
 
+    def write(self, cr, uid, ids, vals, context=None):
+        if isinstance(ids, (int, long)):
+            ids = [ids]
+        if set(vals) & set(('magento_id', 'backend_id', 'openerp_id')):
+            binding_cache.invalidate(cr.dbname, self._name, ids)
+        return super(magento_binding, self).write(cr, uid, ids, vals,
+                                                  context=context)
+
+    def unlink(self, cr, uid, ids, context=None):
+        if isinstance(ids, (int, long)):
+            ids = [ids]
+        binding_cache.invalidate(cr.dbname, self._name, ids)
+        return super(magento_binding, self).unlink(cr, uid, ids,
+                                                   context=context)
+
 
 def add_checkpoint(session, model_name, record_id, backend_id):
     """ Add a row in the model ``connector.checkpoint`` for a record,
@@ -24,14 +24,48 @@ from openerp.addons.connector.event import (on_record_write,
                                             on_record_unlink
                                             )
 from openerp.addons.connector.connector import Binder
-from .unit.export_synchronizer import export_record
+from openerp.addons.connector.exception import NoConnectorUnitError
+from openerp.addons.connector.unit.mapper import ExportMapper
+from .unit.export_synchronizer import delay_export_record
 from .unit.delete_synchronizer import export_delete_record
+from .unit.mapper import export_source_fields
 from .connector import get_environment
 
 _MODEL_NAMES = ()
 _BIND_MODEL_NAMES = ()
 
 
+def _export_needed(session, binding, fields):
+    """ Return True if a write on ``fields`` has to be exported
+
+    The export is not needed when the binding is already exported
+    and the export mapper reads none of the ``fields``.
+    """
+    if not fields or not binding.magento_id:
+        return True
+    env = get_environment(session, binding._model._name,
+                          binding.backend_id.id)
+    try:
+        mapper = env.get_connector_unit(ExportMapper)
+    except NoConnectorUnitError:
+        return True
+    source_fields = export_source_fields(type(mapper))
+    return source_fields is None or bool(source_fields.intersection(fields))
+
+
+def _delay_export(session, binding, fields):
+    """ Delay the export of a binding, postponed by the
+    ``_export_debounce`` of the binding model """
+    if not _export_needed(session, binding, fields):
+        return
+    model_name = binding._model._name
+    debounce = getattr(session.pool[model_name], '_export_debounce', 0)
+    kwargs = {'fields': fields}
+    if debounce:
+        kwargs['eta'] = debounce
+    delay_export_record(session, model_name, binding.id, **kwargs)
+
+
 @on_record_create(model_names=_BIND_MODEL_NAMES)
 @on_record_write(model_names=_BIND_MODEL_NAMES)
 def delay_export(session, model_name, record_id, vals):
@@ -39,11 +73,19 @@ def delay_export(session, model_name, record_id, vals):
 
     (A binding record being a ``magento.res.partner``,
     ``magento.product.product``, ...)
+
+    When an export of the record is already pending, the fields are
+    merged in it instead. See ``_export_debounce`` on the bindings to
+    postpone the exports after the last write.
+
+    Nothing is delayed when the written fields are not used by the
+    export mapper.
     """
     if session.context.get('connector_no_export'):
         return
     fields = vals.keys()
-    export_record.delay(session, model_name, record_id, fields=fields)
+    binding = session.browse(model_name, record_id)
+    _delay_export(session, binding, fields)
 
 
 @on_record_write(model_names=_MODEL_NAMES)
@@ -60,8 +102,7 @@ def delay_export_all_bindings(session, model_name, record_id, vals):
                           record_id, context=session.context)
     fields = vals.keys()
     for binding in record.magento_bind_ids:
-        export_record.delay(session, binding._model._name, binding.id,
-                            fields=fields)
+        _delay_export(session, binding, fields)
 
 
 @on_record_unlink(model_names=_MODEL_NAMES)
@@ -28,7 +28,6 @@ from openerp.addons.connector.unit.synchronizer import ExportSynchronizer
 from openerp.addons.connector.event import on_record_create
 from openerp.addons.connector_ecommerce.event import (on_invoice_paid,
                                                       on_invoice_validated)
-from openerp.addons.connector.exception import IDMissingInBackend
 from .unit.backend_adapter import GenericAdapter
 from .connector import get_environment
 from .backend import magento
@@ -89,16 +88,8 @@ class AccountInvoiceAdapter(GenericAdapter):
     _magento_model = 'sales_order_invoice'
     _admin_path = 'sales_invoice/view/invoice_id/{id}'
 
-    def _call(self, method, arguments):
-        try:
-            return super(AccountInvoiceAdapter, self)._call(method, arguments)
-        except xmlrpclib.Fault as err:
-            # this is the error in the Magento API
-            # when the invoice does not exist
-            if err.faultCode == 100:
-                raise IDMissingInBackend
-            else:
-                raise
+    # error in the Magento API when the invoice does not exist
+    _id_missing_fault_codes = (100,)
 
     def create(self, order_increment_id, items, comment, email,
                include_comment):
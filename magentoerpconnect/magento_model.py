@@ -45,6 +45,10 @@ from .connector import add_checkpoint
 _logger = logging.getLogger(__name__)
 
 IMPORT_DELTA_BUFFER = 30  # seconds
+# all the products are recomputed by the stock synchronization once in
+# this interval, the other runs recompute only the products having
+# modified stock moves
+STOCK_FULL_SYNC_INTERVAL = 24 * 60 * 60  # seconds
 
 
 class magento_backend(orm.Model):
@@ -153,6 +157,24 @@ class magento_backend(orm.Model):
             help="Choose the field of the product which will be used for "
                  "stock inventory updates.\nIf empty, Quantity Available "
                  "is used."),
+        'product_stock_engine': fields.selection(
+            [('orm', 'Stock Field'),
+             ('sql', 'Stock Moves Aggregate')],
+            string='Stock Computation',
+            required=True,
+            help="With 'Stock Moves Aggregate', the quantities of all the "
+                 "products are computed in one query on the stock moves "
+                 "of the warehouse location, only for the Quantity On "
+                 "Hand and the Forecasted Quantity. The other stock "
+                 "fields are always computed by the products."),
+        'stock_moves_sync_date': fields.datetime(
+            'Stock moves synchronized until',
+            readonly=True,
+            help="The next stock synchronization recomputes the products "
+                 "having stock moves modified since this date."),
+        'stock_full_sync_date': fields.datetime(
+            'Last full stock synchronization',
+            readonly=True),
         'product_binding_ids': fields.one2many('magento.product.product',
                                                'backend_id',
                                                string='Magento Products',
@@ -161,6 +183,7 @@ class magento_backend(orm.Model):
 
     _defaults = {
         'product_stock_field_id': _get_stock_field_id,
+        'product_stock_engine': 'orm',
         'use_custom_api_path': False,
         'use_auth_basic': False,
     }
@@ -276,6 +299,7 @@ class magento_backend(orm.Model):
     def update_product_stock_qty(self, cr, uid, ids, context=None):
         if not hasattr(ids, '__iter__'):
             ids = [ids]
+        start_time = datetime.now()
         mag_product_obj = self.pool.get('magento.product.product')
         product_ids = mag_product_obj.search(cr, uid,
                                              [('backend_id', 'in', ids),
@@ -283,6 +307,68 @@ class magento_backend(orm.Model):
                                              context=context)
         mag_product_obj.recompute_magento_qty(cr, uid, product_ids,
                                               context=context)
+        next_time = self._stock_sync_next_time(start_time)
+        self.write(cr, uid, ids, {'stock_moves_sync_date': next_time,
+                                  'stock_full_sync_date': next_time},
+                   context=context)
+        return True
+
+    def _stock_sync_next_time(self, start_time):
+        """ Return the date from which the stock moves have to be
+        considered by the next stock synchronization """
+        # the write date of the moves is the beginning of their
+        # transaction, the buffer catches the moves of the transactions
+        # running during the synchronization, as for the imports
+        next_time = start_time - timedelta(seconds=IMPORT_DELTA_BUFFER)
+        return next_time.strftime(DEFAULT_SERVER_DATETIME_FORMAT)
+
+    def update_product_stock_qty_incremental(self, cr, uid, ids,
+                                             context=None):
+        """ Recompute the stock quantities of the products having stock
+        moves modified since the last stock synchronization.
+
+        All the products are recomputed on the first synchronization and
+        then once every ``STOCK_FULL_SYNC_INTERVAL``, to reconcile the
+        changes not visible on the stock moves (deleted moves, custom
+        stock fields, ...).
+        """
+        if not hasattr(ids, '__iter__'):
+            ids = [ids]
+        start_time = datetime.now()
+        full_sync_limit = start_time - timedelta(
+            seconds=STOCK_FULL_SYNC_INTERVAL)
+        fmt = DEFAULT_SERVER_DATETIME_FORMAT
+        mag_product_obj = self.pool.get('magento.product.product')
+        full_ids = []
+        for backend in self.browse(cr, uid, ids, context=context):
+            if (not backend.stock_moves_sync_date or
+                    not backend.stock_full_sync_date or
+                    datetime.strptime(backend.stock_full_sync_date,
+                                      fmt) < full_sync_limit):
+                full_ids.append(backend.id)
+                continue
+            cr.execute("SELECT DISTINCT product_id FROM stock_move "
+                       "WHERE write_date >= %s",
+                       (backend.stock_moves_sync_date,))
+            moved_ids = [row[0] for row in cr.fetchall()]
+            if moved_ids:
+                product_ids = mag_product_obj.search(
+                    cr, uid,
+                    [('backend_id', '=', backend.id),
+                     ('no_stock_sync', '=', False),
+                     ('openerp_id', 'in', moved_ids)],
+                    context=context)
+                _logger.debug('%d products moved since %s on backend %s',
+                              len(product_ids),
+                              backend.stock_moves_sync_date, backend.name)
+                mag_product_obj.recompute_magento_qty(cr, uid, product_ids,
+                                                      context=context)
+            self.write(cr, uid, backend.id,
+                       {'stock_moves_sync_date':
+                        self._stock_sync_next_time(start_time)},
+                       context=context)
+        if full_ids:
+            self.update_product_stock_qty(cr, uid, full_ids, context=context)
         return True
 
     def _magento_backend(self, cr, uid, callback, domain=None, context=None):
@@ -318,7 +404,8 @@ class magento_backend(orm.Model):
 
     def _scheduler_update_product_stock_qty(self, cr, uid,
                                             domain=None, context=None):
-        self._magento_backend(cr, uid, self.update_product_stock_qty,
+        self._magento_backend(cr, uid,
+                              self.update_product_stock_qty_incremental,
                               domain=domain, context=context)
 
     def output_recorder(self, cr, uid, ids, context=None):
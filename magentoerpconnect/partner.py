@@ -20,7 +20,6 @@
 ##############################################################################
 
 import logging
-import xmlrpclib
 from collections import namedtuple
 from openerp.osv import fields, orm
 from openerp.addons.connector.queue.job import job
@@ -31,7 +30,6 @@ from openerp.addons.connector.unit.mapper import (mapping,
                                                   only_create,
                                                   ImportMapper
                                                   )
-from openerp.addons.connector.exception import IDMissingInBackend
 from .unit.backend_adapter import (GenericAdapter,
                                    MAGENTO_DATETIME_FORMAT,
                                    )
@@ -201,24 +199,14 @@ class PartnerAdapter(GenericAdapter):
     _magento_model = 'customer'
     _admin_path = '/{model}/edit/id/{id}'
 
-    def _call(self, method, arguments):
-        try:
-            return super(PartnerAdapter, self)._call(method, arguments)
-        except xmlrpclib.Fault as err:
-            # this is the error in the Magento API
-            # when the customer does not exist
-            if err.faultCode == 102:
-                raise IDMissingInBackend
-            else:
-                raise
-
-    def search(self, filters=None, from_date=None, to_date=None,
-               magento_website_ids=None):
-        """ Search records according to some criteria and return a
-        list of ids
+    # error in the Magento API when the customer does not exist
+    _id_missing_fault_codes = (102,)
+    _cursor_field = 'entity_id'
+    _list_id_field = 'customer_id'
 
-        :rtype: list
-        """
+    def _search_filters(self, filters=None, from_date=None, to_date=None,
+                        magento_website_ids=None):
+        """ Return the filters for a search """
         if filters is None:
             filters = {}
 
@@ -232,34 +220,63 @@ class PartnerAdapter(GenericAdapter):
             filters['updated_at']['to'] = to_date.strftime(dt_fmt)
         if magento_website_ids is not None:
             filters['website_id'] = {'in': magento_website_ids}
+        return filters
 
+    def search(self, filters=None, from_date=None, to_date=None,
+               magento_website_ids=None):
+        """ Search records according to some criteria and return a
+        list of ids
+
+        :rtype: list
+        """
+        filters = self._search_filters(
+            filters, from_date=from_date, to_date=to_date,
+            magento_website_ids=magento_website_ids)
         # the search method is on ol_customer instead of customer
         return self._call('ol_customer.search',
                           [filters] if filters else [{}])
 
+    def search_read(self, filters=None, from_date=None, to_date=None,
+                    magento_website_ids=None):
+        """ Search records according to some criteria and return
+        their information (``customer_id``, ``updated_at``, ...)
+
+        :rtype: list
+        """
+        filters = self._search_filters(
+            filters, from_date=from_date, to_date=to_date,
+            magento_website_ids=magento_website_ids)
+        return self._call('%s.list' % self._magento_model,
+                          [filters] if filters else [{}])
+
 
 @magento
 class PartnerBatchImport(DelayedBatchImport):
     """ Import the Magento Partners.
 
-    For every partner in the list, a delayed job is created.
+    The partners are imported by chunks of ``_chunk_size`` in
+    delayed jobs.
     """
     _model_name = ['magento.res.partner']
+    _chunk_size = 20
 
     def run(self, filters=None):
         """ Run the synchronization """
         from_date = filters.pop('from_date', None)
         to_date = filters.pop('to_date', None)
         magento_website_ids = [filters.pop('magento_website_id')]
-        record_ids = self.backend_adapter.search(
+        pages = self.backend_adapter.search_read_pages(
             filters,
             from_date=from_date,
             to_date=to_date,
             magento_website_ids=magento_website_ids)
-        _logger.info('search for magento partners %s returned %s',
-                     filters, record_ids)
-        for record_id in record_ids:
-            self._import_record(record_id)
+        for records in pages:
+            record_ids = self._skip_uptodate(
+                [(row['customer_id'], row.get('updated_at'))
+                 for row in records])
+            _logger.info('search for magento partners %s returned %s',
+                         filters, record_ids)
+            self._import_records(record_ids)
 
 
 @magento
@@ -426,12 +443,14 @@ class PartnerAddressBook(ConnectorUnit):
     def _get_address_infos(self, magento_partner_id, partner_binding_id):
         get_unit = self.get_connector_unit_for_model
         adapter = get_unit(BackendAdapter)
-        mag_address_ids = adapter.search({'customer_id':
-                                          {'eq': magento_partner_id}})
-        if not mag_address_ids:
+        # the list returns the addresses with all their attributes,
+        # no need to read them one by one
+        magento_records = adapter.search_read({'customer_id':
+                                               {'eq': magento_partner_id}})
+        if not magento_records:
             return
-        for address_id in mag_address_ids:
-            magento_record = adapter.read(address_id)
+        for magento_record in magento_records:
+            address_id = int(magento_record['customer_address_id'])
 
             # defines if the billing address is merged with the partner
             # or imported as a standalone contact
@@ -495,7 +514,7 @@ class BaseAddressImportMapper(ImportMapper):
 
     @mapping
     def street(self, record):
-        value = record['street']
+        value = record.get('street') or ''
         lines = [line.strip() for line in value.split('\n') if line.strip()]
         if len(lines) == 1:
             result = {'street': lines[0], 'street2': False}
@@ -507,7 +526,7 @@ class BaseAddressImportMapper(ImportMapper):
 
     @mapping
     def title(self, record):
-        prefix = record['prefix']
+        prefix = record.get('prefix')
         title_id = False
         if prefix:
             title_ids = self.session.search('res.partner.title',
@@ -566,8 +585,20 @@ class AddressAdapter(GenericAdapter):
         :rtype: list
         """
         return [int(row['customer_address_id']) for row
-                in self._call('%s.list' % self._magento_model,
-                              [filters] if filters else [{}])]
+                in self.search_read(filters)]
+
+    def search_read(self, filters=None):
+        """ Search records according to some criterias
+        and returns their information
+
+        The rows of ``customer_address.list`` contain the same
+        attributes than ``customer_address.info``, except the
+        attributes without value which are missing.
+
+        :rtype: list
+        """
+        return self._call('%s.list' % self._magento_model,
+                          [filters] if filters else [{}])
 
 
 @magento
@@ -23,19 +23,34 @@
 import logging
 import urllib2
 import base64
-import xmlrpclib
+import hashlib
+import json
 import sys
+import tempfile
+import threading
+from array import array
 from collections import defaultdict
+from itertools import izip
+from multiprocessing.pool import ThreadPool
+
+import psycopg2
+
+from openerp import SUPERUSER_ID
 from openerp.osv import orm, fields
 from openerp.tools.translate import _
-from openerp.addons.connector.queue.job import job, related_action
+from openerp.addons.connector.queue.job import (job,
+                                                related_action,
+                                                PENDING,
+                                                ENQUEUED,
+                                                )
 from openerp.addons.connector.event import on_record_write
+from openerp.addons.connector.session import ConnectorSession
 from openerp.addons.connector.unit.synchronizer import (ImportSynchronizer,
                                                         ExportSynchronizer
                                                         )
 from openerp.addons.connector.exception import (MappingError,
                                                 InvalidDataError,
-                                                IDMissingInBackend
+                                                RetryableJobError,
                                                 )
 from openerp.addons.connector.unit.mapper import (mapping,
                                                   ImportMapper,
@@ -49,6 +64,7 @@ from .unit.import_synchronizer import (DelayedBatchImport,
                                        TranslationImporter,
                                        AddCheckpoint,
                                        )
+from .queue_job import delay_unique
 from .connector import get_environment
 from .backend import magento
 from .related_action import unwrap_binding
@@ -56,6 +72,23 @@ from .related_action import unwrap_binding
 _logger = logging.getLogger(__name__)
 
 
+# products exported in the same job by ``recompute_magento_qty``
+INVENTORY_EXPORT_CHUNK_SIZE = 500
+
+IMAGE_DOWNLOAD_WORKERS = 4  # images of a product downloaded at a time
+IMAGE_DOWNLOAD_TIMEOUT = 30  # seconds
+IMAGE_DOWNLOAD_CHUNK_SIZE = 64 * 1024  # bytes
+# model of the attachments storing the imported images
+IMAGE_STORE_MODEL = 'magento.product.product'
+
+# states of the stock moves counted in the stock fields computed by the
+# 'sql' stock computation of the backends
+STOCK_MOVE_STATES = {
+    'qty_available': ('done',),
+    'virtual_available': ('confirmed', 'waiting', 'assigned', 'done'),
+}
+
+
 def chunks(items, length):
     for index in xrange(0, len(items), length):
         yield items[index:index + length]
@@ -67,6 +100,10 @@ class magento_product_product(orm.Model):
     _inherits = {'product.product': 'openerp_id'}
     _description = 'Magento Product'
 
+    # the products are often modified several times in a row
+    # (stock moves, pricing rules, mass edits), wait for the last write
+    _export_debounce = 30
+
     def product_type_get(self, cr, uid, context=None):
         return [
             ('simple', 'Simple Product'),
@@ -129,6 +166,16 @@ class magento_product_product(orm.Model):
             required=False,
             help="Check this to exclude the product "
                  "from stock synchronizations."),
+        # URL, ETag, Last-Modified and hash of the last imported image
+        'image_sync_data': fields.text('Last Imported Image',
+                                       readonly=True),
+        'image_attachment_id': fields.many2one(
+            'ir.attachment',
+            string='Image in the Store',
+            readonly=True,
+            ondelete='set null',
+            help="The imported images are stored once per content, "
+                 "shared by the products having the same image."),
         }
 
     _defaults = {
@@ -152,8 +199,9 @@ class magento_product_product(orm.Model):
         on the backend has changed since the last export.
 
         If it has changed, write the updated quantity on `magento_qty`.
-        The write on `magento_qty` will trigger an `on_record_write`
-        event that will create an export job.
+        The inventories of the changed products are exported by
+        chunks of ``INVENTORY_EXPORT_CHUNK_SIZE`` products, one
+        ``export_product_inventory_batch`` job per chunk.
 
         It groups the products by backend to avoid to read the backend
         informations for each product.
@@ -186,6 +234,51 @@ class magento_product_product(orm.Model):
         if context is None:
             context = {}
 
+        binding_ids, quantities = self._magento_qty_changes(
+            cr, uid, backend, products, read_fields=read_fields,
+            context=context)
+
+        # the inventories are exported in batch jobs instead of one job
+        # per product delayed by the write of `magento_qty`
+        write_ctx = context.copy()
+        write_ctx['connector_no_export'] = True
+        changed = defaultdict(list)
+        for binding_id, new_qty in izip(binding_ids, quantities):
+            changed[new_qty].append(binding_id)
+        for new_qty, ids in changed.iteritems():
+            for chunk_ids in chunks(ids, self.RECOMPUTE_QTY_STEP):
+                self.write(cr, uid, chunk_ids, {'magento_qty': new_qty},
+                           context=write_ctx)
+
+        export_ids = []
+        for chunk_ids in chunks(binding_ids, self.RECOMPUTE_QTY_STEP):
+            export_ids += [product['id'] for product
+                           in self.read(cr, uid, list(chunk_ids),
+                                        ['no_stock_sync'], context=context)
+                           if not product['no_stock_sync']]
+        session = ConnectorSession(cr, uid, context=context)
+        for chunk_ids in chunks(export_ids, INVENTORY_EXPORT_CHUNK_SIZE):
+            export_product_inventory_batch.delay(
+                session, self._name, backend.id, chunk_ids,
+                fields=['magento_qty'], priority=20)
+
+    def _magento_qty_changes(self, cr, uid, backend, products,
+                             read_fields=None, context=None):
+        """ Return the products of a backend whose quantity to send on
+        Magento has changed, with their new quantity.
+
+        The stock field is read on the products, or, when the backend
+        uses the 'sql' stock computation, computed for all the products
+        at once by :meth:`~._stock_move_quantities`. In both cases,
+        the quantity sent on Magento is returned by
+        :meth:`~._magento_qty`.
+
+        :return: tuple with an array of the IDs of the bindings and an
+                 array of their new quantities
+        """
+        if context is None:
+            context = {}
+
         if backend.product_stock_field_id:
             stock_field = backend.product_stock_field_id.name
         else:
@@ -195,23 +288,75 @@ class magento_product_product(orm.Model):
         location_ctx = context.copy()
         location_ctx['location'] = location.id
 
-        product_fields = ['magento_qty', stock_field]
+        product_fields = ['magento_qty']
+        move_quantities = None
+        if (backend.product_stock_engine == 'sql' and
+                stock_field in STOCK_MOVE_STATES):
+            move_quantities = self._stock_move_quantities(
+                cr, uid, backend, location, STOCK_MOVE_STATES[stock_field],
+                context=context)
+            product_fields.append('openerp_id')
+        else:
+            product_fields.append(stock_field)
         if read_fields:
             product_fields += read_fields
 
+        binding_ids = array('l')
+        quantities = array('d')
         product_ids = [product['id'] for product in products]
         for chunk_ids in chunks(product_ids, self.RECOMPUTE_QTY_STEP):
             for product in self.read(cr, uid, chunk_ids, product_fields,
                                      context=location_ctx):
+                if move_quantities is not None:
+                    product[stock_field] = move_quantities.get(
+                        product['openerp_id'][0], 0.)
                 new_qty = self._magento_qty(cr, uid, product,
                                             backend,
                                             location,
                                             stock_field,
                                             context=location_ctx)
                 if new_qty != product['magento_qty']:
-                    self.write(cr, uid, product['id'],
-                               {'magento_qty': new_qty},
-                               context=context)
+                    binding_ids.append(product['id'])
+                    quantities.append(new_qty)
+        return binding_ids, quantities
+
+    def _stock_move_quantities(self, cr, uid, backend, location, states,
+                               context=None):
+        """ Compute the quantities of all the products bound to a
+        backend in a location (and its children), in one query grouping
+        the stock moves in the ``states``, as ``get_product_available``
+        does product per product.
+
+        :return: dict with the quantity by product id
+        """
+        location_ids = self.pool['stock.location'].search(
+            cr, uid, [('location_id', 'child_of', [location.id])],
+            context=context)
+        cr.execute("SELECT m.product_id, m.product_uom, t.uom_id, "
+                   "       SUM(CASE WHEN m.location_dest_id IN %%(locations)s "
+                   "                THEN m.product_qty "
+                   "                ELSE -m.product_qty END) "
+                   "FROM stock_move m "
+                   "JOIN product_product p ON p.id = m.product_id "
+                   "JOIN product_template t ON t.id = p.product_tmpl_id "
+                   "WHERE m.state IN %%(states)s "
+                   "AND (m.location_dest_id IN %%(locations)s) "
+                   "    != (m.location_id IN %%(locations)s) "
+                   "AND m.product_id IN (SELECT openerp_id FROM %s "
+                   "                     WHERE backend_id = %%(backend_id)s) "
+                   "GROUP BY m.product_id, m.product_uom, t.uom_id" %
+                   self._table,
+                   {'locations': tuple(location_ids),
+                    'states': tuple(states),
+                    'backend_id': backend.id})
+        uom_obj = self.pool['product.uom']
+        quantities = defaultdict(float)
+        for product_id, move_uom_id, uom_id, qty in cr.fetchall():
+            qty = float(qty or 0.)
+            if move_uom_id != uom_id:
+                qty = uom_obj._compute_qty(cr, uid, move_uom_id, qty, uom_id)
+            quantities[product_id] += qty
+        return quantities
 
     def _magento_qty(self, cr, uid, product, backend, location,
                      stock_field, context=None):
@@ -226,6 +371,52 @@ class magento_product_product(orm.Model):
         """
         return product[stock_field]
 
+    def _store_image(self, cr, uid, data, context=None):
+        """ Return the ID of the attachment storing an image, named by
+        the SHA-256 of its content. The attachment is shared by all the
+        bindings having the same image, it is created when no image has
+        the same content.
+
+        A unique index prevents 2 transactions to store the same image,
+        the second one fails with a unique violation.
+
+        :param data: content of the image encoded in base64
+        """
+        digest = hashlib.sha256(base64.b64decode(data)).hexdigest()
+        attachment_obj = self.pool['ir.attachment']
+        attachment_ids = attachment_obj.search(
+            cr, SUPERUSER_ID,
+            [('res_model', '=', IMAGE_STORE_MODEL),
+             ('res_id', '=', False),
+             ('name', '=', digest)],
+            context=context)
+        if attachment_ids:
+            return attachment_ids[0]
+        return attachment_obj.create(cr, SUPERUSER_ID,
+                                     {'name': digest,
+                                      'res_model': IMAGE_STORE_MODEL,
+                                      'datas': data,
+                                      'datas_fname': digest,
+                                      },
+                                     context=context)
+
+    def _scheduler_cleanup_image_store(self, cr, uid, context=None):
+        """ Delete the images of the store no longer used by a binding """
+        cr.execute("SELECT id FROM ir_attachment a "
+                   "WHERE a.res_model = %s AND a.res_id IS NULL "
+                   "AND a.name ~ '^[0-9a-f]{64}$' "
+                   "AND NOT EXISTS (SELECT 1 FROM magento_product_product p "
+                   "                WHERE p.image_attachment_id = a.id)",
+                   (IMAGE_STORE_MODEL,))
+        attachment_ids = [row[0] for row in cr.fetchall()]
+        if attachment_ids:
+            _logger.info('Deleting %d images no longer used from the store',
+                         len(attachment_ids))
+            self.pool['ir.attachment'].unlink(cr, SUPERUSER_ID,
+                                              attachment_ids,
+                                              context=context)
+        return True
+
 
 class product_product(orm.Model):
     _inherit = 'product.product'
@@ -246,27 +437,65 @@ class product_product(orm.Model):
                                                       context=context)
 
 
+class ir_attachment(orm.Model):
+    _inherit = 'ir.attachment'
+
+    def _auto_init(self, cr, context=None):
+        res = super(ir_attachment, self)._auto_init(cr, context=context)
+        # an image is stored once in the store of the images of the
+        # products, see ``magento_product_product._store_image``
+        cr.execute("SELECT indexname FROM pg_indexes WHERE indexname = "
+                   "'ir_attachment_magento_image_store_uniq'")
+        if not cr.fetchone():
+            cr.execute("CREATE UNIQUE INDEX "
+                       "ir_attachment_magento_image_store_uniq "
+                       "ON ir_attachment (name) "
+                       "WHERE res_model = %s AND res_id IS NULL "
+                       "AND name ~ '^[0-9a-f]{64}$'",
+                       (IMAGE_STORE_MODEL,))
+        return res
+
+
+class stock_move(orm.Model):
+    _inherit = 'stock.move'
+
+    def _auto_init(self, cr, context=None):
+        res = super(stock_move, self)._auto_init(cr, context=context)
+        # the stock synchronizations of the backends search the moves
+        # modified since their last run
+        cr.execute("SELECT indexname FROM pg_indexes "
+                   "WHERE indexname = 'stock_move_write_date_index'")
+        if not cr.fetchone():
+            cr.execute("CREATE INDEX stock_move_write_date_index "
+                       "ON stock_move (write_date)")
+        return res
+
+
 @magento
 class ProductProductAdapter(GenericAdapter):
     _model_name = 'magento.product.product'
     _magento_model = 'catalog_product'
     _admin_path = '/{model}/edit/id/{id}'
 
-    def _call(self, method, arguments):
-        try:
-            return super(ProductProductAdapter, self)._call(method, arguments)
-        except xmlrpclib.Fault as err:
-            # this is the error in the Magento API
-            # when the product does not exist
-            if err.faultCode == 101:
-                raise IDMissingInBackend
-            else:
-                raise
+    # error in the Magento API when the product does not exist
+    _id_missing_fault_codes = (101,)
+    _cursor_field = 'entity_id'
+    _list_id_field = 'product_id'
 
     def search(self, filters=None, from_date=None, to_date=None):
         """ Search records according to some criteria
         and returns a list of ids
 
+        :rtype: list
+        """
+        return [int(row['product_id']) for row
+                in self.search_read(filters, from_date=from_date,
+                                    to_date=to_date)]
+
+    def search_read(self, filters=None, from_date=None, to_date=None):
+        """ Search records according to some criteria
+        and returns their information (``product_id``, ``sku``, ...)
+
         :rtype: list
         """
         if filters is None:
@@ -279,9 +508,8 @@ class ProductProductAdapter(GenericAdapter):
             filters.setdefault('updated_at', {})
             filters['updated_at']['to'] = to_date.strftime(dt_fmt)
         # TODO add a search entry point on the Magento API
-        return [int(row['product_id']) for row
-                in self._call('%s.list' % self._magento_model,
-                              [filters] if filters else [{}])]
+        return self._call('%s.list' % self._magento_model,
+                          [filters] if filters else [{}])
 
     def create(self, product_type, attr_set_id, sku, data):
         # Only ol_catalog_product.create works for export configurable product
@@ -311,6 +539,34 @@ class ProductProductAdapter(GenericAdapter):
         return self._call('ol_catalog_product.update',
                           [int(id), data, storeview_id, 'id'])
 
+    def read_many(self, ids, storeview_id=None, attributes=None):
+        """ Returns the information of several records in one request
+
+        :return: list of dict, or the exception for the records
+                 which could not be read
+        :rtype: list
+        """
+        return self._multi_call([('ol_catalog_product.info',
+                                  [int(id), storeview_id, attributes, 'id'])
+                                 for id in ids])
+
+    def write_many(self, records):
+        """ Update several records on the external system in one request
+
+        :param records: list of ``(id, data)`` or
+                        ``(id, data, storeview_id)``
+        :return: list of the results, or the exception for the records
+                 which could not be updated
+        :rtype: list
+        """
+        calls = []
+        for record in records:
+            id, data = record[:2]
+            storeview_id = record[2] if len(record) > 2 else None
+            calls.append(('ol_catalog_product.update',
+                          [int(id), data, storeview_id, 'id']))
+        return self._multi_call(calls)
+
     def get_images(self, id, storeview_id=None):
         return self._call('product_media.list', [int(id), storeview_id, 'id'])
 
@@ -323,27 +579,44 @@ class ProductProductAdapter(GenericAdapter):
         return self._call('oerp_cataloginventory_stock_item.update',
                           [int(id), data])
 
+    def update_inventory_many(self, records):
+        """ Update the inventory of several products in one request
+
+        :param records: list of ``(id, data)``
+        :return: list of the results, or the exception for the products
+                 which could not be updated
+        :rtype: list
+        """
+        return self._multi_call([('oerp_cataloginventory_stock_item.update',
+                                  [int(id), data])
+                                 for id, data in records])
+
 
 @magento
 class ProductBatchImport(DelayedBatchImport):
     """ Import the Magento Products.
 
-    For every product category in the list, a delayed job is created.
+    The products are imported by chunks of ``_chunk_size`` in
+    delayed jobs.
     Import from a date
     """
     _model_name = ['magento.product.product']
+    _chunk_size = 10
 
     def run(self, filters=None):
         """ Run the synchronization """
         from_date = filters.pop('from_date', None)
         to_date = filters.pop('to_date', None)
-        record_ids = self.backend_adapter.search(filters,
-                                                 from_date=from_date,
-                                                 to_date=to_date)
-        _logger.info('search for magento products %s returned %s',
-                     filters, record_ids)
-        for record_id in record_ids:
-            self._import_record(record_id)
+        pages = self.backend_adapter.search_read_pages(filters,
+                                                       from_date=from_date,
+                                                       to_date=to_date)
+        for records in pages:
+            record_ids = self._skip_uptodate(
+                [(int(row['product_id']), row.get('updated_at'))
+                 for row in records])
+            _logger.info('search for magento products %s returned %s',
+                         filters, record_ids)
+            self._import_records(record_ids)
 
 
 @magento
@@ -383,42 +656,180 @@ class CatalogImageImporter(ImportSynchronizer):
             return (primary, -position)
         return sorted(images, key=priority)
 
-    def _get_binary_image(self, image_data):
+    def _image_request(self, image_data, previous):
+        """ Return the request downloading an image
+
+        When the image has the same URL than the last imported image,
+        the request is conditional, Magento answers '304 Not Modified'
+        if it has not changed.
+        """
         url = image_data['url'].encode('utf8')
+        request = urllib2.Request(url)
+        if self.backend_record.auth_basic_username \
+                and self.backend_record.auth_basic_password:
+            base64string = base64.encodestring(
+                '%s:%s' % (self.backend_record.auth_basic_username,
+                           self.backend_record.auth_basic_password))
+            request.add_header("Authorization", "Basic %s" % base64string)
+        if previous.get('url') == url:
+            if previous.get('etag'):
+                request.add_header('If-None-Match', previous['etag'])
+            if previous.get('modified'):
+                request.add_header('If-Modified-Since', previous['modified'])
+        return request
+
+    @staticmethod
+    def _download_image(request, cancelled=None):
+        """ Download an image in a temporary file, run in the threads of
+        :meth:`_first_image` so it does not use the environment
+
+        :param cancelled: ``threading.Event`` set when the image is no
+                          longer needed, the download is then skipped
+                          or stopped
+        :return: dict with the ``url``, ``etag``, ``modified`` date,
+                 ``hash`` and ``file`` of the image, ``None`` when the
+                 image is missing or the download cancelled,
+                 ``{'not_modified': True}`` for a conditional request
+                 of an unchanged image, or the exception raised by the
+                 download
+        """
+        if cancelled is not None and cancelled.is_set():
+            return
+        image_file = None
         try:
-            request = urllib2.Request(url)
-            if self.backend_record.auth_basic_username \
-                    and self.backend_record.auth_basic_password:
-                base64string = base64.encodestring(
-                    '%s:%s' % (self.backend_record.auth_basic_username,
-                               self.backend_record.auth_basic_password))
-                request.add_header("Authorization", "Basic %s" % base64string)
-            binary = urllib2.urlopen(request)
-        except urllib2.HTTPError as err:
-            if err.code == 404:
-                # the image is just missing, we skip it
-                return
-            else:
-                # we don't know why we couldn't download the image
-                # so we propagate the error, the import will fail
-                # and we have to check why it couldn't be accessed
-                raise
-        else:
-            return binary.read()
+            response = urllib2.urlopen(request,
+                                       timeout=IMAGE_DOWNLOAD_TIMEOUT)
+            image_file = tempfile.TemporaryFile()
+            digest = hashlib.sha256()
+            while True:
+                if cancelled is not None and cancelled.is_set():
+                    image_file.close()
+                    return
+                chunk = response.read(IMAGE_DOWNLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                digest.update(chunk)
+                image_file.write(chunk)
+        except Exception as err:
+            if image_file is not None:
+                image_file.close()
+            if isinstance(err, urllib2.HTTPError):
+                if err.code == 304:
+                    return {'not_modified': True}
+                elif err.code == 404:
+                    # the image is just missing, we skip it
+                    return
+            # we don't know why we couldn't download the image
+            # so we propagate the error, the import will fail
+            # and we have to check why it couldn't be accessed
+            return err
+        if not image_file.tell():
+            image_file.close()
+            return
+        image_file.seek(0)
+        headers = response.headers
+        return {'url': request.get_full_url(),
+                'etag': headers.get('ETag'),
+                'modified': headers.get('Last-Modified'),
+                'hash': digest.hexdigest(),
+                'file': image_file,
+                }
+
+    @staticmethod
+    def _close_image(result):
+        """ Close the file of a result of :meth:`_download_image` """
+        if isinstance(result, dict) and 'file' in result:
+            result['file'].close()
+
+    def _first_image(self, images, previous):
+        """ Download the images and return the one with the highest
+        priority available (see :meth:`_download_image`)
+
+        Up to ``IMAGE_DOWNLOAD_WORKERS`` images are downloaded at the
+        same time. Once an image with a higher priority is available,
+        the downloads of the others are stopped, or skipped when not
+        started yet.
+        """
+        requests = [self._image_request(image_data, previous)
+                    for image_data in reversed(images)]
+        if len(requests) <= 1:
+            found = requests and self._download_image(requests[0]) or None
+            if isinstance(found, Exception):
+                raise found
+            return found
+        cancelled = threading.Event()
+
+        def discard(result):
+            # run by the pool when a download ends: after the
+            # cancellation, nobody will read the result anymore
+            if cancelled.is_set():
+                self._close_image(result)
+
+        pool = ThreadPool(min(IMAGE_DOWNLOAD_WORKERS, len(requests)))
+        downloads = [pool.apply_async(self._download_image,
+                                      (request, cancelled),
+                                      callback=discard)
+                     for request in requests]
+        found = None
+        try:
+            for download in downloads:
+                found = download.get()
+                if found is not None:
+                    break
+        finally:
+            cancelled.set()
+            # the callback of a ready download has already run, the
+            # others will be discarded by their callback
+            for download in downloads:
+                if download.ready() and download.get() is not found:
+                    self._close_image(download.get())
+            pool.close()
+        if isinstance(found, Exception):
+            raise found
+        return found
 
     def run(self, magento_id, binding_id):
         self.magento_id = magento_id
         images = self._get_images()
         images = self._sort_images(images)
-        binary = None
-        while not binary and images:
-            binary = self._get_binary_image(images.pop())
-        if not binary:
+        if not images:
+            return
+        binding = self.session.browse(self.model._name, binding_id)
+        previous = {}
+        if binding.image_sync_data:
+            previous = json.loads(binding.image_sync_data)
+        image = self._first_image(images, previous)
+        if image is None or image.get('not_modified'):
             return
+        image_file = image.pop('file')
+        try:
+            values = {'image_sync_data': json.dumps(image)}
+            if image['hash'] == previous.get('hash'):
+                # same image behind a new URL or new headers
+                if image == previous:
+                    return
+            else:
+                values['image'] = base64.b64encode(image_file.read())
+        finally:
+            image_file.close()
         with self.session.change_context({'connector_no_export': True}):
-            self.session.write(self.model._name,
-                               binding_id,
-                               {'image': base64.b64encode(binary)})
+            try:
+                if 'image' in values:
+                    values['image_attachment_id'] = self.model._store_image(
+                        self.session.cr, self.session.uid, values['image'],
+                        context=self.session.context)
+                self.session.write(self.model._name, binding_id, values)
+            except psycopg2.IntegrityError as err:
+                # the image has been stored, or deleted from the store
+                # by the cleanup, in a concurrent transaction
+                if err.pgcode not in (
+                        psycopg2.errorcodes.UNIQUE_VIOLATION,
+                        psycopg2.errorcodes.FOREIGN_KEY_VIOLATION):
+                    raise
+                raise RetryableJobError(
+                    'The image %s has been changed in the store by a '
+                    'concurrent transaction. The job will be retried '
+                    'later.' % image['url'])
 
 
 @magento
@@ -479,6 +890,9 @@ class BundleImporter(ImportSynchronizer):
 @magento
 class ProductImport(MagentoImportSynchronizer):
     _model_name = ['magento.product.product']
+    # '_bundle_data' is not an attribute but the data of the bundles
+    _magento_attributes = ['updated_at', 'type_id', 'categories',
+                           '_bundle_data']
 
     @property
     def mapper(self):
@@ -572,6 +986,7 @@ class ProductImport(MagentoImportSynchronizer):
 @magento
 class IsActiveProductImportMapper(ImportMapper):
     _model_name = 'magento.product.product'
+    _magento_attributes = ['status']
 
     @mapping
     def is_active(self, record):
@@ -584,6 +999,7 @@ class IsActiveProductImportMapper(ImportMapper):
 @magento
 class BundleProductImportMapper(ImportMapper):
     _model_name = 'magento.product.product'
+    _magento_attributes = []
 
 
 @magento
@@ -602,6 +1018,14 @@ class ProductImportMapper(ImportMapper):
               ('visibility', 'visibility'),
               ('status', 'status')
               ]
+    # attributes read by ``direct`` and the mappings
+    _magento_attributes = ['name', 'description', 'weight', 'cost',
+                           'short_description', 'sku', 'type_id',
+                           'created_at', 'updated_at', 'visibility',
+                           'status', 'price', 'websites', 'categories',
+                           'product_id']
+    _magento_sub_mappers = [IsActiveProductImportMapper,
+                            BundleProductImportMapper]
 
     @mapping
     def is_active(self, record):
@@ -623,12 +1047,10 @@ class ProductImportMapper(ImportMapper):
 
     @mapping
     def website_ids(self, record):
-        website_ids = []
         binder = self.get_binder_for_model('magento.website')
-        for mag_website_id in record['websites']:
-            website_id = binder.to_openerp(mag_website_id)
-            website_ids.append((4, website_id))
-        return {'website_ids': website_ids}
+        website_ids = binder.to_openerp_many(record['websites'])
+        return {'website_ids': [(4, website_ids.get(mag_website_id))
+                                for mag_website_id in record['websites']]}
 
     @mapping
     def categories(self, record):
@@ -638,8 +1060,9 @@ class ProductImportMapper(ImportMapper):
         category_ids = []
         main_categ_id = None
 
+        categ_ids = binder.to_openerp_many(mag_categories, unwrap=True)
         for mag_category_id in mag_categories:
-            cat_id = binder.to_openerp(mag_category_id, unwrap=True)
+            cat_id = categ_ids.get(mag_category_id)
             if cat_id is None:
                 raise MappingError("The product category with "
                                    "magento id %s is not imported." %
@@ -716,6 +1139,35 @@ class ProductInventoryExport(ExportSynchronizer):
         data = self._get_data(product, fields)
         self.backend_adapter.update_inventory(magento_id, data)
 
+    def run_many(self, binding_ids, fields):
+        """ Export the inventory of several products to Magento in
+        ``multiCall`` requests, a failing product is exported in its
+        own job """
+        binder = self.get_binder_for_model()
+        products = []
+        records = []
+        for product in self.session.browse(self.model._name, binding_ids):
+            magento_id = binder.to_backend(product.id)
+            if not magento_id:
+                continue
+            products.append(product)
+            records.append((magento_id, self._get_data(product, fields)))
+        if not records:
+            return _('No product to export.')
+        responses = self.backend_adapter.update_inventory_many(records)
+        failed = 0
+        for product, response in zip(products, responses):
+            if isinstance(response, Exception):
+                failed += 1
+                delay_export_product_inventory(self.session,
+                                               self.model._name,
+                                               product.id,
+                                               fields=fields,
+                                               priority=20)
+        return (_('Inventory of %d products exported, %d failed and '
+                  'delayed in their own job.') %
+                (len(records) - failed, failed))
+
 
 # fields which should not trigger an export of the products
 # but an export of their inventory
@@ -733,17 +1185,64 @@ def magento_product_modified(session, model_name, record_id, vals):
         return
     inventory_fields = list(set(vals).intersection(INVENTORY_FIELDS))
     if inventory_fields:
-        export_product_inventory.delay(session, model_name,
-                                       record_id, fields=inventory_fields,
+        delay_export_product_inventory(session, model_name, record_id,
+                                       fields=inventory_fields,
                                        priority=20)
 
 
 @job
 @related_action(action=unwrap_binding)
 def export_product_inventory(session, model_name, record_id, fields=None):
-    """ Export the inventory configuration and quantity of a product. """
+    """ Export the inventory configuration and quantity of a product.
+
+    The values are read when the job is executed, so the last quantity
+    is exported whatever the number of writes since the job has been
+    delayed.
+    """
     product = session.browse(model_name, record_id)
     backend_id = product.backend_id.id
     env = get_environment(session, model_name, backend_id)
     inventory_exporter = env.get_connector_unit(ProductInventoryExport)
     return inventory_exporter.run(record_id, fields)
+
+
+def inventory_identity_key(model_name, binding_id):
+    """ Identity key of the :func:`export_product_inventory` jobs """
+    return 'export_product_inventory:%s,%s' % (model_name, binding_id)
+
+
+def _merge_inventory_kwargs(waiting_kwargs, kwargs):
+    """ Merge the inventory fields to export """
+    fields = waiting_kwargs.get('fields') or []
+    waiting_kwargs['fields'] = fields + [
+        field for field in kwargs.get('fields') or [] if field not in fields]
+    return waiting_kwargs
+
+
+def delay_export_product_inventory(session, model_name, binding_id,
+                                   **kwargs):
+    """ Delay an :func:`export_product_inventory` job, unless an export
+    of the inventory of the same product is waiting to be run.
+
+    The waiting job reads the quantity when it is executed, so it
+    exports the last quantity, its fields are merged with the new ones.
+    The started jobs are not considered, they may have read the
+    quantity before the last write.
+
+    :return: tuple with the UUID of the job and True if a new job has
+             been delayed
+    """
+    return delay_unique(session, export_product_inventory,
+                        inventory_identity_key(model_name, binding_id),
+                        (model_name, binding_id),
+                        kwargs, merge=_merge_inventory_kwargs,
+                        states=(PENDING, ENQUEUED))
+
+
+@job
+def export_product_inventory_batch(session, model_name, backend_id,
+                                   binding_ids, fields=None):
+    """ Export the inventory of several products of a backend. """
+    env = get_environment(session, model_name, backend_id)
+    inventory_exporter = env.get_connector_unit(ProductInventoryExport)
+    return inventory_exporter.run_many(binding_ids, fields)
@@ -20,14 +20,11 @@
 ##############################################################################
 
 import logging
-import xmlrpclib
 from openerp.osv import orm, fields
 from openerp.addons.connector.unit.mapper import (mapping,
                                                   ImportMapper
                                                   )
-from openerp.addons.connector.exception import (IDMissingInBackend,
-                                                MappingError,
-                                                )
+from openerp.addons.connector.exception import MappingError
 from .unit.backend_adapter import (GenericAdapter,
                                    MAGENTO_DATETIME_FORMAT,
                                    )
@@ -113,16 +110,8 @@ class ProductCategoryAdapter(GenericAdapter):
     _magento_model = 'catalog_category'
     _admin_path = '/{model}/index/'
 
-    def _call(self, method, arguments):
-        try:
-            return super(ProductCategoryAdapter, self)._call(method, arguments)
-        except xmlrpclib.Fault as err:
-            # 101 is the error in the Magento API
-            # when the category does not exist
-            if err.faultCode == 102:
-                raise IDMissingInBackend
-            else:
-                raise
+    # error in the Magento API when the category does not exist
+    _id_missing_fault_codes = (102,)
 
     def create(self, data):
         return self._call('%s.create'% self._magento_model,
@@ -197,7 +186,7 @@ class ProductCategoryBatchImport(DelayedBatchImport):
 
     def _import_record(self, magento_id, priority=None):
         """ Delay a job for the import """
-        super(ProductCategoryBatchImport, self)._import_record(
+        return super(ProductCategoryBatchImport, self)._import_record(
             magento_id, priority=priority)
 
     def run(self, filters=None):
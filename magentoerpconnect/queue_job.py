@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+##############################################################################
+#
+#    Author: Guewen Baconnier
+#    Copyright 2014 Camptocamp SA
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Affero General Public License as
+#    published by the Free Software Foundation, either version 3 of the
+#    License, or (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Affero General Public License for more details.
+#
+#    You should have received a copy of the GNU Affero General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+##############################################################################
+
+"""
+Identity keys on the jobs.
+
+A job delayed with :func:`delay_unique` carries an identity key. When
+an equivalent job (same key) is already waiting, no new job is created:
+the new arguments are merged into the waiting job or dropped.
+
+A job working on several records carries a key per record in
+``queue.job.record.key`` (see :func:`set_record_keys`), so the records
+it handles are found with :func:`find_waiting_record_keys`.
+
+The waiting jobs created in other transactions and not yet committed are
+not visible, so in rare cases duplicates can still be created.
+"""
+
+import logging
+
+import psycopg2
+from psycopg2.errorcodes import LOCK_NOT_AVAILABLE, SERIALIZATION_FAILURE
+
+from openerp import SUPERUSER_ID
+from openerp.osv import orm, fields
+from openerp.addons.connector.queue.job import (OpenERPJobStorage,
+                                                PENDING,
+                                                ENQUEUED,
+                                                STARTED,
+                                                )
+
+_logger = logging.getLogger(__name__)
+
+# options of ``delay()`` which are not arguments of the job function
+JOB_OPTIONS = ('priority', 'eta', 'max_retries', 'description')
+
+WAITING_STATES = (PENDING, ENQUEUED, STARTED)
+
+
+class queue_job(orm.Model):
+    _inherit = 'queue.job'
+
+    _columns = {
+        'identity_key': fields.char('Identity Key', select=True,
+                                    readonly=True),
+        'record_key_ids': fields.one2many('queue.job.record.key', 'job_id',
+                                          string='Record Keys',
+                                          readonly=True),
+    }
+
+
+class queue_job_record_key(orm.Model):
+    """ Identity key of a record handled by a job working on several
+    records """
+    _name = 'queue.job.record.key'
+    _description = 'Identity Key of a Record of a Job'
+
+    _columns = {
+        'job_id': fields.many2one('queue.job', 'Job', required=True,
+                                  select=True, ondelete='cascade'),
+        'name': fields.char('Identity Key', required=True, select=True),
+    }
+
+
+def find_waiting_jobs(session, identity_keys, states=WAITING_STATES):
+    """ Return the waiting jobs (pending, enqueued or started by
+    default) having one of the ``identity_keys``
+
+    :return: list of dict with the ``uuid``, ``state`` and
+             ``identity_key`` of the jobs, the most recent first
+    """
+    if not identity_keys:
+        return []
+    job_model = session.pool['queue.job']
+    job_ids = job_model.search(session.cr, SUPERUSER_ID,
+                               [('identity_key', 'in', list(identity_keys)),
+                                ('state', 'in', list(states))],
+                               order='id desc',
+                               context=session.context)
+    if not job_ids:
+        return []
+    jobs = job_model.read(session.cr, SUPERUSER_ID, job_ids,
+                          ['uuid', 'state', 'identity_key'],
+                          context=session.context)
+    jobs.sort(key=lambda job: job_ids.index(job['id']))
+    return jobs
+
+
+def set_record_keys(session, job_uuid, identity_keys):
+    """ Store the identity keys of the records handled by a job """
+    job_model = session.pool['queue.job']
+    job_ids = job_model.search(session.cr, SUPERUSER_ID,
+                               [('uuid', '=', job_uuid)],
+                               context=session.context)
+    job_model.write(session.cr, SUPERUSER_ID, job_ids,
+                    {'record_key_ids': [(0, 0, {'name': key})
+                                        for key in identity_keys]},
+                    context=session.context)
+
+
+def find_waiting_record_keys(session, identity_keys,
+                             states=WAITING_STATES):
+    """ Return the ``identity_keys`` of the records handled by a
+    waiting job (pending, enqueued or started by default), see
+    :func:`set_record_keys`
+
+    :rtype: set
+    """
+    if not identity_keys:
+        return set()
+    key_model = session.pool['queue.job.record.key']
+    key_ids = key_model.search(session.cr, SUPERUSER_ID,
+                               [('name', 'in', list(identity_keys)),
+                                ('job_id.state', 'in', list(states))],
+                               context=session.context)
+    if not key_ids:
+        return set()
+    keys = key_model.read(session.cr, SUPERUSER_ID, key_ids, ['name'],
+                          context=session.context)
+    return set(key['name'] for key in keys)
+
+
+def _store_pending_job(session, storage, job):
+    """ Store a job only if it is still pending
+
+    The row of the job is locked first and must still be pending: a
+    job enqueued or started by a worker meanwhile, or modified since
+    the start of the transaction, is not modified.
+
+    :return: True if the job has been stored
+    """
+    cr = session.cr
+    cr.execute('SAVEPOINT store_pending_job')
+    try:
+        cr.execute("SELECT id FROM queue_job "
+                   "WHERE uuid = %s AND state = %s FOR UPDATE NOWAIT",
+                   (job.uuid, PENDING))
+        pending = bool(cr.fetchone())
+        if pending:
+            storage.store(job)
+    except psycopg2.Error as err:
+        if err.pgcode not in (LOCK_NOT_AVAILABLE, SERIALIZATION_FAILURE):
+            raise
+        cr.execute('ROLLBACK TO SAVEPOINT store_pending_job')
+        return False
+    cr.execute('RELEASE SAVEPOINT store_pending_job')
+    return pending
+
+
+def delay_unique(session, job_func, identity_key, args, kwargs=None,
+                 merge=None, states=WAITING_STATES):
+    """ Delay a job unless an equivalent job is already waiting
+
+    The waiting jobs with the same ``identity_key`` and in one of the
+    ``states`` are considered, the most recent first:
+
+    * when the arguments of the waiting job already include the new
+      ones, nothing is delayed
+    * when the waiting job is still pending, the new arguments are
+      merged into it, and its ``eta`` is postponed to the new ``eta``
+      if one is given; when it has been enqueued meanwhile, a new job
+      is delayed (see :func:`_store_pending_job`)
+    * otherwise (the job is running), a new job is delayed
+
+    :param job_func: function decorated by ``@job``
+    :param identity_key: key identifying the equivalent jobs
+    :param args: positional arguments of the job, without the session
+    :param kwargs: keyword arguments of the job and options of
+                   ``delay()`` (``priority``, ``eta``, ...)
+    :param merge: function receiving the keyword arguments of the
+                  waiting job and the new ones, returning the merged
+                  keyword arguments. Without ``merge``, the arguments
+                  of the waiting job are kept as is.
+    :param states: states of the jobs considered as waiting
+    :return: tuple with the UUID of the job and True if a new job has
+             been delayed
+    """
+    if kwargs is None:
+        kwargs = {}
+    job_kwargs = dict((key, value) for key, value in kwargs.iteritems()
+                      if key not in JOB_OPTIONS)
+    storage = OpenERPJobStorage(session)
+    for waiting in find_waiting_jobs(session, [identity_key],
+                                     states=states):
+        job = storage.load(waiting['uuid'])
+        if merge is None:
+            merged = job.kwargs
+        else:
+            merged = merge(dict(job.kwargs), job_kwargs)
+        eta = kwargs.get('eta')
+        if waiting['state'] == PENDING and (merged != job.kwargs or eta):
+            job.kwargs = merged
+            if eta:
+                job.eta = eta
+            if _store_pending_job(session, storage, job):
+                return job.uuid, False
+            # enqueued meanwhile, it may have read the former arguments
+            break
+        if merged == job.kwargs:
+            return job.uuid, False
+    job_uuid = job_func.delay(session, *args, **kwargs)
+    job_model = session.pool['queue.job']
+    job_ids = job_model.search(session.cr, SUPERUSER_ID,
+                               [('uuid', '=', job_uuid)],
+                               context=session.context)
+    job_model.write(session.cr, SUPERUSER_ID, job_ids,
+                    {'identity_key': identity_key},
+                    context=session.context)
+    return job_uuid, True
@@ -20,15 +20,13 @@
 ##############################################################################
 
 import logging
-import xmlrpclib
 from datetime import datetime, timedelta
 import openerp.addons.decimal_precision as dp
 from openerp.osv import fields, orm
 from openerp.tools.translate import _
 from openerp.addons.connector.connector import ConnectorUnit
 from openerp.addons.connector.exception import (NothingToDoJob,
-                                                FailedJobError,
-                                                IDMissingInBackend)
+                                                FailedJobError)
 from openerp.addons.connector.queue.job import job
 from openerp.addons.connector.unit.mapper import (mapping,
                                                   ImportMapper
@@ -280,16 +278,9 @@ class SaleOrderAdapter(GenericAdapter):
     _magento_model = 'sales_order'
     _admin_path = '{model}/view/order_id/{id}'
 
-    def _call(self, method, arguments):
-        try:
-            return super(SaleOrderAdapter, self)._call(method, arguments)
-        except xmlrpclib.Fault as err:
-            # this is the error in the Magento API
-            # when the sales order does not exist
-            if err.faultCode == 100:
-                raise IDMissingInBackend
-            else:
-                raise
+    # error in the Magento API when the sales order does not exist
+    _id_missing_fault_codes = (100,)
+    _cursor_field = 'entity_id'
 
     def search(self, filters=None, from_date=None, to_date=None,
                magento_storeview_ids=None):
@@ -310,8 +301,9 @@ class SaleOrderAdapter(GenericAdapter):
         if magento_storeview_ids is not None:
             filters['store_id'] = {'in': magento_storeview_ids}
 
+        # the pagination is done with ranges of ids
+        # (``search_pages``) rather than with a limit
         arguments = {'imported': False,
-                     # 'limit': 200,
                      'filters': filters,
                      }
         return super(SaleOrderAdapter, self).search(arguments)
@@ -346,15 +338,15 @@ class SaleOrderBatchImport(DelayedBatchImport):
         from_date = filters.pop('from_date', None)
         to_date = filters.pop('to_date', None)
         magento_storeview_ids = [filters.pop('magento_storeview_id')]
-        record_ids = self.backend_adapter.search(
+        pages = self.backend_adapter.search_pages(
             filters,
             from_date=from_date,
             to_date=to_date,
             magento_storeview_ids=magento_storeview_ids)
-        _logger.info('search for magento saleorders %s returned %s',
-                     filters, record_ids)
-        for record_id in record_ids:
-            self._import_record(record_id)
+        for record_ids in pages:
+            _logger.info('search for magento saleorders %s returned %s',
+                         filters, record_ids)
+            self._import_records(record_ids)
 
 
 @magento
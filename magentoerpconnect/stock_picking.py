@@ -27,7 +27,6 @@ from openerp.addons.connector.queue.job import job, related_action
 from openerp.addons.connector.event import on_record_create
 from openerp.addons.connector.exception import NothingToDoJob
 from openerp.addons.connector.unit.synchronizer import ExportSynchronizer
-from openerp.addons.connector.exception import IDMissingInBackend
 from openerp.addons.connector_ecommerce.event import on_picking_out_done
 from .unit.backend_adapter import GenericAdapter
 from .connector import get_environment
@@ -102,16 +101,8 @@ class StockPickingAdapter(GenericAdapter):
     _magento_model = 'sales_order_shipment'
     _admin_path = 'sales_shipment/view/shipment_id/{id}'
 
-    def _call(self, method, arguments):
-        try:
-            return super(StockPickingAdapter, self)._call(method, arguments)
-        except xmlrpclib.Fault as err:
-            # this is the error in the Magento API
-            # when the shipment does not exist
-            if err.faultCode == 100:
-                raise IDMissingInBackend
-            else:
-                raise
+    # error in the Magento API when the shipment does not exist
+    _id_missing_fault_codes = (100,)
 
     def create(self, order_id, items, comment, email, include_comment):
         """ Create a record on the external system """
@@ -25,6 +25,15 @@ import test_export_invoice
 import test_import_product_image
 import test_related_action
 import test_sale_order
+import test_backend_adapter
+import test_binder
+import test_batch_import
+import test_queue_job
+import test_mapper
+import test_batch_export
+import test_record_lock
+import test_inventory_export
+import test_binding_cache
 
 
 fast_suite = [
@@ -37,4 +46,13 @@ checks = [
     test_import_product_image,
     test_related_action,
     test_sale_order,
+    test_backend_adapter,
+    test_binder,
+    test_batch_import,
+    test_queue_job,
+    test_mapper,
+    test_batch_export,
+    test_record_lock,
+    test_inventory_export,
+    test_binding_cache,
 ]
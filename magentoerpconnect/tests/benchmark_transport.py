@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+##############################################################################
+#
+#    Author: Guewen Baconnier
+#    Copyright 2014 Camptocamp SA
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Affero General Public License as
+#    published by the Free Software Foundation, either version 3 of the
+#    License, or (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Affero General Public License for more details.
+#
+#    You should have received a copy of the GNU Affero General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+##############################################################################
+
+"""
+Benchmark of the keep-alive XML-RPC transport.
+
+Starts a local XML-RPC server standing in for the Magento API and
+sends the same calls with the default ``xmlrpclib`` transport and with
+the keep-alive transport, then prints the number of TCP connections
+opened and the time spent.
+
+As ``magento.API`` does, a new ``ServerProxy`` is created for each
+session, here a session is opened every 10 calls. It does not need
+OpenERP::
+
+    python benchmark_transport.py [number of calls] [number of threads]
+
+"""
+
+import imp
+import os
+import sys
+import threading
+import time
+import xmlrpclib
+from SimpleXMLRPCServer import SimpleXMLRPCServer, SimpleXMLRPCRequestHandler
+from SocketServer import ThreadingMixIn
+
+here = os.path.dirname(os.path.abspath(__file__))
+transport = imp.load_source('transport',
+                            os.path.join(here, '..', 'unit', 'transport.py'))
+
+
+class RequestHandler(SimpleXMLRPCRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    connections = 0
+
+    def setup(self):
+        RequestHandler.connections += 1
+        SimpleXMLRPCRequestHandler.setup(self)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class Server(ThreadingMixIn, SimpleXMLRPCServer):
+    daemon_threads = True
+
+
+def start_server():
+    server = Server(('127.0.0.1', 0), requestHandler=RequestHandler,
+                    logRequests=False, allow_none=True)
+
+    def call(session, method, arguments):
+        return {'session': session, 'method': method, 'arguments': arguments}
+
+    server.register_function(lambda user, password: 'session', 'login')
+    server.register_function(call, 'call')
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    return server
+
+
+def run(url, make_transport, calls, threads):
+    RequestHandler.connections = 0
+
+    def worker():
+        for index in xrange(calls // threads):
+            if not index % 10:
+                proxy = xmlrpclib.ServerProxy(url, allow_none=True,
+                                              transport=make_transport())
+                session = proxy.login('user', 'password')
+            proxy.call(session, 'catalog_product.info', [index])
+
+    start = time.time()
+    workers = [threading.Thread(target=worker) for __ in xrange(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return RequestHandler.connections, time.time() - start
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    server = start_server()
+    host, port = server.server_address
+    # basic auth credentials embedded in the location
+    url = 'http://user:secret@%s:%s/' % (host, port)
+
+    shared = transport.get_transport(url)
+    for name, make_transport in (
+            ('xmlrpclib.Transport (one per proxy)', xmlrpclib.Transport),
+            ('KeepAliveTransport (shared)', lambda: shared)):
+        connections, duration = run(url, make_transport, calls, threads)
+        print '%-40s %6d calls, %2d threads: %5d connections in %.2fs' % (
+            name, calls, threads, connections, duration)
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -24,8 +24,9 @@ Helpers usable in the tests
 """
 
 import mock
+import xmlrpclib
 from contextlib import contextmanager
-from ..unit.backend_adapter import call_to_key
+from ..unit.backend_adapter import call_to_key, api_pool
 
 
 class TestResponder(object):
@@ -61,6 +62,18 @@ class TestResponder(object):
         else:
             return self._responses[key]
 
+    def multi_call(self, calls):
+        """ Simulate a ``multiCall``, the faults are returned as
+        items of the result """
+        results = []
+        for method, arguments in calls:
+            try:
+                results.append(self(method, arguments))
+            except xmlrpclib.Fault as err:
+                results.append({'isFault': True,
+                                'faultCode': err.faultCode,
+                                'faultMessage': err.faultString})
+        return results
 
 
 @contextmanager
@@ -70,12 +83,18 @@ def mock_api(responses, key_func=None):
     :type responses: dict
     """
     get_magento_response = TestResponder(responses, key_func=key_func)
+    # the sessions kept in the pool would use the API of a previous mock
+    api_pool.clear()
     with mock.patch('magento.API') as API:
         api_mock = mock.MagicMock(name='magento.api')
         API.return_value = api_mock
         api_mock.__enter__.return_value = api_mock
         api_mock.call.side_effect = get_magento_response
-        yield get_magento_response._calls
+        api_mock.multiCall.side_effect = get_magento_response.multi_call
+        try:
+            yield get_magento_response._calls
+        finally:
+            api_pool.clear()
 
 
 class MockResponseImage(object):
@@ -85,8 +104,12 @@ class MockResponseImage(object):
         self.msg = msg
         self.headers = {'content-type': 'image/jpeg'}
 
-    def read(self):
-        return self.resp_data
+    def read(self, size=-1):
+        if size < 0:
+            size = len(self.resp_data)
+        data = self.resp_data[:size]
+        self.resp_data = self.resp_data[size:]
+        return data
 
     def getcode(self):
         return self.code
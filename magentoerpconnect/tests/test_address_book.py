@@ -114,9 +114,12 @@ class test_import_address_book(common.SingleTransactionCase):
 
     def test_12_individual_2_addresses(self):
         """ Import an individual (b2c) with 2 addresses """
-        with mock_api(individual_2_addresses):
+        with mock_api(individual_2_addresses) as calls:
             import_record(self.session, 'magento.res.partner',
                           self.backend_id, '9999255')
+        # the addresses are imported from the rows of the list
+        self.assertFalse([method for method, __ in calls
+                          if method == 'customer_address.info'])
         cr, uid = self.cr, self.uid
         partner_ids = self.model.search(cr, uid,
                                         [('magento_id', '=', '9999255'),
@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+##############################################################################
+#
+#    Author: Guewen Baconnier
+#    Copyright 2014 Camptocamp SA
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Affero General Public License as
+#    published by the Free Software Foundation, either version 3 of the
+#    License, or (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Affero General Public License for more details.
+#
+#    You should have received a copy of the GNU Affero General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+##############################################################################
+
+import xmlrpclib
+
+import mock
+import unittest2
+
+from openerp.addons.connector.exception import IDMissingInBackend
+from openerp.addons.magentoerpconnect.unit import backend_adapter
+from openerp.addons.magentoerpconnect.unit.backend_adapter import (
+    GenericAdapter,
+    MagentoAPIPool,
+    MagentoLocation,
+    SESSION_EXPIRED_FAULT,
+)
+from openerp.addons.magentoerpconnect.unit.transport import (
+    KeepAliveSafeTransport,
+    KeepAliveTransport,
+    get_transport,
+)
+from .common import mock_api
+
+
+class test_api_pool(unittest2.TestCase):
+    """ Test the pool of sessions on the Magento API """
+
+    def setUp(self):
+        super(test_api_pool, self).setUp()
+        self.location = MagentoLocation('http://anyurl', 'guewen', '42')
+        self.pool = MagentoAPIPool(max_size=2, idle_ttl=600)
+
+    def tearDown(self):
+        self.pool.clear()
+        super(test_api_pool, self).tearDown()
+
+    def test_reuse_session(self):
+        """ The session is logged in once for several calls """
+        with mock.patch('magento.API') as API:
+            api = API.return_value
+            api.__enter__.return_value = api
+            api.call.return_value = 'ok'
+            self.pool.call(self.location, 'sales_order.info', [1])
+            self.pool.call(self.location, 'sales_order.info', [2])
+        self.assertEquals(API.call_count, 1)
+        self.assertEquals(api.__enter__.call_count, 1)
+        self.assertEquals(api.call.call_count, 2)
+
+    def test_relogin_session_expired(self):
+        """ Login again when the session has expired """
+        expired = xmlrpclib.Fault(SESSION_EXPIRED_FAULT, 'Session expired')
+        with mock.patch('magento.API') as API:
+            api = API.return_value
+            api.__enter__.return_value = api
+            api.call.side_effect = [expired, 'ok']
+            result = self.pool.call(self.location, 'sales_order.info', [1])
+        self.assertEquals(result, 'ok')
+        self.assertEquals(api.__enter__.call_count, 2)
+
+    def test_session_per_location(self):
+        """ Sessions are not shared between locations """
+        other = MagentoLocation('http://otherurl', 'guewen', '42')
+        with mock.patch('magento.API') as API:
+            api = API.return_value
+            api.__enter__.return_value = api
+            self.pool.call(self.location, 'sales_order.info', [1])
+            self.pool.call(other, 'sales_order.info', [1])
+        self.assertEquals(API.call_count, 2)
+
+    def test_drop_session_on_network_error(self):
+        """ A session is not reused after a network error """
+        with mock.patch('magento.API') as API:
+            api = API.return_value
+            api.__enter__.return_value = api
+            api.call.side_effect = [IOError, 'ok']
+            with self.assertRaises(IOError):
+                self.pool.call(self.location, 'sales_order.info', [1])
+            self.pool.call(self.location, 'sales_order.info', [1])
+        self.assertEquals(API.call_count, 2)
+
+    def test_max_size(self):
+        """ The oldest idle sessions are closed above the max size """
+        locations = [MagentoLocation('http://url%d' % i, 'guewen', '42')
+                     for i in range(3)]
+        with mock.patch('magento.API') as API:
+            api = API.return_value
+            api.__enter__.return_value = api
+            for location in locations:
+                self.pool.call(location, 'sales_order.info', [1])
+            self.assertEquals(api.__exit__.call_count, 1)
+
+
+class test_keep_alive_transport(unittest2.TestCase):
+    """ Test the XML-RPC transport keeping the connections alive """
+
+    def test_get_transport(self):
+        """ A transport is shared per scheme """
+        http = get_transport('http://anyurl')
+        self.assertIsInstance(http, KeepAliveTransport)
+        self.assertIs(get_transport('http://otherurl'), http)
+        self.assertIsInstance(get_transport('https://anyurl'),
+                              KeepAliveSafeTransport)
+
+    def test_location_transport(self):
+        """ The location uses the shared transport unless one is given """
+        location = MagentoLocation('http://anyurl', 'guewen', '42')
+        self.assertIs(location.transport, get_transport('http://anyurl'))
+        transport = xmlrpclib.Transport()
+        location.transport = transport
+        self.assertIs(location.transport, transport)
+
+    def test_reuse_connection(self):
+        """ The connection to a host is reused between the requests """
+        transport = KeepAliveTransport()
+        first = transport.make_connection('anyurl')
+        other = transport.make_connection('otherurl')
+        self.assertIs(transport.make_connection('anyurl'), first)
+        self.assertIsNot(other, first)
+        transport.close()
+        self.assertIsNot(transport.make_connection('anyurl'), first)
+        transport.close_all()
+
+
+class test_multi_call(unittest2.TestCase):
+    """ Test the batching of calls in ``multiCall`` requests """
+
+    def setUp(self):
+        super(test_multi_call, self).setUp()
+        environment = mock.Mock(name='environment')
+        backend = environment.backend_record
+        backend.location = 'http://anyurl'
+        backend.username = 'guewen'
+        backend.password = '42'
+        backend.use_custom_api_path = False
+        backend.use_auth_basic = False
+
+        class OrderAdapter(GenericAdapter):
+            _model_name = 'magento.sale.order'
+            _magento_model = 'sales_order'
+            _id_missing_fault_codes = (100,)
+
+        self.adapter = OrderAdapter(environment)
+
+    def test_read_many(self):
+        """ Read several records in one request, map the faults """
+        def missing():
+            raise xmlrpclib.Fault(100, 'Requested order not exists.')
+
+        def error():
+            raise xmlrpclib.Fault(1, 'Internal Error.')
+
+        responses = {
+            ('sales_order.info', (1, )): {'increment_id': '100000001'},
+            ('sales_order.info', (2, )): missing,
+            ('sales_order.info', (3, )): error,
+        }
+        with mock_api(responses) as calls_done:
+            results = self.adapter.read_many([1, 2, 3])
+        self.assertEquals(len(calls_done), 3)
+        self.assertEquals(results[0], {'increment_id': '100000001'})
+        self.assertIsInstance(results[1], IDMissingInBackend)
+        self.assertIsInstance(results[2], xmlrpclib.Fault)
+        self.assertEquals(results[2].faultCode, 1)
+
+    def test_call_id_missing(self):
+        """ A single call raises IDMissingInBackend for missing records """
+        def missing():
+            raise xmlrpclib.Fault(100, 'Requested order not exists.')
+
+        with mock_api({('sales_order.info', (2, )): missing}):
+            with self.assertRaises(IDMissingInBackend):
+                self.adapter.read(2)
+
+    def test_chunks(self):
+        """ The calls are sent by chunks """
+        records = [(index, {'status': 'complete'}) for index in range(5)]
+        responses = dict((('sales_order.update',
+                           (index, frozenset([('status', 'complete')]))),
+                          True) for index in range(5))
+        pool = backend_adapter.api_pool
+        with mock.patch.object(backend_adapter, 'MULTI_CALL_CHUNK_SIZE', 2), \
+                mock.patch.object(pool, 'multi_call',
+                                  wraps=pool.multi_call) as multi_call:
+            with mock_api(responses):
+                results = self.adapter.write_many(records)
+        self.assertEquals(results, [True] * 5)
+        self.assertEquals(multi_call.call_count, 3)
+
+    def test_write_many_storeview(self):
+        """ The store view of an update is sent after its data """
+        records = [(1, {'status': 'complete'}, 2)]
+        responses = {('sales_order.update',
+                      (1, frozenset([('status', 'complete')]), 2)): True}
+        with mock_api(responses):
+            results = self.adapter.write_many(records)
+        self.assertEquals(results, [True])
+
+
+class test_paginate(unittest2.TestCase):
+    """ Test the searches by ranges of ids """
+
+    def setUp(self):
+        super(test_paginate, self).setUp()
+        environment = mock.Mock(name='environment')
+        environment.backend_record.use_auth_basic = False
+
+        class ProductAdapter(GenericAdapter):
+            _model_name = 'magento.product.product'
+            _magento_model = 'catalog_product'
+            _cursor_field = 'entity_id'
+
+        self.adapter = ProductAdapter(environment)
+        self.ids = range(1, 60) + [1000, 1001, 250000] + range(300000, 300100)
+
+    def _search(self, filters=None):
+        window = filters['entity_id']
+        return [id for id in self.ids
+                if window['from'] <= id <= window['to']]
+
+    def test_search_pages(self):
+        """ All the ids are returned once, by pages of limited size """
+        with mock.patch.object(self.adapter, 'search',
+                               side_effect=self._search) as search:
+            pages = list(self.adapter.search_pages({'type': 'simple'},
+                                                   page_size=20))
+        self.assertEquals([id for page in pages for id in page], self.ids)
+        self.assertEquals([len(page) for page in pages[:3]], [20, 20, 19])
+        # the windows grow on the gaps
+        self.assertLess(search.call_count, 20)
+        first_filters = search.call_args_list[0][0][0]
+        self.assertEquals(first_filters, {'type': 'simple',
+                                          'entity_id': {'from': 1,
+                                                        'to': 20}})
+
+    def test_search_pages_no_cursor(self):
+        """ Without cursor field, the search is done in one page """
+        self.adapter._cursor_field = None
+        with mock.patch.object(self.adapter, 'search',
+                               return_value=[1, 2]) as search:
+            pages = list(self.adapter.search_pages({'type': 'simple'}))
+        self.assertEquals(pages, [[1, 2]])
+        search.assert_called_once_with({'type': 'simple'})
+
+    def test_read_updated_at(self):
+        """ The update dates are read with one search, completed by reads """
+        self.adapter._list_id_field = 'product_id'
+        rows = [{'product_id': '1', 'updated_at': '2014-06-01 10:00:00'},
+                {'product_id': '2'}]
+        with mock.patch.object(self.adapter, 'search_read',
+                               return_value=rows) as search_read, \
+                mock.patch.object(self.adapter, 'read_many',
+                                  return_value=[
+                                      {'updated_at': '2014-06-02 10:00:00'},
+                                      IDMissingInBackend()]) as read_many:
+            updated_at = self.adapter.read_updated_at([1, 2, 3])
+        search_read.assert_called_once_with({'entity_id': {'in': [1, 2, 3]}})
+        read_many.assert_called_once_with(['2', '3'],
+                                          attributes=['updated_at'])
+        self.assertEquals(updated_at, {'1': '2014-06-01 10:00:00',
+                                       '2': '2014-06-02 10:00:00'})
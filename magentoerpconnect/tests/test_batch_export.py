@@ -0,0 +1,363 @@
+# -*- coding: utf-8 -*-
+##############################################################################
+#
+#    Author: Guewen Baconnier
+#    Copyright 2014 Camptocamp SA
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Affero General Public License as
+#    published by the Free Software Foundation, either version 3 of the
+#    License, or (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Affero General Public License for more details.
+#
+#    You should have received a copy of the GNU Affero General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+##############################################################################
+
+
+import json
+import xmlrpclib
+
+import mock
+import unittest2
+
+from openerp.addons.magentoerpconnect.unit import export_synchronizer
+
+
+class test_export_batch(unittest2.TestCase):
+    """ Test the export of several records in one job """
+
+    def _exporter(self, binding_id, magento_id, error=None):
+        """ Simulate an exporter """
+        exporter = mock.Mock(name='exporter %s' % binding_id)
+        exporter.binder.to_backend.return_value = magento_id
+
+        def export(binding_id, fields=None):
+            if error:
+                raise error
+            exporter.deferred_writes.append((magento_id, {'name': 'x'}))
+            return 'exported'
+        exporter._export.side_effect = export
+        exporter.backend_adapter = self.adapter
+        return exporter
+
+    def test_export_batch_group(self):
+        """ The updates are sent together, failures go in their own job """
+        self.adapter = mock.Mock(name='adapter')
+        self.adapter.write_many.return_value = [
+            True, xmlrpclib.Fault(1, 'boom')]
+        exporters = [self._exporter(1, None),
+                     self._exporter(2, '102'),
+                     self._exporter(3, '103', error=ValueError('invalid')),
+                     self._exporter(4, '104')]
+        env = mock.Mock(name='environment')
+        env.model_name = 'magento.product.product'
+        env.get_connector_unit.side_effect = exporters
+        planner = mock.Mock(name='planner')
+        planner.return_value.export.return_value = set()
+        with mock.patch.object(export_synchronizer, 'delay_export_record',
+                               return_value=('uuid', True)) as delay, \
+                mock.patch.object(export_synchronizer, 'ExportPlanner',
+                                  planner):
+            results = export_synchronizer._export_batch_group(
+                env, [1, 2, 3, 4], fields=['name'])
+        planner.return_value.add.assert_called_once_with(
+            'magento.product.product', [2, 3, 4])
+        self.adapter.write_many.assert_called_once_with(
+            [('102', {'name': 'x'}), ('104', {'name': 'x'})])
+        self.assertEquals([call[0][2] for call in delay.call_args_list],
+                          [1, 3, 4])
+        exporters[1].binder.bind.assert_called_once_with('102', 2)
+        self.assertFalse(exporters[3].binder.bind.called)
+        self.assertEquals(
+            [call[0][0] for call in env.session.cr.execute.call_args_list],
+            ['SAVEPOINT export_records_batch',
+             'RELEASE SAVEPOINT export_records_batch',
+             'SAVEPOINT export_records_batch',
+             'ROLLBACK TO SAVEPOINT export_records_batch',
+             'SAVEPOINT export_records_batch',
+             'RELEASE SAVEPOINT export_records_batch'])
+        self.assertEquals(len(results), 4)
+        exporters[1]._after_export.assert_called_once_with()
+
+    def test_failed_dependency(self):
+        """ The jobs are delayed after the rollback of a failed dependency """
+        self.adapter = mock.Mock(name='adapter')
+        self.adapter.write_many.return_value = [True]
+        exporters = [self._exporter(1, None),
+                     self._exporter(2, '102'),
+                     self._exporter(3, '103')]
+        env = mock.Mock(name='environment')
+        env.model_name = 'magento.product.product'
+        env.get_connector_unit.side_effect = exporters
+        events = []
+
+        def export():
+            # the planner rolls back the failed export of a dependency
+            env.session.rollback()
+            events.append('rollback')
+            return set([('magento.product.product', 2)])
+        planner = mock.Mock(name='planner')
+        planner.return_value.export.side_effect = export
+
+        def delay(session, model_name, binding_id, fields=None):
+            events.append(binding_id)
+            return 'uuid', True
+        with mock.patch.object(export_synchronizer, 'delay_export_record',
+                               side_effect=delay), \
+                mock.patch.object(export_synchronizer, 'ExportPlanner',
+                                  planner):
+            results = export_synchronizer._export_batch_group(
+                env, [1, 2, 3], fields=['name'])
+        self.assertEquals(events, ['rollback', 1, 2])
+        self.adapter.write_many.assert_called_once_with(
+            [('103', {'name': 'x'})])
+        exporters[2].binder.bind.assert_called_once_with('103', 3)
+        self.assertEquals(len(results), 3)
+
+    def test_recreated_record(self):
+        """ A record created again is bound with the group """
+        self.adapter = mock.Mock(name='adapter')
+        self.adapter.write_many.return_value = [True]
+        exporter = self._exporter(1, '101')
+
+        def export(binding_id, fields=None):
+            # missing on Magento, created again
+            exporter.magento_id = '201'
+            return 'created'
+        exporter._export.side_effect = export
+        env = mock.Mock(name='environment')
+        env.model_name = 'magento.product.product'
+        env.get_connector_unit.side_effect = [exporter]
+        planner = mock.Mock(name='planner')
+        planner.return_value.export.return_value = set()
+        with mock.patch.object(export_synchronizer, 'ExportPlanner',
+                               planner):
+            results = export_synchronizer._export_batch_group(env, [1])
+        exporter.binder.bind.assert_called_with('201', 1)
+        self.assertEquals(env.session.commit.call_count, 1)
+        self.assertEquals(results, ['1: created'])
+
+
+class test_export_planner(unittest2.TestCase):
+    """ Test the export of the dependencies in topological order """
+
+    def setUp(self):
+        super(test_export_planner, self).setUp()
+        self.session = mock.MagicMock(name='session')
+        # 2 products using 2 options of the same attribute
+        self.graph = {
+            ('product', 1): [('option', 10), ('option', 11)],
+            ('product', 2): [('option', 10)],
+            ('option', 10): [('attribute', 20)],
+            ('option', 11): [('attribute', 20)],
+            ('attribute', 20): [],
+        }
+        self.exported = []
+        self.errors = {}
+
+    def _planner(self, raise_errors=False):
+        planner = export_synchronizer.ExportPlanner(
+            self.session, 1, raise_errors=raise_errors)
+        planner._collect = lambda node: self.graph[node]
+
+        def get_exporter(binding_model):
+            exporter = mock.Mock(name='exporter %s' % binding_model)
+
+            def run(binding_id):
+                node = (binding_model, binding_id)
+                if node in self.errors:
+                    raise self.errors[node]
+                self.assertTrue(exporter.dependencies_exported)
+                self.exported.append(node)
+            exporter.run.side_effect = run
+            return exporter
+        planner._get_exporter = get_exporter
+        planner.add('product', [1, 2])
+        return planner
+
+    def test_export_once(self):
+        """ Each dependency is exported once, after its dependencies """
+        self.assertEquals(self._planner().export(), set())
+        self.assertEquals(self.exported, [('attribute', 20),
+                                          ('option', 10),
+                                          ('option', 11)])
+
+    def test_failed_dependency(self):
+        """ The records depending on a failed export are skipped """
+        self.errors[('option', 11)] = ValueError('invalid')
+        blocked = self._planner().export()
+        self.assertEquals(blocked, set([('product', 1)]))
+        self.assertEquals(self.exported, [('attribute', 20),
+                                          ('option', 10)])
+        self.session.rollback.assert_called_once_with()
+
+    def test_raise_errors(self):
+        """ The error is raised when the planner exports a single record """
+        self.errors[('attribute', 20)] = ValueError('invalid')
+        planner = self._planner(raise_errors=True)
+        self.assertRaises(ValueError, planner.export)
+
+    def test_cycle(self):
+        """ A cycle between the dependencies is an error """
+        self.graph[('attribute', 20)] = [('option', 11)]
+        planner = self._planner()
+        self.assertRaises(AssertionError, planner.export)
+
+    def test_former_hook(self):
+        """ An exporter overriding _export_dependencies still calls it """
+
+        class FormerExporter(export_synchronizer.MagentoExporter):
+            def _export_dependencies(self):
+                self.custom_dependencies = True
+
+        environment = mock.MagicMock(name='environment')
+        exporter = FormerExporter(environment)
+        exporter.binding_id = 1
+        exporter.binding_record = mock.Mock(name='binding')
+        exporter.magento_id = '42'
+        exporter.dependencies_exported = True
+        exporter._has_to_skip = mock.Mock(return_value=False)
+        exporter._lock = mock.Mock()
+        exporter._map_data = mock.Mock()
+        exporter._update_data = mock.Mock(return_value={})
+        exporter._run()
+        self.assertTrue(exporter.custom_dependencies)
+        base = export_synchronizer.MagentoExporter(environment)
+        self.assertFalse(base._overrides_export_dependencies())
+
+
+class test_prefetch_updated_at(unittest2.TestCase):
+    """ Test the prefetch of the update dates on Magento """
+
+    def test_prefetch(self):
+        """ The dates of the exported records are read in one request """
+        environment = mock.Mock(name='environment')
+        adapter = mock.Mock(name='adapter')
+        adapter.read_updated_at.return_value = {
+            '1': '2014-06-01 10:00:00', '2': '2014-06-02 10:00:00'}
+        cache = {}
+        prefetch = ['1', '2', '3']
+        exporters = []
+        for magento_id in (1, 2):
+            exporter = export_synchronizer.MagentoBaseExporter(environment)
+            exporter.magento_id = magento_id
+            exporter.updated_at_cache = cache
+            exporter.updated_at_prefetch = prefetch
+            exporters.append(exporter)
+        with mock.patch.object(export_synchronizer.MagentoBaseExporter,
+                               'backend_adapter', adapter, create=True):
+            self.assertEquals(exporters[0]._get_magento_updated_at(),
+                              '2014-06-01 10:00:00')
+            self.assertEquals(exporters[1]._get_magento_updated_at(),
+                              '2014-06-02 10:00:00')
+        adapter.read_updated_at.assert_called_once_with(['1', '2', '3'])
+        self.assertFalse(adapter.read.called)
+        self.assertEquals(prefetch, [])
+
+
+class test_export_hashes(unittest2.TestCase):
+    """ Test the values not sent again when unchanged """
+
+    def setUp(self):
+        super(test_export_hashes, self).setUp()
+        environment = mock.Mock(name='environment')
+        self.exporter = export_synchronizer.MagentoExporter(environment)
+        self.exporter.binding_record = mock.Mock(name='binding')
+        hashes = {'default': {
+            'name': export_synchronizer.value_hash(u'Ipod'),
+            'price': export_synchronizer.value_hash(10.0)}}
+        self.exporter.binding_record.export_hashes = json.dumps(hashes)
+        self.map_record = mock.Mock(name='map_record')
+
+    def test_update_changed_values(self):
+        """ Only the changed values are sent """
+        self.map_record.values.return_value = {'name': u'Ipod',
+                                               'price': 12.0}
+        data = self.exporter._update_data(self.map_record)
+        self.assertEquals(data, {'price': 12.0})
+        self.assertEquals(
+            self.exporter._new_hashes,
+            {'default': {'price': export_synchronizer.value_hash(12.0)}})
+
+    def test_update_nothing_changed(self):
+        """ Nothing is sent when no value changed """
+        self.map_record.values.return_value = {'name': u'Ipod',
+                                               'price': 10.0}
+        self.exporter._export_required_keys = ('name',)
+        self.assertEquals(self.exporter._update_data(self.map_record), {})
+
+    def test_required_keys(self):
+        """ The required keys are sent with the changed values """
+        self.map_record.values.return_value = {'name': u'Ipod',
+                                               'price': 12.0}
+        self.exporter._export_required_keys = ('name',)
+        self.assertEquals(self.exporter._update_data(self.map_record),
+                          {'name': u'Ipod', 'price': 12.0})
+
+    def test_storeview_scope(self):
+        """ The hashes are kept per store view """
+        self.map_record.values.return_value = {'name': u'Ipod'}
+        self.exporter._export_hash_scope = '2'
+        self.assertEquals(self.exporter._update_data(self.map_record),
+                          {'name': u'Ipod'})
+
+    def test_create(self):
+        """ All the values are sent on creation, the hashes are reset """
+        self.map_record.values.return_value = {'name': u'Ipod',
+                                               'price': 10.0}
+        data = self.exporter._create_data(self.map_record)
+        self.assertEquals(data, {'name': u'Ipod', 'price': 10.0})
+        self.assertTrue(self.exporter._reset_hashes)
+        self.assertEquals(sorted(self.exporter._new_hashes['default']),
+                          ['name', 'price'])
+
+
+class test_export_translations(unittest2.TestCase):
+    """ Test the export of the translations in the batch exports """
+
+    def test_deferred_storeview_writes(self):
+        """ The updates of the store views are deferred with the others """
+        environment = mock.MagicMock(name='environment')
+        exporter = export_synchronizer.MagentoTranslationExporter(
+            environment)
+        exporter.magento_id = '42'
+        exporter.deferred_writes = []
+        storeview = mock.Mock(name='storeview')
+        session = environment.session
+        session.search.return_value = [1]
+        session.browse.return_value = [storeview]
+        exporter._get_translatable_field = mock.Mock(return_value=['name'])
+        exporter._get_openerp_data = mock.Mock()
+        exporter._map_data = mock.Mock()
+        exporter._update_data = mock.Mock(return_value={'name': 'Name'})
+        binder = mock.Mock(name='binder')
+        binder.to_backend.return_value = 3
+        exporter.get_binder_for_model = mock.Mock(return_value=binder)
+        with mock.patch.object(export_synchronizer.MagentoExporter, '_run',
+                               return_value='exported'):
+            result = exporter._run(fields=['name'])
+        self.assertEquals(result, 'exported')
+        self.assertEquals(exporter.deferred_writes,
+                          [('42', {'name': 'Name'}, 3)])
+
+
+class test_delay_export_batch(unittest2.TestCase):
+    """ Test the jobs exporting the records by batches """
+
+    def test_chunks(self):
+        """ A job is delayed per chunk of records """
+        session = mock.Mock(name='session')
+        with mock.patch.object(export_synchronizer,
+                               'BATCH_EXPORT_JOB_SIZE', 2), \
+                mock.patch.object(export_synchronizer.export_records_batch,
+                                  'delay') as delay:
+            export_synchronizer.delay_export_records_batch(
+                session, 'magento.product.product', 1, [1, 2, 3])
+        self.assertEquals([call[0][3] for call in delay.call_args_list],
+                          [[1, 2], [3]])
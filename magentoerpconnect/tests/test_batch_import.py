@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+##############################################################################
+#
+#    Author: Guewen Baconnier
+#    Copyright 2014 Camptocamp SA
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Affero General Public License as
+#    published by the Free Software Foundation, either version 3 of the
+#    License, or (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Affero General Public License for more details.
+#
+#    You should have received a copy of the GNU Affero General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+##############################################################################
+
+import mock
+import unittest2
+
+from openerp.addons.magentoerpconnect.unit import import_synchronizer
+from openerp.addons.magentoerpconnect.unit.import_synchronizer import (
+    DelayedBatchImport,
+    import_record_chunk,
+)
+
+
+class test_import_chunks(unittest2.TestCase):
+    """ Test the import of the records by chunks """
+
+    def test_delay_chunks(self):
+        """ A job is delayed per chunk of records """
+        environment = mock.Mock(name='environment')
+        environment.model._name = 'magento.res.partner'
+        environment.backend_record.id = 1
+        importer = DelayedBatchImport(environment)
+        importer._chunk_size = 2
+        with mock.patch.object(import_synchronizer.import_record_chunk,
+                               'delay') as delay, \
+                mock.patch.object(import_synchronizer, 'find_waiting_jobs',
+                                  return_value=[]), \
+                mock.patch.object(import_synchronizer,
+                                  'find_waiting_record_keys',
+                                  return_value=set()), \
+                mock.patch.object(import_synchronizer,
+                                  'set_record_keys') as set_keys:
+            importer._import_records([1, 2, 3, 4, 5])
+        self.assertEquals(
+            [call[0][3] for call in delay.call_args_list],
+            [[1, 2], [3, 4], [5]])
+        self.assertEquals(
+            set_keys.call_args_list[2][0][2],
+            [import_synchronizer.import_identity_key(
+                'magento.res.partner', 1, 5)])
+
+    def test_skip_waiting_imports(self):
+        """ The records with a waiting import job are not delayed """
+        environment = mock.Mock(name='environment')
+        environment.model._name = 'magento.res.partner'
+        environment.backend_record.id = 1
+        importer = DelayedBatchImport(environment)
+        importer._chunk_size = 2
+        key = import_synchronizer.import_identity_key(
+            'magento.res.partner', 1, 2)
+        with mock.patch.object(import_synchronizer.import_record_chunk,
+                               'delay') as delay, \
+                mock.patch.object(import_synchronizer, 'find_waiting_jobs',
+                                  return_value=[{'identity_key': key}]), \
+                mock.patch.object(import_synchronizer,
+                                  'find_waiting_record_keys',
+                                  return_value=set()), \
+                mock.patch.object(import_synchronizer, 'set_record_keys'):
+            duplicates = importer._import_records([1, 2, 3, 4, 5])
+        self.assertEquals(duplicates, 1)
+        self.assertEquals(
+            [call[0][3] for call in delay.call_args_list],
+            [[1, 3], [4, 5]])
+
+    def test_skip_waiting_chunks(self):
+        """ The records in a waiting chunk job are not delayed """
+        environment = mock.Mock(name='environment')
+        environment.model._name = 'magento.res.partner'
+        environment.backend_record.id = 1
+        importer = DelayedBatchImport(environment)
+        importer._chunk_size = 2
+        keys = set(import_synchronizer.import_identity_key(
+            'magento.res.partner', 1, record_id) for record_id in (1, 2))
+        with mock.patch.object(import_synchronizer.import_record_chunk,
+                               'delay') as delay, \
+                mock.patch.object(import_synchronizer, 'find_waiting_jobs',
+                                  return_value=[]), \
+                mock.patch.object(import_synchronizer,
+                                  'find_waiting_record_keys',
+                                  return_value=keys), \
+                mock.patch.object(import_synchronizer, 'set_record_keys'):
+            duplicates = importer._import_records([1, 2, 3])
+        self.assertEquals(duplicates, 2)
+        self.assertEquals(
+            [call[0][3] for call in delay.call_args_list], [[3]])
+
+    def test_import_record_chunk(self):
+        """ A failed record is rolled back and delayed in its own job """
+        session = mock.Mock(name='session')
+        importer = mock.Mock(name='importer')
+        importer.run.side_effect = [None, ValueError('boom'),
+                                    'Already up-to-date.']
+        env = mock.Mock(name='environment')
+        env.get_connector_unit.return_value = importer
+        with mock.patch.object(import_synchronizer, 'get_environment',
+                               return_value=env), \
+                mock.patch.object(import_synchronizer,
+                                  'delay_import_record',
+                                  return_value=('uuid', True)) as delay:
+            result = import_record_chunk(session, 'magento.res.partner',
+                                         1, [1, 2, 3])
+        delay.assert_called_once_with(session, 'magento.res.partner',
+                                      1, 2, force=False)
+        self.assertEquals(
+            [call[0][0] for call in session.cr.execute.call_args_list],
+            ['SAVEPOINT import_record_chunk',
+             'RELEASE SAVEPOINT import_record_chunk',
+             'SAVEPOINT import_record_chunk',
+             'ROLLBACK TO SAVEPOINT import_record_chunk',
+             'SAVEPOINT import_record_chunk',
+             'RELEASE SAVEPOINT import_record_chunk'])
+        self.assertEquals(result.splitlines(),
+                          ['1: Imported',
+                           '2: failed (boom), retried in job uuid',
+                           '3: Already up-to-date.'])
+
+
+class test_skip_uptodate(unittest2.TestCase):
+    """ Test the filter of the up-to-date records before the jobs """
+
+    def test_skip_uptodate(self):
+        """ Only the records modified since their sync date are kept """
+        environment = mock.Mock(name='environment')
+        environment.model._name = 'magento.res.partner'
+        environment.model._table = 'magento_res_partner'
+        environment.backend_record.id = 1
+        cr = environment.session.cr
+        cr.fetchall.return_value = [('1', '2014-06-10 10:00:00'),
+                                    ('2', '2014-06-01 10:00:00'),
+                                    ('4', False)]
+        importer = DelayedBatchImport(environment)
+        record_ids = importer._skip_uptodate(
+            [(1, '2014-06-05 10:00:00'),  # synchronized since
+             (2, '2014-06-05 10:00:00'),  # modified since
+             (3, '2014-06-05 10:00:00'),  # not imported yet
+             (4, '2014-06-05 10:00:00'),  # never synchronized
+             (5, None)])
+        self.assertEquals(record_ids, [2, 3, 4, 5])
+        query, params = cr.execute.call_args[0]
+        self.assertIn('magento_res_partner', query)
+        self.assertEquals(params, (1, ('1', '2', '3', '4', '5')))
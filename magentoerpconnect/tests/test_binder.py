@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+##############################################################################
+#
+#    Author: Guewen Baconnier
+#    Copyright 2014 Camptocamp SA
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Affero General Public License as
+#    published by the Free Software Foundation, either version 3 of the
+#    License, or (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Affero General Public License for more details.
+#
+#    You should have received a copy of the GNU Affero General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+##############################################################################
+
+import mock
+import unittest2
+
+from openerp.addons.magentoerpconnect.unit.binder import (
+    BindingCache,
+    MagentoModelBinder,
+    binding_cache,
+)
+
+MODEL = 'magento.product.product'
+
+
+class test_binding_cache(unittest2.TestCase):
+    """ Test the cache of the bindings used by the binders """
+
+    def setUp(self):
+        super(test_binding_cache, self).setUp()
+        self.cache = BindingCache(max_size=10, ttl=300)
+        self.cache.set_binding('db', MODEL, 7, 1, '42', 12)
+
+    def test_find_binding(self):
+        """ Find a binding by Magento ID and by OpenERP ID """
+        cache = self.cache
+        self.assertEquals(cache.find_binding('db', MODEL, 1,
+                                             magento_id='42'), 7)
+        self.assertEquals(cache.find_binding('db', MODEL, 1,
+                                             openerp_id=12), 7)
+        self.assertEquals(cache.get_binding('db', MODEL, 7), (1, '42', 12))
+        # other backend, database or model
+        self.assertIsNone(cache.find_binding('db', MODEL, 2,
+                                             magento_id='42'))
+        self.assertIsNone(cache.find_binding('db2', MODEL, 1,
+                                             magento_id='42'))
+        self.assertIsNone(cache.find_binding('db', 'magento.sale.order', 1,
+                                             magento_id='42'))
+
+    def test_invalidate(self):
+        """ An invalidated binding is no longer found """
+        self.cache.invalidate('db', MODEL, [7])
+        self.assertIsNone(self.cache.find_binding('db', MODEL, 1,
+                                                  magento_id='42'))
+        self.assertIsNone(self.cache.get_binding('db', MODEL, 7))
+
+    def test_rebind(self):
+        """ A binding bound to another Magento ID is not found with the
+        former ID """
+        self.cache.set_binding('db', MODEL, 7, 1, '43', 12)
+        self.assertIsNone(self.cache.find_binding('db', MODEL, 1,
+                                                  magento_id='42'))
+        self.assertEquals(self.cache.find_binding('db', MODEL, 1,
+                                                  magento_id='43'), 7)
+
+    def test_lru(self):
+        """ The least recently used entries are evicted """
+        cache = BindingCache(max_size=2, ttl=300)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        self.assertEquals(cache.get('a'), 1)
+        self.assertIsNone(cache.get('b'))
+        self.assertEquals(cache.get('c'), 3)
+
+    def test_ttl(self):
+        """ The entries expire after the ttl """
+        with mock.patch('time.time') as now:
+            now.return_value = 10 ** 10
+            self.assertIsNone(self.cache.get_binding('db', MODEL, 7))
+
+
+class test_binder_many(unittest2.TestCase):
+    """ Test the lookups of several bindings at once """
+
+    def setUp(self):
+        super(test_binder_many, self).setUp()
+        binding_cache.clear()
+        environment = mock.Mock(name='environment')
+        environment.model._name = MODEL
+        environment.model._table = 'magento_product_product'
+        environment.model._columns = {'openerp_id': None}
+        environment.backend_record.id = 1
+        self.cr = environment.session.cr
+        self.cr.dbname = 'db'
+        # id, backend_id, magento_id, openerp_id, committed
+        self.cr.fetchall.return_value = [(7, 1, u'42', 12, True),
+                                         (8, 1, u'43', 13, True)]
+        self.binder = MagentoModelBinder(environment)
+
+    def tearDown(self):
+        binding_cache.clear()
+        super(test_binder_many, self).tearDown()
+
+    def test_to_openerp_many(self):
+        """ Bindings of several Magento IDs with one query """
+        result = self.binder.to_openerp_many([42, 43, 44])
+        self.assertEquals(result, {42: 7, 43: 8})
+        self.assertEquals(self.cr.execute.call_count, 1)
+        result = self.binder.to_openerp_many([42, 43], unwrap=True)
+        self.assertEquals(result, {42: 12, 43: 13})
+        # from the cache
+        self.assertEquals(self.cr.execute.call_count, 1)
+
+    def test_to_backend_many(self):
+        """ Magento IDs of several records with one query """
+        result = self.binder.to_backend_many([12, 13, 14], wrap=True)
+        self.assertEquals(result, {12: u'42', 13: u'43'})
+        self.assertEquals(self.binder.to_backend_many([7, 8]),
+                          {7: u'42', 8: u'43'})
+        self.assertEquals(self.cr.execute.call_count, 1)
+
+    def test_uncommitted(self):
+        """ The bindings of the current transaction are not cached """
+        self.cr.fetchall.return_value = [(7, 1, u'42', 12, False)]
+        self.assertEquals(self.binder.to_openerp(42), 7)
+        self.assertEquals(self.binder.to_openerp(42), 7)
+        self.assertEquals(self.cr.execute.call_count, 2)
+
+    def test_not_exported(self):
+        """ The bindings not exported yet are not cached """
+        self.cr.fetchall.return_value = [(7, 1, None, 12, True)]
+        self.assertFalse(self.binder.to_backend(7))
+        self.assertFalse(self.binder.to_backend(12, wrap=True))
+        self.assertEquals(self.cr.execute.call_count, 2)
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+##############################################################################
+#
+#    Author: Guewen Baconnier
+#    Copyright 2014 Camptocamp SA
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Affero General Public License as
+#    published by the Free Software Foundation, either version 3 of the
+#    License, or (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Affero General Public License for more details.
+#
+#    You should have received a copy of the GNU Affero General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+##############################################################################
+
+
+from openerp.addons.connector.connector import Binder
+from openerp.addons.connector.session import ConnectorSession
+from openerp.addons.magentoerpconnect.connector import get_environment
+from openerp.addons.magentoerpconnect.unit.binder import binding_cache
+import openerp.tests.common as common
+
+MODEL = 'magento.res.partner.category'
+
+
+class test_binding_cache_concurrency(common.TransactionCase):
+    """ Test the cache of the binders with concurrent transactions
+
+    The records are committed so they are seen by the other cursors,
+    they are deleted at the end of the test.
+    """
+
+    def setUp(self):
+        super(test_binding_cache_concurrency, self).setUp()
+        binding_cache.clear()
+        self.addCleanup(binding_cache.clear)
+        cr = self.registry.db.cursor()
+        try:
+            data_obj = self.registry('ir.model.data')
+            warehouse_id = data_obj.get_object_reference(
+                cr, self.uid, 'stock', 'warehouse0')[1]
+            self.backend_id = self.registry('magento.backend').create(
+                cr, self.uid,
+                {'name': 'Test Magento Binding Cache',
+                 'version': '1.7',
+                 'location': 'http://anyurl',
+                 'username': 'guewen',
+                 'warehouse_id': warehouse_id,
+                 'password': '42'})
+            self.binding_id = self.registry(MODEL).create(
+                cr, self.uid,
+                {'name': 'Test Binding Cache',
+                 'backend_id': self.backend_id})
+            cr.commit()
+        finally:
+            cr.close()
+        self.addCleanup(self._delete_records)
+
+    def _delete_records(self):
+        cr = self.registry.db.cursor()
+        try:
+            binding = self.registry(MODEL).browse(cr, self.uid,
+                                                  self.binding_id)
+            category_id = binding.openerp_id.id
+            self.registry(MODEL).unlink(cr, self.uid, [self.binding_id])
+            self.registry('res.partner.category').unlink(cr, self.uid,
+                                                         [category_id])
+            self.registry('magento.backend').unlink(cr, self.uid,
+                                                    [self.backend_id])
+            cr.commit()
+        finally:
+            cr.close()
+
+    def _binder(self, cr):
+        session = ConnectorSession(cr, self.uid)
+        env = get_environment(session, MODEL, self.backend_id)
+        return env.get_connector_unit(Binder)
+
+    def test_bound_by_another_transaction(self):
+        """ A binding exported by another transaction is not kept
+        unexported in the cache """
+        cr1 = self.registry.db.cursor()
+        cr2 = self.registry.db.cursor()
+        try:
+            binder1 = self._binder(cr1)
+            self.assertFalse(binder1.to_backend(self.binding_id))
+            binder2 = self._binder(cr2)
+            binder2.bind('1001', self.binding_id)
+            cr2.commit()
+            # the snapshot of the first transaction predates the commit
+            self.assertFalse(binder1.to_backend(self.binding_id))
+            cr1.rollback()
+            # a new transaction sees the binding exported
+            self.assertEquals(binder1.to_backend(self.binding_id), '1001')
+            self.assertEquals(binder1.to_openerp('1001'), self.binding_id)
+        finally:
+            cr1.close()
+            cr2.close()
@@ -36,6 +36,18 @@ import time
 
 FMT = "%Y-%m-%d %H:%M:%S"
 
+# attributes read by the import of the products and of their
+# translations, declared on ``ProductImportMapper``
+PRODUCT_ATTRIBUTES = ('_bundle_data', 'categories', 'cost', 'created_at',
+                      'description', 'name', 'price', 'product_id',
+                      'short_description', 'sku', 'status', 'type_id',
+                      'updated_at', 'visibility', 'websites', 'weight')
+PRODUCT_TRANSLATION_ATTRIBUTES = ('categories', 'cost', 'created_at',
+                                  'description', 'name', 'price',
+                                  'product_id', 'short_description', 'sku',
+                                  'status', 'type_id', 'updated_at',
+                                  'visibility', 'websites', 'weight')
+
 
 magento_base_responses = \
     {('catalog_category.info', (1, )): {'all_children': '1,3,10,22,23,13,12,25,26,15,27,28,29,30,31,32,33,34,8,18,19,4,5,16,17',
@@ -3054,7 +3066,7 @@ magento_base_responses = \
                                                   'name': 'Root',
                                                   'parent_id': '0',
                                                   'position': '1'},
-        ('ol_catalog_product.info', (16, None, None, 'id')): {'activation_information': 'Conditional $250 Equipment Discount Included: Your price paid includes an equipment discount of $250 that has been provided to you in exchange for either activating a new, non-substitute line of service or renewing an existing line of service with AT&T and your agreement that for the 181-day period following such activation or renewal you will: (1) pay your balance due to AT&T each month and otherwise maintain your account in good standing; (2) not disconnect this AT&T line of service; (3) not transfer this equipment to another AT&T line of service; (4) not change your AT&T service rate plan to a lower monthly service rate--this includes canceling or removing required PDA, BlackBerry, or smartphone features after your product has shipped; (5) not use this line of service to replace an existing account with AT&T. If these conditions are not met, you hereby authorize Magento to charge your credit card $250 as reimbursement of this equipment discount without need for further approval.',
+        ('ol_catalog_product.info', (16, None, PRODUCT_ATTRIBUTES, 'id')): {'activation_information': 'Conditional $250 Equipment Discount Included: Your price paid includes an equipment discount of $250 that has been provided to you in exchange for either activating a new, non-substitute line of service or renewing an existing line of service with AT&T and your agreement that for the 181-day period following such activation or renewal you will: (1) pay your balance due to AT&T each month and otherwise maintain your account in good standing; (2) not disconnect this AT&T line of service; (3) not transfer this equipment to another AT&T line of service; (4) not change your AT&T service rate plan to a lower monthly service rate--this includes canceling or removing required PDA, BlackBerry, or smartphone features after your product has shipped; (5) not use this line of service to replace an existing account with AT&T. If these conditions are not met, you hereby authorize Magento to charge your credit card $250 as reimbursement of this equipment discount without need for further approval.',
                                                            'categories': ['8'],
                                                            'color': '24',
                                                            'cost': '20.0000',
@@ -3111,7 +3123,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '3.2000'},
-        ('ol_catalog_product.info', (16, u'2', None, 'id')): {'activation_information': 'Conditional $250 Equipment Discount Included: Your price paid includes an equipment discount of $250 that has been provided to you in exchange for either activating a new, non-substitute line of service or renewing an existing line of service with AT&T and your agreement that for the 181-day period following such activation or renewal you will: (1) pay your balance due to AT&T each month and otherwise maintain your account in good standing; (2) not disconnect this AT&T line of service; (3) not transfer this equipment to another AT&T line of service; (4) not change your AT&T service rate plan to a lower monthly service rate--this includes canceling or removing required PDA, BlackBerry, or smartphone features after your product has shipped; (5) not use this line of service to replace an existing account with AT&T. If these conditions are not met, you hereby authorize Magento to charge your credit card $250 as reimbursement of this equipment discount without need for further approval.',
+        ('ol_catalog_product.info', (16, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'activation_information': 'Conditional $250 Equipment Discount Included: Your price paid includes an equipment discount of $250 that has been provided to you in exchange for either activating a new, non-substitute line of service or renewing an existing line of service with AT&T and your agreement that for the 181-day period following such activation or renewal you will: (1) pay your balance due to AT&T each month and otherwise maintain your account in good standing; (2) not disconnect this AT&T line of service; (3) not transfer this equipment to another AT&T line of service; (4) not change your AT&T service rate plan to a lower monthly service rate--this includes canceling or removing required PDA, BlackBerry, or smartphone features after your product has shipped; (5) not use this line of service to replace an existing account with AT&T. If these conditions are not met, you hereby authorize Magento to charge your credit card $250 as reimbursement of this equipment discount without need for further approval.',
                                                            'categories': ['8'],
                                                            'color': '24',
                                                            'cost': '20.0000',
@@ -3168,7 +3180,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '3.2000'},
-        ('ol_catalog_product.info', (16, u'3', None, 'id')): {'activation_information': 'Conditional $250 Equipment Discount Included: Your price paid includes an equipment discount of $250 that has been provided to you in exchange for either activating a new, non-substitute line of service or renewing an existing line of service with AT&T and your agreement that for the 181-day period following such activation or renewal you will: (1) pay your balance due to AT&T each month and otherwise maintain your account in good standing; (2) not disconnect this AT&T line of service; (3) not transfer this equipment to another AT&T line of service; (4) not change your AT&T service rate plan to a lower monthly service rate--this includes canceling or removing required PDA, BlackBerry, or smartphone features after your product has shipped; (5) not use this line of service to replace an existing account with AT&T. If these conditions are not met, you hereby authorize Magento to charge your credit card $250 as reimbursement of this equipment discount without need for further approval.',
+        ('ol_catalog_product.info', (16, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'activation_information': 'Conditional $250 Equipment Discount Included: Your price paid includes an equipment discount of $250 that has been provided to you in exchange for either activating a new, non-substitute line of service or renewing an existing line of service with AT&T and your agreement that for the 181-day period following such activation or renewal you will: (1) pay your balance due to AT&T each month and otherwise maintain your account in good standing; (2) not disconnect this AT&T line of service; (3) not transfer this equipment to another AT&T line of service; (4) not change your AT&T service rate plan to a lower monthly service rate--this includes canceling or removing required PDA, BlackBerry, or smartphone features after your product has shipped; (5) not use this line of service to replace an existing account with AT&T. If these conditions are not met, you hereby authorize Magento to charge your credit card $250 as reimbursement of this equipment discount without need for further approval.',
                                                            'categories': ['8'],
                                                            'color': '24',
                                                            'cost': '20.0000',
@@ -3225,7 +3237,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '3.2000'},
-        ('ol_catalog_product.info', (17, None, None, 'id')): {'activation_information': 'CONDITIONAL $250 Equipment Discount Included: Your price paid includes an Equipment Discount of $250 that has been provided to you in exchange for activating a new, non-substitute line of service with T-Mobile and your agreement that for the 181-day period following such activation you will (1) pay your balance due to T-Mobile each month and otherwise maintain your account in good standing, (2) not disconnect this T-Mobile line of service, (3) not transfer this equipment to another T-Mobile line of service, (4) not change your T-Mobile service rate plan to a lower monthly service rate--this includes canceling or removing required PDA, BlackBerry, or smartphone features after your product has shipped, (5) not use this line of service to replace an existing account with T-Mobile. If these conditions are not met, you hereby authorize Magento.com to charge your credit card $250 as reimbursement of this Equipment Discount without need for further approval.',
+        ('ol_catalog_product.info', (17, None, PRODUCT_ATTRIBUTES, 'id')): {'activation_information': 'CONDITIONAL $250 Equipment Discount Included: Your price paid includes an Equipment Discount of $250 that has been provided to you in exchange for activating a new, non-substitute line of service with T-Mobile and your agreement that for the 181-day period following such activation you will (1) pay your balance due to T-Mobile each month and otherwise maintain your account in good standing, (2) not disconnect this T-Mobile line of service, (3) not transfer this equipment to another T-Mobile line of service, (4) not change your T-Mobile service rate plan to a lower monthly service rate--this includes canceling or removing required PDA, BlackBerry, or smartphone features after your product has shipped, (5) not use this line of service to replace an existing account with T-Mobile. If these conditions are not met, you hereby authorize Magento.com to charge your credit card $250 as reimbursement of this Equipment Discount without need for further approval.',
                                                            'categories': ['8'],
                                                            'color': '23',
                                                            'cost': '29.9900',
@@ -3282,7 +3294,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '15.2000'},
-        ('ol_catalog_product.info', (17, u'2', None, 'id')): {'activation_information': 'CONDITIONAL $250 Equipment Discount Included: Your price paid includes an Equipment Discount of $250 that has been provided to you in exchange for activating a new, non-substitute line of service with T-Mobile and your agreement that for the 181-day period following such activation you will (1) pay your balance due to T-Mobile each month and otherwise maintain your account in good standing, (2) not disconnect this T-Mobile line of service, (3) not transfer this equipment to another T-Mobile line of service, (4) not change your T-Mobile service rate plan to a lower monthly service rate--this includes canceling or removing required PDA, BlackBerry, or smartphone features after your product has shipped, (5) not use this line of service to replace an existing account with T-Mobile. If these conditions are not met, you hereby authorize Magento.com to charge your credit card $250 as reimbursement of this Equipment Discount without need for further approval.',
+        ('ol_catalog_product.info', (17, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'activation_information': 'CONDITIONAL $250 Equipment Discount Included: Your price paid includes an Equipment Discount of $250 that has been provided to you in exchange for activating a new, non-substitute line of service with T-Mobile and your agreement that for the 181-day period following such activation you will (1) pay your balance due to T-Mobile each month and otherwise maintain your account in good standing, (2) not disconnect this T-Mobile line of service, (3) not transfer this equipment to another T-Mobile line of service, (4) not change your T-Mobile service rate plan to a lower monthly service rate--this includes canceling or removing required PDA, BlackBerry, or smartphone features after your product has shipped, (5) not use this line of service to replace an existing account with T-Mobile. If these conditions are not met, you hereby authorize Magento.com to charge your credit card $250 as reimbursement of this Equipment Discount without need for further approval.',
                                                            'categories': ['8'],
                                                            'color': '23',
                                                            'cost': '29.9900',
@@ -3339,7 +3351,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '15.2000'},
-        ('ol_catalog_product.info', (17, u'3', None, 'id')): {'activation_information': 'CONDITIONAL $250 Equipment Discount Included: Your price paid includes an Equipment Discount of $250 that has been provided to you in exchange for activating a new, non-substitute line of service with T-Mobile and your agreement that for the 181-day period following such activation you will (1) pay your balance due to T-Mobile each month and otherwise maintain your account in good standing, (2) not disconnect this T-Mobile line of service, (3) not transfer this equipment to another T-Mobile line of service, (4) not change your T-Mobile service rate plan to a lower monthly service rate--this includes canceling or removing required PDA, BlackBerry, or smartphone features after your product has shipped, (5) not use this line of service to replace an existing account with T-Mobile. If these conditions are not met, you hereby authorize Magento.com to charge your credit card $250 as reimbursement of this Equipment Discount without need for further approval.',
+        ('ol_catalog_product.info', (17, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'activation_information': 'CONDITIONAL $250 Equipment Discount Included: Your price paid includes an Equipment Discount of $250 that has been provided to you in exchange for activating a new, non-substitute line of service with T-Mobile and your agreement that for the 181-day period following such activation you will (1) pay your balance due to T-Mobile each month and otherwise maintain your account in good standing, (2) not disconnect this T-Mobile line of service, (3) not transfer this equipment to another T-Mobile line of service, (4) not change your T-Mobile service rate plan to a lower monthly service rate--this includes canceling or removing required PDA, BlackBerry, or smartphone features after your product has shipped, (5) not use this line of service to replace an existing account with T-Mobile. If these conditions are not met, you hereby authorize Magento.com to charge your credit card $250 as reimbursement of this Equipment Discount without need for further approval.',
                                                            'categories': ['8'],
                                                            'color': '23',
                                                            'cost': '29.9900',
@@ -3396,7 +3408,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '15.2000'},
-        ('ol_catalog_product.info', (18, None, None, 'id')): {'activation_information': 'Conditional $250 Equipment Discount Included: Your price paid includes an equipment discount of $250 that has been provided to you in exchange for either activating a new, non-substitute line of service or renewing an existing line of service with AT&T and your agreement that for the 181-day period following such activation or renewal you will: (1) pay your balance due to AT&T each month and otherwise maintain your account in good standing; (2) not disconnect this AT&T line of service; (3) not transfer this equipment to another AT&T line of service; (4) not change your AT&T service rate plan to a lower monthly service rate--this includes canceling or removing required PDA, BlackBerry, or smartphone features after your product has shipped; (5) not use this line of service to replace an existing account with AT&T. If these conditions are not met, you hereby authorize Magento.com to charge your credit card $250 as reimbursement of this equipment discount without need for further approval.',
+        ('ol_catalog_product.info', (18, None, PRODUCT_ATTRIBUTES, 'id')): {'activation_information': 'Conditional $250 Equipment Discount Included: Your price paid includes an equipment discount of $250 that has been provided to you in exchange for either activating a new, non-substitute line of service or renewing an existing line of service with AT&T and your agreement that for the 181-day period following such activation or renewal you will: (1) pay your balance due to AT&T each month and otherwise maintain your account in good standing; (2) not disconnect this AT&T line of service; (3) not transfer this equipment to another AT&T line of service; (4) not change your AT&T service rate plan to a lower monthly service rate--this includes canceling or removing required PDA, BlackBerry, or smartphone features after your product has shipped; (5) not use this line of service to replace an existing account with AT&T. If these conditions are not met, you hereby authorize Magento.com to charge your credit card $250 as reimbursement of this equipment discount without need for further approval.',
                                                            'categories': ['8'],
                                                            'color': '24',
                                                            'cost': '29.9900',
@@ -3453,7 +3465,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '13.6000'},
-        ('ol_catalog_product.info', (18, u'2', None, 'id')): {'activation_information': 'Conditional $250 Equipment Discount Included: Your price paid includes an equipment discount of $250 that has been provided to you in exchange for either activating a new, non-substitute line of service or renewing an existing line of service with AT&T and your agreement that for the 181-day period following such activation or renewal you will: (1) pay your balance due to AT&T each month and otherwise maintain your account in good standing; (2) not disconnect this AT&T line of service; (3) not transfer this equipment to another AT&T line of service; (4) not change your AT&T service rate plan to a lower monthly service rate--this includes canceling or removing required PDA, BlackBerry, or smartphone features after your product has shipped; (5) not use this line of service to replace an existing account with AT&T. If these conditions are not met, you hereby authorize Magento.com to charge your credit card $250 as reimbursement of this equipment discount without need for further approval.',
+        ('ol_catalog_product.info', (18, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'activation_information': 'Conditional $250 Equipment Discount Included: Your price paid includes an equipment discount of $250 that has been provided to you in exchange for either activating a new, non-substitute line of service or renewing an existing line of service with AT&T and your agreement that for the 181-day period following such activation or renewal you will: (1) pay your balance due to AT&T each month and otherwise maintain your account in good standing; (2) not disconnect this AT&T line of service; (3) not transfer this equipment to another AT&T line of service; (4) not change your AT&T service rate plan to a lower monthly service rate--this includes canceling or removing required PDA, BlackBerry, or smartphone features after your product has shipped; (5) not use this line of service to replace an existing account with AT&T. If these conditions are not met, you hereby authorize Magento.com to charge your credit card $250 as reimbursement of this equipment discount without need for further approval.',
                                                            'categories': ['8'],
                                                            'color': '24',
                                                            'cost': '29.9900',
@@ -3510,7 +3522,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '13.6000'},
-        ('ol_catalog_product.info', (18, u'3', None, 'id')): {'activation_information': 'Conditional $250 Equipment Discount Included: Your price paid includes an equipment discount of $250 that has been provided to you in exchange for either activating a new, non-substitute line of service or renewing an existing line of service with AT&T and your agreement that for the 181-day period following such activation or renewal you will: (1) pay your balance due to AT&T each month and otherwise maintain your account in good standing; (2) not disconnect this AT&T line of service; (3) not transfer this equipment to another AT&T line of service; (4) not change your AT&T service rate plan to a lower monthly service rate--this includes canceling or removing required PDA, BlackBerry, or smartphone features after your product has shipped; (5) not use this line of service to replace an existing account with AT&T. If these conditions are not met, you hereby authorize Magento.com to charge your credit card $250 as reimbursement of this equipment discount without need for further approval.',
+        ('ol_catalog_product.info', (18, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'activation_information': 'Conditional $250 Equipment Discount Included: Your price paid includes an equipment discount of $250 that has been provided to you in exchange for either activating a new, non-substitute line of service or renewing an existing line of service with AT&T and your agreement that for the 181-day period following such activation or renewal you will: (1) pay your balance due to AT&T each month and otherwise maintain your account in good standing; (2) not disconnect this AT&T line of service; (3) not transfer this equipment to another AT&T line of service; (4) not change your AT&T service rate plan to a lower monthly service rate--this includes canceling or removing required PDA, BlackBerry, or smartphone features after your product has shipped; (5) not use this line of service to replace an existing account with AT&T. If these conditions are not met, you hereby authorize Magento.com to charge your credit card $250 as reimbursement of this equipment discount without need for further approval.',
                                                            'categories': ['8'],
                                                            'color': '24',
                                                            'cost': '29.9900',
@@ -3567,7 +3579,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '13.6000'},
-        ('ol_catalog_product.info', (19, None, None, 'id')): {'activation_information': 'Conditional $250 Equipment Discount Included: Your price paid includes an equipment discount of $250 that has been provided to you in exchange for either activating a new, non-substitute line of service or renewing an existing line of service with AT&T and your agreement that for the 181-day period following such activation or renewal you will: (1) pay your balance due to AT&T each month and otherwise maintain your account in good standing; (2) not disconnect this AT&T line of service; (3) not transfer this equipment to another AT&T line of service; (4) not change your AT&T service rate plan to a lower monthly service rate--this includes canceling or removing required PDA, BlackBerry, or smartphone features after your product has shipped; (5) not use this line of service to replace an existing account with AT&T. If these conditions are not met, you hereby authorize Magento.com to charge your credit card $250 as reimbursement of this equipment discount without need for further approval.',
+        ('ol_catalog_product.info', (19, None, PRODUCT_ATTRIBUTES, 'id')): {'activation_information': 'Conditional $250 Equipment Discount Included: Your price paid includes an equipment discount of $250 that has been provided to you in exchange for either activating a new, non-substitute line of service or renewing an existing line of service with AT&T and your agreement that for the 181-day period following such activation or renewal you will: (1) pay your balance due to AT&T each month and otherwise maintain your account in good standing; (2) not disconnect this AT&T line of service; (3) not transfer this equipment to another AT&T line of service; (4) not change your AT&T service rate plan to a lower monthly service rate--this includes canceling or removing required PDA, BlackBerry, or smartphone features after your product has shipped; (5) not use this line of service to replace an existing account with AT&T. If these conditions are not met, you hereby authorize Magento.com to charge your credit card $250 as reimbursement of this equipment discount without need for further approval.',
                                                            'categories': ['8'],
                                                            'color': '23',
                                                            'cost': '29.9900',
@@ -3624,7 +3636,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '30.0000'},
-        ('ol_catalog_product.info', (19, u'2', None, 'id')): {'activation_information': 'Conditional $250 Equipment Discount Included: Your price paid includes an equipment discount of $250 that has been provided to you in exchange for either activating a new, non-substitute line of service or renewing an existing line of service with AT&T and your agreement that for the 181-day period following such activation or renewal you will: (1) pay your balance due to AT&T each month and otherwise maintain your account in good standing; (2) not disconnect this AT&T line of service; (3) not transfer this equipment to another AT&T line of service; (4) not change your AT&T service rate plan to a lower monthly service rate--this includes canceling or removing required PDA, BlackBerry, or smartphone features after your product has shipped; (5) not use this line of service to replace an existing account with AT&T. If these conditions are not met, you hereby authorize Magento.com to charge your credit card $250 as reimbursement of this equipment discount without need for further approval.',
+        ('ol_catalog_product.info', (19, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'activation_information': 'Conditional $250 Equipment Discount Included: Your price paid includes an equipment discount of $250 that has been provided to you in exchange for either activating a new, non-substitute line of service or renewing an existing line of service with AT&T and your agreement that for the 181-day period following such activation or renewal you will: (1) pay your balance due to AT&T each month and otherwise maintain your account in good standing; (2) not disconnect this AT&T line of service; (3) not transfer this equipment to another AT&T line of service; (4) not change your AT&T service rate plan to a lower monthly service rate--this includes canceling or removing required PDA, BlackBerry, or smartphone features after your product has shipped; (5) not use this line of service to replace an existing account with AT&T. If these conditions are not met, you hereby authorize Magento.com to charge your credit card $250 as reimbursement of this equipment discount without need for further approval.',
                                                            'categories': ['8'],
                                                            'color': '23',
                                                            'cost': '29.9900',
@@ -3681,7 +3693,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '30.0000'},
-        ('ol_catalog_product.info', (19, u'3', None, 'id')): {'activation_information': 'Conditional $250 Equipment Discount Included: Your price paid includes an equipment discount of $250 that has been provided to you in exchange for either activating a new, non-substitute line of service or renewing an existing line of service with AT&T and your agreement that for the 181-day period following such activation or renewal you will: (1) pay your balance due to AT&T each month and otherwise maintain your account in good standing; (2) not disconnect this AT&T line of service; (3) not transfer this equipment to another AT&T line of service; (4) not change your AT&T service rate plan to a lower monthly service rate--this includes canceling or removing required PDA, BlackBerry, or smartphone features after your product has shipped; (5) not use this line of service to replace an existing account with AT&T. If these conditions are not met, you hereby authorize Magento.com to charge your credit card $250 as reimbursement of this equipment discount without need for further approval.',
+        ('ol_catalog_product.info', (19, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'activation_information': 'Conditional $250 Equipment Discount Included: Your price paid includes an equipment discount of $250 that has been provided to you in exchange for either activating a new, non-substitute line of service or renewing an existing line of service with AT&T and your agreement that for the 181-day period following such activation or renewal you will: (1) pay your balance due to AT&T each month and otherwise maintain your account in good standing; (2) not disconnect this AT&T line of service; (3) not transfer this equipment to another AT&T line of service; (4) not change your AT&T service rate plan to a lower monthly service rate--this includes canceling or removing required PDA, BlackBerry, or smartphone features after your product has shipped; (5) not use this line of service to replace an existing account with AT&T. If these conditions are not met, you hereby authorize Magento.com to charge your credit card $250 as reimbursement of this equipment discount without need for further approval.',
                                                            'categories': ['8'],
                                                            'color': '23',
                                                            'cost': '29.9900',
@@ -3738,7 +3750,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '30.0000'},
-        ('ol_catalog_product.info', (20, None, None, 'id')): {'activation_information': 'CONDITIONAL $250 Equipment Discount Included: Your price paid includes an equipment discount of $250 that has been provided to you in exchange for activating a new, non-substitute line of service with Sprint and your agreement that for the 181-day period following such activation you will (1) pay your balance due to Sprint each month and otherwise maintain your account in good standing, (2) not disconnect this Sprint line of service, (3) not transfer this equipment to another Sprint line of service, (4) not change your Sprint service rate plan to a lower monthly service rate--this includes canceling or removing required PDA, BlackBerry, or smartphone features after your product has shipped, and (5) not use this line of service to replace an existing account with Sprint. If these conditions are not met, you hereby authorize Magento.com to charge your credit card $250 as reimbursement of this equipment discount without need for further approval.',
+        ('ol_catalog_product.info', (20, None, PRODUCT_ATTRIBUTES, 'id')): {'activation_information': 'CONDITIONAL $250 Equipment Discount Included: Your price paid includes an equipment discount of $250 that has been provided to you in exchange for activating a new, non-substitute line of service with Sprint and your agreement that for the 181-day period following such activation you will (1) pay your balance due to Sprint each month and otherwise maintain your account in good standing, (2) not disconnect this Sprint line of service, (3) not transfer this equipment to another Sprint line of service, (4) not change your Sprint service rate plan to a lower monthly service rate--this includes canceling or removing required PDA, BlackBerry, or smartphone features after your product has shipped, and (5) not use this line of service to replace an existing account with Sprint. If these conditions are not met, you hereby authorize Magento.com to charge your credit card $250 as reimbursement of this equipment discount without need for further approval.',
                                                            'categories': ['8'],
                                                            'color': '23',
                                                            'cost': '29.9900',
@@ -3795,7 +3807,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '1.0000'},
-        ('ol_catalog_product.info', (20, u'2', None, 'id')): {'activation_information': 'CONDITIONAL $250 Equipment Discount Included: Your price paid includes an equipment discount of $250 that has been provided to you in exchange for activating a new, non-substitute line of service with Sprint and your agreement that for the 181-day period following such activation you will (1) pay your balance due to Sprint each month and otherwise maintain your account in good standing, (2) not disconnect this Sprint line of service, (3) not transfer this equipment to another Sprint line of service, (4) not change your Sprint service rate plan to a lower monthly service rate--this includes canceling or removing required PDA, BlackBerry, or smartphone features after your product has shipped, and (5) not use this line of service to replace an existing account with Sprint. If these conditions are not met, you hereby authorize Magento.com to charge your credit card $250 as reimbursement of this equipment discount without need for further approval.',
+        ('ol_catalog_product.info', (20, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'activation_information': 'CONDITIONAL $250 Equipment Discount Included: Your price paid includes an equipment discount of $250 that has been provided to you in exchange for activating a new, non-substitute line of service with Sprint and your agreement that for the 181-day period following such activation you will (1) pay your balance due to Sprint each month and otherwise maintain your account in good standing, (2) not disconnect this Sprint line of service, (3) not transfer this equipment to another Sprint line of service, (4) not change your Sprint service rate plan to a lower monthly service rate--this includes canceling or removing required PDA, BlackBerry, or smartphone features after your product has shipped, and (5) not use this line of service to replace an existing account with Sprint. If these conditions are not met, you hereby authorize Magento.com to charge your credit card $250 as reimbursement of this equipment discount without need for further approval.',
                                                            'categories': ['8'],
                                                            'color': '23',
                                                            'cost': '29.9900',
@@ -3852,7 +3864,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '1.0000'},
-        ('ol_catalog_product.info', (20, u'3', None, 'id')): {'activation_information': 'CONDITIONAL $250 Equipment Discount Included: Your price paid includes an equipment discount of $250 that has been provided to you in exchange for activating a new, non-substitute line of service with Sprint and your agreement that for the 181-day period following such activation you will (1) pay your balance due to Sprint each month and otherwise maintain your account in good standing, (2) not disconnect this Sprint line of service, (3) not transfer this equipment to another Sprint line of service, (4) not change your Sprint service rate plan to a lower monthly service rate--this includes canceling or removing required PDA, BlackBerry, or smartphone features after your product has shipped, and (5) not use this line of service to replace an existing account with Sprint. If these conditions are not met, you hereby authorize Magento.com to charge your credit card $250 as reimbursement of this equipment discount without need for further approval.',
+        ('ol_catalog_product.info', (20, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'activation_information': 'CONDITIONAL $250 Equipment Discount Included: Your price paid includes an equipment discount of $250 that has been provided to you in exchange for activating a new, non-substitute line of service with Sprint and your agreement that for the 181-day period following such activation you will (1) pay your balance due to Sprint each month and otherwise maintain your account in good standing, (2) not disconnect this Sprint line of service, (3) not transfer this equipment to another Sprint line of service, (4) not change your Sprint service rate plan to a lower monthly service rate--this includes canceling or removing required PDA, BlackBerry, or smartphone features after your product has shipped, and (5) not use this line of service to replace an existing account with Sprint. If these conditions are not met, you hereby authorize Magento.com to charge your credit card $250 as reimbursement of this equipment discount without need for further approval.',
                                                            'categories': ['8'],
                                                            'color': '23',
                                                            'cost': '29.9900',
@@ -3909,7 +3921,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '1.0000'},
-        ('ol_catalog_product.info', (25, None, None, 'id')): {'categories': ['15',
+        ('ol_catalog_product.info', (25, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['15',
                                                                           '28'],
                                                            'color': '23',
                                                            'computer_manufacturers': '77',
@@ -3971,7 +3983,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '10.6000'},
-        ('ol_catalog_product.info', (25, u'2', None, 'id')): {'categories': ['15',
+        ('ol_catalog_product.info', (25, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['15',
                                                                           '28'],
                                                            'color': '23',
                                                            'computer_manufacturers': '77',
@@ -4033,7 +4045,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '10.6000'},
-        ('ol_catalog_product.info', (25, u'3', None, 'id')): {'categories': ['15',
+        ('ol_catalog_product.info', (25, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['15',
                                                                           '28'],
                                                            'color': '23',
                                                            'computer_manufacturers': '77',
@@ -4095,7 +4107,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '10.6000'},
-        ('ol_catalog_product.info', (26, None, None, 'id')): {'categories': ['15',
+        ('ol_catalog_product.info', (26, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['15',
                                                                           '28'],
                                                            'color': '24',
                                                            'computer_manufacturers': '79',
@@ -4157,7 +4169,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '11.4000'},
-        ('ol_catalog_product.info', (26, u'2', None, 'id')): {'categories': ['15',
+        ('ol_catalog_product.info', (26, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['15',
                                                                           '28'],
                                                            'color': '24',
                                                            'computer_manufacturers': '79',
@@ -4219,7 +4231,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '11.4000'},
-        ('ol_catalog_product.info', (26, u'3', None, 'id')): {'categories': ['15',
+        ('ol_catalog_product.info', (26, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['15',
                                                                           '28'],
                                                            'color': '24',
                                                            'computer_manufacturers': '79',
@@ -4281,7 +4293,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '11.4000'},
-        ('ol_catalog_product.info', (27, None, None, 'id')): {'categories': [],
+        ('ol_catalog_product.info', (27, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': [],
                                                            'color': '24',
                                                            'computer_manufacturers': '76',
                                                            'cost': '899.9900',
@@ -4342,7 +4354,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '2.8000'},
-        ('ol_catalog_product.info', (27, u'2', None, 'id')): {'categories': [],
+        ('ol_catalog_product.info', (27, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': [],
                                                            'color': '24',
                                                            'computer_manufacturers': '76',
                                                            'cost': '899.9900',
@@ -4403,7 +4415,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '2.8000'},
-        ('ol_catalog_product.info', (27, u'3', None, 'id')): {'categories': [],
+        ('ol_catalog_product.info', (27, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': [],
                                                            'color': '24',
                                                            'computer_manufacturers': '76',
                                                            'cost': '899.9900',
@@ -4464,7 +4476,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '2.8000'},
-        ('ol_catalog_product.info', (28, None, None, 'id')): {'categories': ['15',
+        ('ol_catalog_product.info', (28, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['15',
                                                                           '28'],
                                                            'color': '24',
                                                            'computer_manufacturers': '74',
@@ -4526,7 +4538,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '10.0000'},
-        ('ol_catalog_product.info', (28, u'2', None, 'id')): {'categories': ['15',
+        ('ol_catalog_product.info', (28, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['15',
                                                                           '28'],
                                                            'color': '24',
                                                            'computer_manufacturers': '74',
@@ -4588,7 +4600,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '10.0000'},
-        ('ol_catalog_product.info', (28, u'3', None, 'id')): {'categories': ['15',
+        ('ol_catalog_product.info', (28, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['15',
                                                                           '28'],
                                                            'color': '24',
                                                            'computer_manufacturers': '74',
@@ -4650,7 +4662,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '10.0000'},
-        ('ol_catalog_product.info', (29, None, None, 'id')): {'categories': [],
+        ('ol_catalog_product.info', (29, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': [],
                                                            'color': '25',
                                                            'cost': '1.0000',
                                                            'country_of_manufacture': None,
@@ -4708,7 +4720,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '1.0000'},
-        ('ol_catalog_product.info', (29, u'2', None, 'id')): {'categories': [],
+        ('ol_catalog_product.info', (29, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': [],
                                                            'color': '25',
                                                            'cost': '1.0000',
                                                            'country_of_manufacture': None,
@@ -4766,7 +4778,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '1.0000'},
-        ('ol_catalog_product.info', (29, u'3', None, 'id')): {'categories': [],
+        ('ol_catalog_product.info', (29, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': [],
                                                            'color': '25',
                                                            'cost': '1.0000',
                                                            'country_of_manufacture': None,
@@ -4824,7 +4836,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '1.0000'},
-        ('ol_catalog_product.info', (30, None, None, 'id')): {'categories': ['16'],
+        ('ol_catalog_product.info', (30, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['16'],
                                                            'color': '61',
                                                            'cost': '29.9900',
                                                            'country_of_manufacture': None,
@@ -4882,7 +4894,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '3.0000'},
-        ('ol_catalog_product.info', (30, u'2', None, 'id')): {'categories': ['16'],
+        ('ol_catalog_product.info', (30, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['16'],
                                                            'color': '61',
                                                            'cost': '29.9900',
                                                            'country_of_manufacture': None,
@@ -4940,7 +4952,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '3.0000'},
-        ('ol_catalog_product.info', (30, u'3', None, 'id')): {'categories': ['16'],
+        ('ol_catalog_product.info', (30, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['16'],
                                                            'color': '61',
                                                            'cost': '29.9900',
                                                            'country_of_manufacture': None,
@@ -4998,7 +5010,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '3.0000'},
-        ('ol_catalog_product.info', (31, None, None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (31, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                            'color': '26',
                                                            'cost': '29.9900',
                                                            'country_of_manufacture': None,
@@ -5056,7 +5068,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '2.0000'},
-        ('ol_catalog_product.info', (31, u'2', None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (31, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                            'color': '26',
                                                            'cost': '29.9900',
                                                            'country_of_manufacture': None,
@@ -5114,7 +5126,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '2.0000'},
-        ('ol_catalog_product.info', (31, u'3', None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (31, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                            'color': '26',
                                                            'cost': '29.9900',
                                                            'country_of_manufacture': None,
@@ -5172,7 +5184,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '2.0000'},
-        ('ol_catalog_product.info', (32, None, None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (32, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                            'color': '26',
                                                            'cost': '29.9900',
                                                            'country_of_manufacture': None,
@@ -5230,7 +5242,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '2.0000'},
-        ('ol_catalog_product.info', (32, u'2', None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (32, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                            'color': '26',
                                                            'cost': '29.9900',
                                                            'country_of_manufacture': None,
@@ -5288,7 +5300,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '2.0000'},
-        ('ol_catalog_product.info', (32, u'3', None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (32, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                            'color': '26',
                                                            'cost': '29.9900',
                                                            'country_of_manufacture': None,
@@ -5346,7 +5358,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '2.0000'},
-        ('ol_catalog_product.info', (33, None, None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (33, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                            'color': '59',
                                                            'cost': '29.9900',
                                                            'country_of_manufacture': None,
@@ -5404,7 +5416,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '4.0000'},
-        ('ol_catalog_product.info', (33, u'2', None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (33, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                            'color': '59',
                                                            'cost': '29.9900',
                                                            'country_of_manufacture': None,
@@ -5462,7 +5474,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '4.0000'},
-        ('ol_catalog_product.info', (33, u'3', None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (33, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                            'color': '59',
                                                            'cost': '29.9900',
                                                            'country_of_manufacture': None,
@@ -5520,7 +5532,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '4.0000'},
-        ('ol_catalog_product.info', (34, None, None, 'id')): {'categories': ['16'],
+        ('ol_catalog_product.info', (34, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['16'],
                                                            'color': '24',
                                                            'cost': '29.9900',
                                                            'country_of_manufacture': None,
@@ -5578,7 +5590,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '2.0000'},
-        ('ol_catalog_product.info', (34, u'2', None, 'id')): {'categories': ['16'],
+        ('ol_catalog_product.info', (34, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['16'],
                                                            'color': '24',
                                                            'cost': '29.9900',
                                                            'country_of_manufacture': None,
@@ -5636,7 +5648,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '2.0000'},
-        ('ol_catalog_product.info', (34, u'3', None, 'id')): {'categories': ['16'],
+        ('ol_catalog_product.info', (34, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['16'],
                                                            'color': '24',
                                                            'cost': '29.9900',
                                                            'country_of_manufacture': None,
@@ -5694,7 +5706,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '2.0000'},
-        ('ol_catalog_product.info', (35, None, None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (35, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                            'color': '22',
                                                            'cost': '2.0000',
                                                            'country_of_manufacture': None,
@@ -5750,7 +5762,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '0.5000'},
-        ('ol_catalog_product.info', (35, u'2', None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (35, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                            'color': '22',
                                                            'cost': '2.0000',
                                                            'country_of_manufacture': None,
@@ -5806,7 +5818,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '0.5000'},
-        ('ol_catalog_product.info', (35, u'3', None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (35, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                            'color': '22',
                                                            'cost': '2.0000',
                                                            'country_of_manufacture': None,
@@ -5862,7 +5874,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '0.5000'},
-        ('ol_catalog_product.info', (36, None, None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (36, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                            'color': '60',
                                                            'cost': '2.0000',
                                                            'country_of_manufacture': None,
@@ -5918,7 +5930,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '0.5000'},
-        ('ol_catalog_product.info', (36, u'2', None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (36, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                            'color': '60',
                                                            'cost': '2.0000',
                                                            'country_of_manufacture': None,
@@ -5974,7 +5986,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '0.5000'},
-        ('ol_catalog_product.info', (36, u'3', None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (36, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                            'color': '60',
                                                            'cost': '2.0000',
                                                            'country_of_manufacture': None,
@@ -6030,7 +6042,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '0.5000'},
-        ('ol_catalog_product.info', (37, None, None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (37, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                            'color': '60',
                                                            'cost': '2.0000',
                                                            'country_of_manufacture': None,
@@ -6086,7 +6098,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '0.4400'},
-        ('ol_catalog_product.info', (37, u'2', None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (37, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                            'color': '60',
                                                            'cost': '2.0000',
                                                            'country_of_manufacture': None,
@@ -6142,7 +6154,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '0.4400'},
-        ('ol_catalog_product.info', (37, u'3', None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (37, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                            'color': '60',
                                                            'cost': '2.0000',
                                                            'country_of_manufacture': None,
@@ -6198,7 +6210,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '0.4400'},
-        ('ol_catalog_product.info', (38, None, None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (38, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                            'color': '26',
                                                            'cost': '2.0000',
                                                            'country_of_manufacture': None,
@@ -6254,7 +6266,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '0.4400'},
-        ('ol_catalog_product.info', (38, u'2', None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (38, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                            'color': '26',
                                                            'cost': '2.0000',
                                                            'country_of_manufacture': None,
@@ -6310,7 +6322,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '0.4400'},
-        ('ol_catalog_product.info', (38, u'3', None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (38, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                            'color': '26',
                                                            'cost': '2.0000',
                                                            'country_of_manufacture': None,
@@ -6366,7 +6378,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '0.4400'},
-        ('ol_catalog_product.info', (39, None, None, 'id')): {'categories': ['19'],
+        ('ol_catalog_product.info', (39, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['19'],
                                                            'color': '22',
                                                            'cost': '5.0000',
                                                            'country_of_manufacture': None,
@@ -6422,7 +6434,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '1.7500'},
-        ('ol_catalog_product.info', (39, u'2', None, 'id')): {'categories': ['19'],
+        ('ol_catalog_product.info', (39, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['19'],
                                                            'color': '22',
                                                            'cost': '5.0000',
                                                            'country_of_manufacture': None,
@@ -6478,7 +6490,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '1.7500'},
-        ('ol_catalog_product.info', (39, u'3', None, 'id')): {'categories': ['19'],
+        ('ol_catalog_product.info', (39, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['19'],
                                                            'color': '22',
                                                            'cost': '5.0000',
                                                            'country_of_manufacture': None,
@@ -6534,7 +6546,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '1.7500'},
-        ('ol_catalog_product.info', (41, None, None, 'id')): {'categories': ['23'],
+        ('ol_catalog_product.info', (41, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['23'],
                                                            'color': '59',
                                                            'cost': '100.0000',
                                                            'country_of_manufacture': None,
@@ -6592,7 +6604,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '128.9700'},
-        ('ol_catalog_product.info', (41, u'2', None, 'id')): {'categories': ['23'],
+        ('ol_catalog_product.info', (41, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['23'],
                                                            'color': '59',
                                                            'cost': '100.0000',
                                                            'country_of_manufacture': None,
@@ -6650,7 +6662,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '128.9700'},
-        ('ol_catalog_product.info', (41, u'3', None, 'id')): {'categories': ['23'],
+        ('ol_catalog_product.info', (41, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['23'],
                                                            'color': '59',
                                                            'cost': '100.0000',
                                                            'country_of_manufacture': None,
@@ -6708,7 +6720,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '128.9700'},
-        ('ol_catalog_product.info', (42, None, None, 'id')): {'categories': ['23'],
+        ('ol_catalog_product.info', (42, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['23'],
                                                            'color': '59',
                                                            'cost': '800.0000',
                                                            'country_of_manufacture': None,
@@ -6766,7 +6778,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '150.0000'},
-        ('ol_catalog_product.info', (42, u'2', None, 'id')): {'categories': ['23'],
+        ('ol_catalog_product.info', (42, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['23'],
                                                            'color': '59',
                                                            'cost': '800.0000',
                                                            'country_of_manufacture': None,
@@ -6824,7 +6836,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '150.0000'},
-        ('ol_catalog_product.info', (42, u'3', None, 'id')): {'categories': ['23'],
+        ('ol_catalog_product.info', (42, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['23'],
                                                            'color': '59',
                                                            'cost': '800.0000',
                                                            'country_of_manufacture': None,
@@ -6882,7 +6894,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '150.0000'},
-        ('ol_catalog_product.info', (44, None, None, 'id')): {'categories': ['26'],
+        ('ol_catalog_product.info', (44, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['26'],
                                                            'color': '24',
                                                            'cost': '200.0000',
                                                            'country_of_manufacture': None,
@@ -6945,7 +6957,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '4.0000'},
-        ('ol_catalog_product.info', (44, u'2', None, 'id')): {'categories': ['26'],
+        ('ol_catalog_product.info', (44, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['26'],
                                                            'color': '24',
                                                            'cost': '200.0000',
                                                            'country_of_manufacture': None,
@@ -7008,7 +7020,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '4.0000'},
-        ('ol_catalog_product.info', (44, u'3', None, 'id')): {'categories': ['26'],
+        ('ol_catalog_product.info', (44, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['26'],
                                                            'color': '24',
                                                            'cost': '200.0000',
                                                            'country_of_manufacture': None,
@@ -7071,7 +7083,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '4.0000'},
-        ('ol_catalog_product.info', (45, None, None, 'id')): {'categories': ['26'],
+        ('ol_catalog_product.info', (45, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['26'],
                                                            'color': '23',
                                                            'cost': '20.0000',
                                                            'country_of_manufacture': None,
@@ -7128,7 +7140,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '1.0000'},
-        ('ol_catalog_product.info', (45, u'2', None, 'id')): {'categories': ['26'],
+        ('ol_catalog_product.info', (45, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['26'],
                                                            'color': '23',
                                                            'cost': '20.0000',
                                                            'country_of_manufacture': None,
@@ -7185,7 +7197,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '1.0000'},
-        ('ol_catalog_product.info', (45, u'3', None, 'id')): {'categories': ['26'],
+        ('ol_catalog_product.info', (45, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['26'],
                                                            'color': '23',
                                                            'cost': '20.0000',
                                                            'country_of_manufacture': None,
@@ -7242,7 +7254,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '1.0000'},
-        ('ol_catalog_product.info', (46, None, None, 'id')): {'categories': ['12',
+        ('ol_catalog_product.info', (46, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['12',
                                                                           '26'],
                                                            'color': '23',
                                                            'cost': '29.9900',
@@ -7300,7 +7312,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '2.0000'},
-        ('ol_catalog_product.info', (46, u'2', None, 'id')): {'categories': ['12',
+        ('ol_catalog_product.info', (46, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['12',
                                                                           '26'],
                                                            'color': '23',
                                                            'cost': '29.9900',
@@ -7358,7 +7370,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '2.0000'},
-        ('ol_catalog_product.info', (46, u'3', None, 'id')): {'categories': ['12',
+        ('ol_catalog_product.info', (46, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['12',
                                                                           '26'],
                                                            'color': '23',
                                                            'cost': '29.9900',
@@ -7416,7 +7428,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '2.0000'},
-        ('ol_catalog_product.info', (47, None, None, 'id')): {'categories': ['26'],
+        ('ol_catalog_product.info', (47, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['26'],
                                                            'color': '23',
                                                            'cost': '29.9900',
                                                            'country_of_manufacture': None,
@@ -7473,7 +7485,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '3.0000'},
-        ('ol_catalog_product.info', (47, u'2', None, 'id')): {'categories': ['26'],
+        ('ol_catalog_product.info', (47, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['26'],
                                                            'color': '23',
                                                            'cost': '29.9900',
                                                            'country_of_manufacture': None,
@@ -7530,7 +7542,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '3.0000'},
-        ('ol_catalog_product.info', (47, u'3', None, 'id')): {'categories': ['26'],
+        ('ol_catalog_product.info', (47, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['26'],
                                                            'color': '23',
                                                            'cost': '29.9900',
                                                            'country_of_manufacture': None,
@@ -7587,7 +7599,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '3.0000'},
-        ('ol_catalog_product.info', (48, None, None, 'id')): {'categories': ['26'],
+        ('ol_catalog_product.info', (48, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['26'],
                                                            'color': '23',
                                                            'cost': '29.9900',
                                                            'country_of_manufacture': None,
@@ -7644,7 +7656,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '2.0000'},
-        ('ol_catalog_product.info', (48, u'2', None, 'id')): {'categories': ['26'],
+        ('ol_catalog_product.info', (48, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['26'],
                                                            'color': '23',
                                                            'cost': '29.9900',
                                                            'country_of_manufacture': None,
@@ -7701,7 +7713,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '2.0000'},
-        ('ol_catalog_product.info', (48, u'3', None, 'id')): {'categories': ['26'],
+        ('ol_catalog_product.info', (48, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['26'],
                                                            'color': '23',
                                                            'cost': '29.9900',
                                                            'country_of_manufacture': None,
@@ -7758,7 +7770,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '2.0000'},
-        ('ol_catalog_product.info', (49, None, None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (49, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                            'color': '59',
                                                            'cost': '10.0000',
                                                            'country_of_manufacture': None,
@@ -7816,7 +7828,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '2.0000'},
-        ('ol_catalog_product.info', (49, u'2', None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (49, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                            'color': '59',
                                                            'cost': '10.0000',
                                                            'country_of_manufacture': None,
@@ -7874,7 +7886,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '2.0000'},
-        ('ol_catalog_product.info', (49, u'3', None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (49, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                            'color': '59',
                                                            'cost': '10.0000',
                                                            'country_of_manufacture': None,
@@ -7932,7 +7944,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '2.0000'},
-        ('ol_catalog_product.info', (51, None, None, 'id')): {'categories': ['22'],
+        ('ol_catalog_product.info', (51, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['22'],
                                                            'color': '26',
                                                            'cost': '50.0000',
                                                            'country_of_manufacture': None,
@@ -7990,7 +8002,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '20.0000'},
-        ('ol_catalog_product.info', (51, u'2', None, 'id')): {'categories': ['22'],
+        ('ol_catalog_product.info', (51, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['22'],
                                                            'color': '26',
                                                            'cost': '50.0000',
                                                            'country_of_manufacture': None,
@@ -8048,7 +8060,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '20.0000'},
-        ('ol_catalog_product.info', (51, u'3', None, 'id')): {'categories': ['22'],
+        ('ol_catalog_product.info', (51, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['22'],
                                                            'color': '26',
                                                            'cost': '50.0000',
                                                            'country_of_manufacture': None,
@@ -8106,7 +8118,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '20.0000'},
-        ('ol_catalog_product.info', (52, None, None, 'id')): {'categories': ['22'],
+        ('ol_catalog_product.info', (52, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['22'],
                                                            'color': '26',
                                                            'cost': '50.0000',
                                                            'country_of_manufacture': None,
@@ -8164,7 +8176,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '50.0000'},
-        ('ol_catalog_product.info', (52, u'2', None, 'id')): {'categories': ['22'],
+        ('ol_catalog_product.info', (52, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['22'],
                                                            'color': '26',
                                                            'cost': '50.0000',
                                                            'country_of_manufacture': None,
@@ -8222,7 +8234,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '50.0000'},
-        ('ol_catalog_product.info', (52, u'3', None, 'id')): {'categories': ['22'],
+        ('ol_catalog_product.info', (52, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['22'],
                                                            'color': '26',
                                                            'cost': '50.0000',
                                                            'country_of_manufacture': None,
@@ -8280,7 +8292,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '50.0000'},
-        ('ol_catalog_product.info', (53, None, None, 'id')): {'categories': ['22'],
+        ('ol_catalog_product.info', (53, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['22'],
                                                            'color': '26',
                                                            'cost': '200.0000',
                                                            'country_of_manufacture': None,
@@ -8338,7 +8350,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '200.0000'},
-        ('ol_catalog_product.info', (53, u'2', None, 'id')): {'categories': ['22'],
+        ('ol_catalog_product.info', (53, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['22'],
                                                            'color': '26',
                                                            'cost': '200.0000',
                                                            'country_of_manufacture': None,
@@ -8396,7 +8408,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '200.0000'},
-        ('ol_catalog_product.info', (53, u'3', None, 'id')): {'categories': ['22'],
+        ('ol_catalog_product.info', (53, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['22'],
                                                            'color': '26',
                                                            'cost': '200.0000',
                                                            'country_of_manufacture': None,
@@ -8454,7 +8466,7 @@ magento_base_responses = \
                                                            'visibility': '4',
                                                            'websites': ['1'],
                                                            'weight': '200.0000'},
-        ('ol_catalog_product.info', (54, None, None, 'id')): {'categories': ['22'],
+        ('ol_catalog_product.info', (54, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['22'],
                                                            'country_of_manufacture': None,
                                                            'country_orgin': 'Italy',
                                                            'created_at': '2007-08-28 16:38:54',
@@ -8495,7 +8507,7 @@ magento_base_responses = \
                                                            'url_path': 'magento-red-furniture-set.html',
                                                            'visibility': '4',
                                                            'websites': ['1']},
-        ('ol_catalog_product.info', (74, None, None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (74, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                            'color': '59',
                                                            'cost': '10.0000',
                                                            'country_of_manufacture': None,
@@ -8553,7 +8565,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '2.0000'},
-        ('ol_catalog_product.info', (74, u'2', None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (74, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                            'color': '59',
                                                            'cost': '10.0000',
                                                            'country_of_manufacture': None,
@@ -8611,7 +8623,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '2.0000'},
-        ('ol_catalog_product.info', (74, u'3', None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (74, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                            'color': '59',
                                                            'cost': '10.0000',
                                                            'country_of_manufacture': None,
@@ -8669,7 +8681,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '2.0000'},
-        ('ol_catalog_product.info', (75, None, None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (75, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                            'color': '59',
                                                            'cost': '10.0000',
                                                            'country_of_manufacture': None,
@@ -8727,7 +8739,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '2.0000'},
-        ('ol_catalog_product.info', (75, u'2', None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (75, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                            'color': '59',
                                                            'cost': '10.0000',
                                                            'country_of_manufacture': None,
@@ -8785,7 +8797,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '2.0000'},
-        ('ol_catalog_product.info', (75, u'3', None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (75, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                            'color': '59',
                                                            'cost': '10.0000',
                                                            'country_of_manufacture': None,
@@ -8843,7 +8855,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '2.0000'},
-        ('ol_catalog_product.info', (79, None, None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (79, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                            'color': '59',
                                                            'cost': '10.0000',
                                                            'country_of_manufacture': None,
@@ -8901,7 +8913,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '2.0000'},
-        ('ol_catalog_product.info', (79, u'2', None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (79, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                            'color': '59',
                                                            'cost': '10.0000',
                                                            'country_of_manufacture': None,
@@ -8959,7 +8971,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '2.0000'},
-        ('ol_catalog_product.info', (79, u'3', None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (79, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                            'color': '59',
                                                            'cost': '10.0000',
                                                            'country_of_manufacture': None,
@@ -9017,7 +9029,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '2.0000'},
-        ('ol_catalog_product.info', (80, None, None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (80, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                            'color': '59',
                                                            'cost': '10.0000',
                                                            'country_of_manufacture': None,
@@ -9075,7 +9087,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '2.0000'},
-        ('ol_catalog_product.info', (80, u'2', None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (80, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                            'color': '59',
                                                            'cost': '10.0000',
                                                            'country_of_manufacture': None,
@@ -9133,7 +9145,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '2.0000'},
-        ('ol_catalog_product.info', (80, u'3', None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (80, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                            'color': '59',
                                                            'cost': '10.0000',
                                                            'country_of_manufacture': None,
@@ -9191,7 +9203,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '2.0000'},
-        ('ol_catalog_product.info', (81, None, None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (81, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                            'color': '59',
                                                            'cost': '10.0000',
                                                            'country_of_manufacture': None,
@@ -9249,7 +9261,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '2.0000'},
-        ('ol_catalog_product.info', (81, u'2', None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (81, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                            'color': '59',
                                                            'cost': '10.0000',
                                                            'country_of_manufacture': None,
@@ -9307,7 +9319,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '2.0000'},
-        ('ol_catalog_product.info', (81, u'3', None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (81, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                            'color': '59',
                                                            'cost': '10.0000',
                                                            'country_of_manufacture': None,
@@ -9365,7 +9377,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '2.0000'},
-        ('ol_catalog_product.info', (82, None, None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (82, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                            'color': '59',
                                                            'cost': '10.0000',
                                                            'country_of_manufacture': None,
@@ -9423,7 +9435,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '2.0000'},
-        ('ol_catalog_product.info', (82, u'2', None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (82, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                            'color': '59',
                                                            'cost': '10.0000',
                                                            'country_of_manufacture': None,
@@ -9481,7 +9493,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '2.0000'},
-        ('ol_catalog_product.info', (82, u'3', None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (82, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                            'color': '59',
                                                            'cost': '10.0000',
                                                            'country_of_manufacture': None,
@@ -9539,7 +9551,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '2.0000'},
-        ('ol_catalog_product.info', (83, None, None, 'id')): {'categories': ['16',
+        ('ol_catalog_product.info', (83, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['16',
                                                                           '17'],
                                                            'country_of_manufacture': None,
                                                            'created_at': '2007-08-29 10:32:52',
@@ -9590,7 +9602,7 @@ magento_base_responses = \
                                                            'url_path': 'cn-clogs-beach-garden-clog.html',
                                                            'visibility': '4',
                                                            'websites': ['1']},
-        ('ol_catalog_product.info', (84, None, None, 'id')): {'categories': ['16',
+        ('ol_catalog_product.info', (84, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['16',
                                                                           '17'],
                                                            'color': '25',
                                                            'cost': '1.0000',
@@ -9649,7 +9661,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '1.0000'},
-        ('ol_catalog_product.info', (84, u'2', None, 'id')): {'categories': ['16',
+        ('ol_catalog_product.info', (84, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['16',
                                                                           '17'],
                                                            'color': '25',
                                                            'cost': '1.0000',
@@ -9708,7 +9720,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '1.0000'},
-        ('ol_catalog_product.info', (84, u'3', None, 'id')): {'categories': ['16',
+        ('ol_catalog_product.info', (84, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['16',
                                                                           '17'],
                                                            'color': '25',
                                                            'cost': '1.0000',
@@ -9767,7 +9779,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '1.0000'},
-        ('ol_catalog_product.info', (85, None, None, 'id')): {'categories': ['16',
+        ('ol_catalog_product.info', (85, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['16',
                                                                           '17'],
                                                            'color': '25',
                                                            'cost': '1.0000',
@@ -9826,7 +9838,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '1.0000'},
-        ('ol_catalog_product.info', (85, u'2', None, 'id')): {'categories': ['16',
+        ('ol_catalog_product.info', (85, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['16',
                                                                           '17'],
                                                            'color': '25',
                                                            'cost': '1.0000',
@@ -9885,7 +9897,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '1.0000'},
-        ('ol_catalog_product.info', (85, u'3', None, 'id')): {'categories': ['16',
+        ('ol_catalog_product.info', (85, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['16',
                                                                           '17'],
                                                            'color': '25',
                                                            'cost': '1.0000',
@@ -9944,7 +9956,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '1.0000'},
-        ('ol_catalog_product.info', (86, None, None, 'id')): {'categories': ['16',
+        ('ol_catalog_product.info', (86, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['16',
                                                                           '17'],
                                                            'color': '25',
                                                            'cost': '1.0000',
@@ -10003,7 +10015,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '1.0000'},
-        ('ol_catalog_product.info', (86, u'2', None, 'id')): {'categories': ['16',
+        ('ol_catalog_product.info', (86, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['16',
                                                                           '17'],
                                                            'color': '25',
                                                            'cost': '1.0000',
@@ -10062,7 +10074,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '1.0000'},
-        ('ol_catalog_product.info', (86, u'3', None, 'id')): {'categories': ['16',
+        ('ol_catalog_product.info', (86, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['16',
                                                                           '17'],
                                                            'color': '25',
                                                            'cost': '1.0000',
@@ -10121,7 +10133,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '1.0000'},
-        ('ol_catalog_product.info', (87, None, None, 'id')): {'categories': ['16',
+        ('ol_catalog_product.info', (87, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['16',
                                                                           '17'],
                                                            'color': '25',
                                                            'cost': '1.0000',
@@ -10180,7 +10192,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '1.0000'},
-        ('ol_catalog_product.info', (87, u'2', None, 'id')): {'categories': ['16',
+        ('ol_catalog_product.info', (87, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['16',
                                                                           '17'],
                                                            'color': '25',
                                                            'cost': '1.0000',
@@ -10239,7 +10251,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '1.0000'},
-        ('ol_catalog_product.info', (87, u'3', None, 'id')): {'categories': ['16',
+        ('ol_catalog_product.info', (87, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['16',
                                                                           '17'],
                                                            'color': '25',
                                                            'cost': '1.0000',
@@ -10298,7 +10310,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '1.0000'},
-        ('ol_catalog_product.info', (88, None, None, 'id')): {'categories': ['16',
+        ('ol_catalog_product.info', (88, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['16',
                                                                           '17'],
                                                            'color': '25',
                                                            'cost': '1.0000',
@@ -10357,7 +10369,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '1.0000'},
-        ('ol_catalog_product.info', (88, u'2', None, 'id')): {'categories': ['16',
+        ('ol_catalog_product.info', (88, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['16',
                                                                           '17'],
                                                            'color': '25',
                                                            'cost': '1.0000',
@@ -10416,7 +10428,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '1.0000'},
-        ('ol_catalog_product.info', (88, u'3', None, 'id')): {'categories': ['16',
+        ('ol_catalog_product.info', (88, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['16',
                                                                           '17'],
                                                            'color': '25',
                                                            'cost': '1.0000',
@@ -10475,7 +10487,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '1.0000'},
-        ('ol_catalog_product.info', (89, None, None, 'id')): {'categories': ['16',
+        ('ol_catalog_product.info', (89, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['16',
                                                                           '17'],
                                                            'color': '25',
                                                            'cost': '1.0000',
@@ -10534,7 +10546,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '1.0000'},
-        ('ol_catalog_product.info', (89, u'2', None, 'id')): {'categories': ['16',
+        ('ol_catalog_product.info', (89, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['16',
                                                                           '17'],
                                                            'color': '25',
                                                            'cost': '1.0000',
@@ -10593,7 +10605,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '1.0000'},
-        ('ol_catalog_product.info', (89, u'3', None, 'id')): {'categories': ['16',
+        ('ol_catalog_product.info', (89, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['16',
                                                                           '17'],
                                                            'color': '25',
                                                            'cost': '1.0000',
@@ -10652,7 +10664,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '1.0000'},
-        ('ol_catalog_product.info', (90, None, None, 'id')): {'categories': ['16',
+        ('ol_catalog_product.info', (90, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['16',
                                                                           '17'],
                                                            'color': '25',
                                                            'cost': '1.0000',
@@ -10711,7 +10723,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '1.0000'},
-        ('ol_catalog_product.info', (90, u'2', None, 'id')): {'categories': ['16',
+        ('ol_catalog_product.info', (90, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['16',
                                                                           '17'],
                                                            'color': '25',
                                                            'cost': '1.0000',
@@ -10770,7 +10782,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '1.0000'},
-        ('ol_catalog_product.info', (90, u'3', None, 'id')): {'categories': ['16',
+        ('ol_catalog_product.info', (90, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['16',
                                                                           '17'],
                                                            'color': '25',
                                                            'cost': '1.0000',
@@ -10829,7 +10841,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '1.0000'},
-        ('ol_catalog_product.info', (91, None, None, 'id')): {'categories': ['16',
+        ('ol_catalog_product.info', (91, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['16',
                                                                           '17'],
                                                            'color': '25',
                                                            'cost': '1.0000',
@@ -10888,7 +10900,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '1.0000'},
-        ('ol_catalog_product.info', (91, u'2', None, 'id')): {'categories': ['16',
+        ('ol_catalog_product.info', (91, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['16',
                                                                           '17'],
                                                            'color': '25',
                                                            'cost': '1.0000',
@@ -10947,7 +10959,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '1.0000'},
-        ('ol_catalog_product.info', (91, u'3', None, 'id')): {'categories': ['16',
+        ('ol_catalog_product.info', (91, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['16',
                                                                           '17'],
                                                            'color': '25',
                                                            'cost': '1.0000',
@@ -11006,7 +11018,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '1.0000'},
-        ('ol_catalog_product.info', (92, None, None, 'id')): {'categories': ['16',
+        ('ol_catalog_product.info', (92, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['16',
                                                                           '17'],
                                                            'color': '25',
                                                            'cost': '1.0000',
@@ -11065,7 +11077,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '1.0000'},
-        ('ol_catalog_product.info', (92, u'2', None, 'id')): {'categories': ['16',
+        ('ol_catalog_product.info', (92, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['16',
                                                                           '17'],
                                                            'color': '25',
                                                            'cost': '1.0000',
@@ -11124,7 +11136,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '1.0000'},
-        ('ol_catalog_product.info', (92, u'3', None, 'id')): {'categories': ['16',
+        ('ol_catalog_product.info', (92, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['16',
                                                                           '17'],
                                                            'color': '25',
                                                            'cost': '1.0000',
@@ -11183,7 +11195,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '1.0000'},
-        ('ol_catalog_product.info', (93, None, None, 'id')): {'categories': ['16'],
+        ('ol_catalog_product.info', (93, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['16'],
                                                            'country_of_manufacture': None,
                                                            'created_at': '2007-08-29 11:46:47',
                                                            'custom_design': '',
@@ -11234,7 +11246,7 @@ magento_base_responses = \
                                                            'url_path': 'asics-men-s-gel-kayano-xii.html',
                                                            'visibility': '4',
                                                            'websites': ['1']},
-        ('ol_catalog_product.info', (94, None, None, 'id')): {'categories': ['16'],
+        ('ol_catalog_product.info', (94, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['16'],
                                                            'color': '61',
                                                            'cost': '29.9900',
                                                            'country_of_manufacture': None,
@@ -11292,7 +11304,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '3.0000'},
-        ('ol_catalog_product.info', (94, u'2', None, 'id')): {'categories': ['16'],
+        ('ol_catalog_product.info', (94, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['16'],
                                                            'color': '61',
                                                            'cost': '29.9900',
                                                            'country_of_manufacture': None,
@@ -11350,7 +11362,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '3.0000'},
-        ('ol_catalog_product.info', (94, u'3', None, 'id')): {'categories': ['16'],
+        ('ol_catalog_product.info', (94, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['16'],
                                                            'color': '61',
                                                            'cost': '29.9900',
                                                            'country_of_manufacture': None,
@@ -11408,7 +11420,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '3.0000'},
-        ('ol_catalog_product.info', (95, None, None, 'id')): {'categories': ['16'],
+        ('ol_catalog_product.info', (95, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['16'],
                                                            'color': '61',
                                                            'cost': '29.9900',
                                                            'country_of_manufacture': None,
@@ -11466,7 +11478,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '3.0000'},
-        ('ol_catalog_product.info', (95, u'2', None, 'id')): {'categories': ['16'],
+        ('ol_catalog_product.info', (95, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['16'],
                                                            'color': '61',
                                                            'cost': '29.9900',
                                                            'country_of_manufacture': None,
@@ -11524,7 +11536,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '3.0000'},
-        ('ol_catalog_product.info', (95, u'3', None, 'id')): {'categories': ['16'],
+        ('ol_catalog_product.info', (95, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['16'],
                                                            'color': '61',
                                                            'cost': '29.9900',
                                                            'country_of_manufacture': None,
@@ -11582,7 +11594,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '3.0000'},
-        ('ol_catalog_product.info', (96, None, None, 'id')): {'categories': ['16'],
+        ('ol_catalog_product.info', (96, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['16'],
                                                            'color': '61',
                                                            'cost': '29.9900',
                                                            'country_of_manufacture': None,
@@ -11640,7 +11652,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '3.0000'},
-        ('ol_catalog_product.info', (96, u'2', None, 'id')): {'categories': ['16'],
+        ('ol_catalog_product.info', (96, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['16'],
                                                            'color': '61',
                                                            'cost': '29.9900',
                                                            'country_of_manufacture': None,
@@ -11698,7 +11710,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '3.0000'},
-        ('ol_catalog_product.info', (96, u'3', None, 'id')): {'categories': ['16'],
+        ('ol_catalog_product.info', (96, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['16'],
                                                            'color': '61',
                                                            'cost': '29.9900',
                                                            'country_of_manufacture': None,
@@ -11756,7 +11768,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '3.0000'},
-        ('ol_catalog_product.info', (97, None, None, 'id')): {'categories': ['16'],
+        ('ol_catalog_product.info', (97, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['16'],
                                                            'color': '61',
                                                            'cost': '29.9900',
                                                            'country_of_manufacture': None,
@@ -11814,7 +11826,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '3.0000'},
-        ('ol_catalog_product.info', (97, u'2', None, 'id')): {'categories': ['16'],
+        ('ol_catalog_product.info', (97, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['16'],
                                                            'color': '61',
                                                            'cost': '29.9900',
                                                            'country_of_manufacture': None,
@@ -11872,7 +11884,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '3.0000'},
-        ('ol_catalog_product.info', (97, u'3', None, 'id')): {'categories': ['16'],
+        ('ol_catalog_product.info', (97, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['16'],
                                                            'color': '61',
                                                            'cost': '29.9900',
                                                            'country_of_manufacture': None,
@@ -11930,7 +11942,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '3.0000'},
-        ('ol_catalog_product.info', (98, None, None, 'id')): {'categories': ['16'],
+        ('ol_catalog_product.info', (98, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['16'],
                                                            'country_of_manufacture': None,
                                                            'created_at': '2007-08-29 12:09:17',
                                                            'custom_design': '',
@@ -11981,7 +11993,7 @@ magento_base_responses = \
                                                            'url_path': 'kenneth-cole-new-york-men-s-con-verge-slip-on.html',
                                                            'visibility': '4',
                                                            'websites': ['1']},
-        ('ol_catalog_product.info', (99, None, None, 'id')): {'categories': ['16'],
+        ('ol_catalog_product.info', (99, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['16'],
                                                            'color': '24',
                                                            'cost': '29.9900',
                                                            'country_of_manufacture': None,
@@ -12039,7 +12051,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '2.0000'},
-        ('ol_catalog_product.info', (99, u'2', None, 'id')): {'categories': ['16'],
+        ('ol_catalog_product.info', (99, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['16'],
                                                            'color': '24',
                                                            'cost': '29.9900',
                                                            'country_of_manufacture': None,
@@ -12097,7 +12109,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '2.0000'},
-        ('ol_catalog_product.info', (99, u'3', None, 'id')): {'categories': ['16'],
+        ('ol_catalog_product.info', (99, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['16'],
                                                            'color': '24',
                                                            'cost': '29.9900',
                                                            'country_of_manufacture': None,
@@ -12155,7 +12167,7 @@ magento_base_responses = \
                                                            'visibility': '1',
                                                            'websites': ['1'],
                                                            'weight': '2.0000'},
-        ('ol_catalog_product.info', (100, None, None, 'id')): {'categories': ['16'],
+        ('ol_catalog_product.info', (100, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['16'],
                                                             'color': '24',
                                                             'cost': '29.9900',
                                                             'country_of_manufacture': None,
@@ -12213,7 +12225,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '2.0000'},
-        ('ol_catalog_product.info', (100, u'2', None, 'id')): {'categories': ['16'],
+        ('ol_catalog_product.info', (100, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['16'],
                                                             'color': '24',
                                                             'cost': '29.9900',
                                                             'country_of_manufacture': None,
@@ -12271,7 +12283,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '2.0000'},
-        ('ol_catalog_product.info', (100, u'3', None, 'id')): {'categories': ['16'],
+        ('ol_catalog_product.info', (100, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['16'],
                                                             'color': '24',
                                                             'cost': '29.9900',
                                                             'country_of_manufacture': None,
@@ -12329,7 +12341,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '2.0000'},
-        ('ol_catalog_product.info', (101, None, None, 'id')): {'categories': ['16'],
+        ('ol_catalog_product.info', (101, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['16'],
                                                             'color': '24',
                                                             'cost': '29.9900',
                                                             'country_of_manufacture': None,
@@ -12387,7 +12399,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '2.0000'},
-        ('ol_catalog_product.info', (101, u'2', None, 'id')): {'categories': ['16'],
+        ('ol_catalog_product.info', (101, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['16'],
                                                             'color': '24',
                                                             'cost': '29.9900',
                                                             'country_of_manufacture': None,
@@ -12445,7 +12457,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '2.0000'},
-        ('ol_catalog_product.info', (101, u'3', None, 'id')): {'categories': ['16'],
+        ('ol_catalog_product.info', (101, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['16'],
                                                             'color': '24',
                                                             'cost': '29.9900',
                                                             'country_of_manufacture': None,
@@ -12503,7 +12515,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '2.0000'},
-        ('ol_catalog_product.info', (102, None, None, 'id')): {'categories': ['16'],
+        ('ol_catalog_product.info', (102, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['16'],
                                                             'color': '24',
                                                             'cost': '29.9900',
                                                             'country_of_manufacture': None,
@@ -12561,7 +12573,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '2.0000'},
-        ('ol_catalog_product.info', (102, u'2', None, 'id')): {'categories': ['16'],
+        ('ol_catalog_product.info', (102, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['16'],
                                                             'color': '24',
                                                             'cost': '29.9900',
                                                             'country_of_manufacture': None,
@@ -12619,7 +12631,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '2.0000'},
-        ('ol_catalog_product.info', (102, u'3', None, 'id')): {'categories': ['16'],
+        ('ol_catalog_product.info', (102, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['16'],
                                                             'color': '24',
                                                             'cost': '29.9900',
                                                             'country_of_manufacture': None,
@@ -12677,7 +12689,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '2.0000'},
-        ('ol_catalog_product.info', (103, None, None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (103, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                             'country_of_manufacture': None,
                                                             'created_at': '2007-08-29 12:29:46',
                                                             'custom_design': '',
@@ -12728,7 +12740,7 @@ magento_base_responses = \
                                                             'url_path': 'steven-by-steve-madden-pryme-pump.html',
                                                             'visibility': '4',
                                                             'websites': ['1']},
-        ('ol_catalog_product.info', (104, None, None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (104, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                             'color': '26',
                                                             'cost': '29.9900',
                                                             'country_of_manufacture': None,
@@ -12786,7 +12798,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '2.0000'},
-        ('ol_catalog_product.info', (104, u'2', None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (104, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                             'color': '26',
                                                             'cost': '29.9900',
                                                             'country_of_manufacture': None,
@@ -12844,7 +12856,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '2.0000'},
-        ('ol_catalog_product.info', (104, u'3', None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (104, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                             'color': '26',
                                                             'cost': '29.9900',
                                                             'country_of_manufacture': None,
@@ -12902,7 +12914,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '2.0000'},
-        ('ol_catalog_product.info', (105, None, None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (105, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                             'color': '26',
                                                             'cost': '29.9900',
                                                             'country_of_manufacture': None,
@@ -12960,7 +12972,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '2.0000'},
-        ('ol_catalog_product.info', (105, u'2', None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (105, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                             'color': '26',
                                                             'cost': '29.9900',
                                                             'country_of_manufacture': None,
@@ -13018,7 +13030,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '2.0000'},
-        ('ol_catalog_product.info', (105, u'3', None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (105, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                             'color': '26',
                                                             'cost': '29.9900',
                                                             'country_of_manufacture': None,
@@ -13076,7 +13088,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '2.0000'},
-        ('ol_catalog_product.info', (106, None, None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (106, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                             'color': '26',
                                                             'cost': '29.9900',
                                                             'country_of_manufacture': None,
@@ -13134,7 +13146,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '2.0000'},
-        ('ol_catalog_product.info', (106, u'2', None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (106, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                             'color': '26',
                                                             'cost': '29.9900',
                                                             'country_of_manufacture': None,
@@ -13192,7 +13204,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '2.0000'},
-        ('ol_catalog_product.info', (106, u'3', None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (106, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                             'color': '26',
                                                             'cost': '29.9900',
                                                             'country_of_manufacture': None,
@@ -13250,7 +13262,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '2.0000'},
-        ('ol_catalog_product.info', (107, None, None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (107, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                             'color': '26',
                                                             'cost': '29.9900',
                                                             'country_of_manufacture': None,
@@ -13308,7 +13320,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '2.0000'},
-        ('ol_catalog_product.info', (107, u'2', None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (107, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                             'color': '26',
                                                             'cost': '29.9900',
                                                             'country_of_manufacture': None,
@@ -13366,7 +13378,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '2.0000'},
-        ('ol_catalog_product.info', (107, u'3', None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (107, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                             'color': '26',
                                                             'cost': '29.9900',
                                                             'country_of_manufacture': None,
@@ -13424,7 +13436,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '2.0000'},
-        ('ol_catalog_product.info', (108, None, None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (108, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                             'country_of_manufacture': None,
                                                             'created_at': '2007-08-29 12:52:39',
                                                             'custom_design': '',
@@ -13475,7 +13487,7 @@ magento_base_responses = \
                                                             'url_path': 'nine-west-women-s-lucero-pump.html',
                                                             'visibility': '4',
                                                             'websites': ['1']},
-        ('ol_catalog_product.info', (109, None, None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (109, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                             'color': '26',
                                                             'cost': '29.9900',
                                                             'country_of_manufacture': None,
@@ -13533,7 +13545,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '2.0000'},
-        ('ol_catalog_product.info', (109, u'2', None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (109, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                             'color': '26',
                                                             'cost': '29.9900',
                                                             'country_of_manufacture': None,
@@ -13591,7 +13603,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '2.0000'},
-        ('ol_catalog_product.info', (109, u'3', None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (109, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                             'color': '26',
                                                             'cost': '29.9900',
                                                             'country_of_manufacture': None,
@@ -13649,7 +13661,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '2.0000'},
-        ('ol_catalog_product.info', (110, None, None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (110, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                             'color': '26',
                                                             'cost': '29.9900',
                                                             'country_of_manufacture': None,
@@ -13707,7 +13719,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '2.0000'},
-        ('ol_catalog_product.info', (110, u'2', None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (110, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                             'color': '26',
                                                             'cost': '29.9900',
                                                             'country_of_manufacture': None,
@@ -13765,7 +13777,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '2.0000'},
-        ('ol_catalog_product.info', (110, u'3', None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (110, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                             'color': '26',
                                                             'cost': '29.9900',
                                                             'country_of_manufacture': None,
@@ -13823,7 +13835,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '2.0000'},
-        ('ol_catalog_product.info', (111, None, None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (111, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                             'color': '26',
                                                             'cost': '29.9900',
                                                             'country_of_manufacture': None,
@@ -13881,7 +13893,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '2.0000'},
-        ('ol_catalog_product.info', (111, u'2', None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (111, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                             'color': '26',
                                                             'cost': '29.9900',
                                                             'country_of_manufacture': None,
@@ -13939,7 +13951,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '2.0000'},
-        ('ol_catalog_product.info', (111, u'3', None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (111, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                             'color': '26',
                                                             'cost': '29.9900',
                                                             'country_of_manufacture': None,
@@ -13997,7 +14009,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '2.0000'},
-        ('ol_catalog_product.info', (112, None, None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (112, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                             'country_of_manufacture': None,
                                                             'created_at': '2007-08-29 13:17:43',
                                                             'custom_design': '',
@@ -14048,7 +14060,7 @@ magento_base_responses = \
                                                             'url_path': 'ecco-womens-golf-flexor-golf-shoe.html',
                                                             'visibility': '4',
                                                             'websites': ['1']},
-        ('ol_catalog_product.info', (113, None, None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (113, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                             'color': '59',
                                                             'cost': '29.9900',
                                                             'country_of_manufacture': None,
@@ -14106,7 +14118,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '4.0000'},
-        ('ol_catalog_product.info', (113, u'2', None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (113, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                             'color': '59',
                                                             'cost': '29.9900',
                                                             'country_of_manufacture': None,
@@ -14164,7 +14176,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '4.0000'},
-        ('ol_catalog_product.info', (113, u'3', None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (113, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                             'color': '59',
                                                             'cost': '29.9900',
                                                             'country_of_manufacture': None,
@@ -14222,7 +14234,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '4.0000'},
-        ('ol_catalog_product.info', (114, None, None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (114, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                             'color': '59',
                                                             'cost': '29.9900',
                                                             'country_of_manufacture': None,
@@ -14280,7 +14292,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '4.0000'},
-        ('ol_catalog_product.info', (114, u'2', None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (114, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                             'color': '59',
                                                             'cost': '29.9900',
                                                             'country_of_manufacture': None,
@@ -14338,7 +14350,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '4.0000'},
-        ('ol_catalog_product.info', (114, u'3', None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (114, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                             'color': '59',
                                                             'cost': '29.9900',
                                                             'country_of_manufacture': None,
@@ -14396,7 +14408,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '4.0000'},
-        ('ol_catalog_product.info', (115, None, None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (115, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                             'color': '59',
                                                             'cost': '29.9900',
                                                             'country_of_manufacture': None,
@@ -14454,7 +14466,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '4.0000'},
-        ('ol_catalog_product.info', (115, u'2', None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (115, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                             'color': '59',
                                                             'cost': '29.9900',
                                                             'country_of_manufacture': None,
@@ -14512,7 +14524,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '4.0000'},
-        ('ol_catalog_product.info', (115, u'3', None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (115, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                             'color': '59',
                                                             'cost': '29.9900',
                                                             'country_of_manufacture': None,
@@ -14570,7 +14582,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '4.0000'},
-        ('ol_catalog_product.info', (117, None, None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (117, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                             'color': '22',
                                                             'cost': '2.0000',
                                                             'country_of_manufacture': None,
@@ -14626,7 +14638,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '0.5000'},
-        ('ol_catalog_product.info', (117, u'2', None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (117, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                             'color': '22',
                                                             'cost': '2.0000',
                                                             'country_of_manufacture': None,
@@ -14682,7 +14694,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '0.5000'},
-        ('ol_catalog_product.info', (117, u'3', None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (117, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                             'color': '22',
                                                             'cost': '2.0000',
                                                             'country_of_manufacture': None,
@@ -14738,7 +14750,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '0.5000'},
-        ('ol_catalog_product.info', (118, None, None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (118, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                             'color': '22',
                                                             'cost': '2.0000',
                                                             'country_of_manufacture': None,
@@ -14794,7 +14806,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '0.5000'},
-        ('ol_catalog_product.info', (118, u'2', None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (118, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                             'color': '22',
                                                             'cost': '2.0000',
                                                             'country_of_manufacture': None,
@@ -14850,7 +14862,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '0.5000'},
-        ('ol_catalog_product.info', (118, u'3', None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (118, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                             'color': '22',
                                                             'cost': '2.0000',
                                                             'country_of_manufacture': None,
@@ -14906,7 +14918,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '0.5000'},
-        ('ol_catalog_product.info', (119, None, None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (119, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                             'country_of_manufacture': None,
                                                             'created_at': '2007-08-29 15:00:05',
                                                             'custom_design': '',
@@ -14955,7 +14967,7 @@ magento_base_responses = \
                                                             'url_path': 'coalesce-functioning-on-impatience-t-shirt.html',
                                                             'visibility': '4',
                                                             'websites': ['1']},
-        ('ol_catalog_product.info', (120, None, None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (120, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                             'country_of_manufacture': None,
                                                             'created_at': '2007-08-29 15:06:16',
                                                             'custom_design': '',
@@ -15024,7 +15036,7 @@ magento_base_responses = \
                                                             'url_path': 'ink-eater-krylon-bombear-destroyed-tee.html',
                                                             'visibility': '4',
                                                             'websites': ['1']},
-        ('ol_catalog_product.info', (121, None, None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (121, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                             'color': '60',
                                                             'cost': '2.0000',
                                                             'country_of_manufacture': None,
@@ -15080,7 +15092,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '0.5000'},
-        ('ol_catalog_product.info', (121, u'2', None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (121, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                             'color': '60',
                                                             'cost': '2.0000',
                                                             'country_of_manufacture': None,
@@ -15136,7 +15148,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '0.5000'},
-        ('ol_catalog_product.info', (121, u'3', None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (121, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                             'color': '60',
                                                             'cost': '2.0000',
                                                             'country_of_manufacture': None,
@@ -15192,7 +15204,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '0.5000'},
-        ('ol_catalog_product.info', (122, None, None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (122, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                             'color': '60',
                                                             'cost': '2.0000',
                                                             'country_of_manufacture': None,
@@ -15248,7 +15260,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '0.5000'},
-        ('ol_catalog_product.info', (122, u'2', None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (122, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                             'color': '60',
                                                             'cost': '2.0000',
                                                             'country_of_manufacture': None,
@@ -15304,7 +15316,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '0.5000'},
-        ('ol_catalog_product.info', (122, u'3', None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (122, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                             'color': '60',
                                                             'cost': '2.0000',
                                                             'country_of_manufacture': None,
@@ -15360,7 +15372,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '0.5000'},
-        ('ol_catalog_product.info', (123, None, None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (123, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                             'country_of_manufacture': None,
                                                             'created_at': '2007-08-29 15:14:29',
                                                             'custom_design': '',
@@ -15429,7 +15441,7 @@ magento_base_responses = \
                                                             'url_path': 'the-only-children-paisley-t-shirt.html',
                                                             'visibility': '4',
                                                             'websites': ['1']},
-        ('ol_catalog_product.info', (124, None, None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (124, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                             'color': '60',
                                                             'cost': '2.0000',
                                                             'country_of_manufacture': None,
@@ -15485,7 +15497,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '0.4400'},
-        ('ol_catalog_product.info', (124, u'2', None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (124, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                             'color': '60',
                                                             'cost': '2.0000',
                                                             'country_of_manufacture': None,
@@ -15541,7 +15553,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '0.4400'},
-        ('ol_catalog_product.info', (124, u'3', None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (124, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                             'color': '60',
                                                             'cost': '2.0000',
                                                             'country_of_manufacture': None,
@@ -15597,7 +15609,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '0.4400'},
-        ('ol_catalog_product.info', (125, None, None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (125, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                             'color': '60',
                                                             'cost': '2.0000',
                                                             'country_of_manufacture': None,
@@ -15653,7 +15665,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '0.4400'},
-        ('ol_catalog_product.info', (125, u'2', None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (125, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                             'color': '60',
                                                             'cost': '2.0000',
                                                             'country_of_manufacture': None,
@@ -15709,7 +15721,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '0.4400'},
-        ('ol_catalog_product.info', (125, u'3', None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (125, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                             'color': '60',
                                                             'cost': '2.0000',
                                                             'country_of_manufacture': None,
@@ -15765,7 +15777,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '0.4400'},
-        ('ol_catalog_product.info', (126, None, None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (126, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                             'country_of_manufacture': None,
                                                             'created_at': '2007-08-29 15:31:56',
                                                             'custom_design': '',
@@ -15834,7 +15846,7 @@ magento_base_responses = \
                                                             'url_path': 'zolof-the-rock-and-roll-destroyer-lol-cat-t-shirt.html',
                                                             'visibility': '4',
                                                             'websites': ['1']},
-        ('ol_catalog_product.info', (127, None, None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (127, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                             'color': '22',
                                                             'cost': '2.0000',
                                                             'country_of_manufacture': None,
@@ -15890,7 +15902,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '0.4400'},
-        ('ol_catalog_product.info', (127, u'2', None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (127, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                             'color': '22',
                                                             'cost': '2.0000',
                                                             'country_of_manufacture': None,
@@ -15946,7 +15958,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '0.4400'},
-        ('ol_catalog_product.info', (127, u'3', None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (127, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                             'color': '22',
                                                             'cost': '2.0000',
                                                             'country_of_manufacture': None,
@@ -16002,7 +16014,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '0.4400'},
-        ('ol_catalog_product.info', (128, None, None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (128, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                             'color': '26',
                                                             'cost': '2.0000',
                                                             'country_of_manufacture': None,
@@ -16058,7 +16070,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '0.4400'},
-        ('ol_catalog_product.info', (128, u'2', None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (128, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                             'color': '26',
                                                             'cost': '2.0000',
                                                             'country_of_manufacture': None,
@@ -16114,7 +16126,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '0.4400'},
-        ('ol_catalog_product.info', (128, u'3', None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (128, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                             'color': '26',
                                                             'cost': '2.0000',
                                                             'country_of_manufacture': None,
@@ -16170,7 +16182,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '0.4400'},
-        ('ol_catalog_product.info', (129, None, None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (129, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                             'color': '22',
                                                             'cost': '2.0000',
                                                             'country_of_manufacture': None,
@@ -16226,7 +16238,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '0.4400'},
-        ('ol_catalog_product.info', (129, u'2', None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (129, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                             'color': '22',
                                                             'cost': '2.0000',
                                                             'country_of_manufacture': None,
@@ -16282,7 +16294,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '0.4400'},
-        ('ol_catalog_product.info', (129, u'3', None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (129, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                             'color': '22',
                                                             'cost': '2.0000',
                                                             'country_of_manufacture': None,
@@ -16338,7 +16350,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '0.4400'},
-        ('ol_catalog_product.info', (130, None, None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (130, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                             'color': '26',
                                                             'cost': '2.0000',
                                                             'country_of_manufacture': None,
@@ -16394,7 +16406,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '0.4400'},
-        ('ol_catalog_product.info', (130, u'2', None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (130, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                             'color': '26',
                                                             'cost': '2.0000',
                                                             'country_of_manufacture': None,
@@ -16450,7 +16462,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '0.4400'},
-        ('ol_catalog_product.info', (130, u'3', None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (130, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                             'color': '26',
                                                             'cost': '2.0000',
                                                             'country_of_manufacture': None,
@@ -16506,7 +16518,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '0.4400'},
-        ('ol_catalog_product.info', (131, None, None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (131, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                             'color': '22',
                                                             'cost': '2.0000',
                                                             'country_of_manufacture': None,
@@ -16562,7 +16574,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '0.4400'},
-        ('ol_catalog_product.info', (131, u'2', None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (131, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                             'color': '22',
                                                             'cost': '2.0000',
                                                             'country_of_manufacture': None,
@@ -16618,7 +16630,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '0.4400'},
-        ('ol_catalog_product.info', (131, u'3', None, 'id')): {'categories': ['4'],
+        ('ol_catalog_product.info', (131, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['4'],
                                                             'color': '22',
                                                             'cost': '2.0000',
                                                             'country_of_manufacture': None,
@@ -16674,7 +16686,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '0.4400'},
-        ('ol_catalog_product.info', (132, None, None, 'id')): {'categories': ['25'],
+        ('ol_catalog_product.info', (132, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['25'],
                                                             'color': None,
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -16727,7 +16739,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '42.0000'},
-        ('ol_catalog_product.info', (132, u'2', None, 'id')): {'categories': ['25'],
+        ('ol_catalog_product.info', (132, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['25'],
                                                             'color': None,
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -16780,7 +16792,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '42.0000'},
-        ('ol_catalog_product.info', (132, u'3', None, 'id')): {'categories': ['25'],
+        ('ol_catalog_product.info', (132, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['25'],
                                                             'color': None,
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -16833,7 +16845,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '42.0000'},
-        ('ol_catalog_product.info', (133, None, None, 'id')): {'categories': ['25'],
+        ('ol_catalog_product.info', (133, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['25'],
                                                             'color': None,
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -16886,7 +16898,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': None},
-        ('ol_catalog_product.info', (133, u'2', None, 'id')): {'categories': ['25'],
+        ('ol_catalog_product.info', (133, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['25'],
                                                             'color': None,
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -16939,7 +16951,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': None},
-        ('ol_catalog_product.info', (133, u'3', None, 'id')): {'categories': ['25'],
+        ('ol_catalog_product.info', (133, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['25'],
                                                             'color': None,
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -16992,7 +17004,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': None},
-        ('ol_catalog_product.info', (134, None, None, 'id')): {'categories': ['25'],
+        ('ol_catalog_product.info', (134, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['25'],
                                                             'color': None,
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -17045,7 +17057,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '5.0000'},
-        ('ol_catalog_product.info', (134, u'2', None, 'id')): {'categories': ['25'],
+        ('ol_catalog_product.info', (134, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['25'],
                                                             'color': None,
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -17098,7 +17110,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '5.0000'},
-        ('ol_catalog_product.info', (134, u'3', None, 'id')): {'categories': ['25'],
+        ('ol_catalog_product.info', (134, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['25'],
                                                             'color': None,
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -17151,7 +17163,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '5.0000'},
-        ('ol_catalog_product.info', (135, None, None, 'id')): {'categories': ['17'],
+        ('ol_catalog_product.info', (135, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['17'],
                                                             'country_of_manufacture': None,
                                                             'created_at': '2007-08-30 11:22:53',
                                                             'custom_design': '',
@@ -17202,7 +17214,7 @@ magento_base_responses = \
                                                             'url_path': 'anashria-womens-premier-leather-sandal.html',
                                                             'visibility': '4',
                                                             'websites': ['1']},
-        ('ol_catalog_product.info', (137, None, None, 'id')): {'categories': [],
+        ('ol_catalog_product.info', (137, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': [],
                                                             'color': '24',
                                                             'cost': '2.0000',
                                                             'country_of_manufacture': None,
@@ -17258,7 +17270,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '0.4400'},
-        ('ol_catalog_product.info', (137, u'2', None, 'id')): {'categories': [],
+        ('ol_catalog_product.info', (137, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': [],
                                                             'color': '24',
                                                             'cost': '2.0000',
                                                             'country_of_manufacture': None,
@@ -17314,7 +17326,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '0.4400'},
-        ('ol_catalog_product.info', (137, u'3', None, 'id')): {'categories': [],
+        ('ol_catalog_product.info', (137, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': [],
                                                             'color': '24',
                                                             'cost': '2.0000',
                                                             'country_of_manufacture': None,
@@ -17370,7 +17382,7 @@ magento_base_responses = \
                                                             'visibility': '1',
                                                             'websites': ['1'],
                                                             'weight': '0.4400'},
-        ('ol_catalog_product.info', (138, None, None, 'id')): {'categories': ['32'],
+        ('ol_catalog_product.info', (138, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['32'],
                                                             'color': '24',
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -17423,7 +17435,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '10.0000'},
-        ('ol_catalog_product.info', (138, u'2', None, 'id')): {'categories': ['32'],
+        ('ol_catalog_product.info', (138, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['32'],
                                                             'color': '24',
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -17476,7 +17488,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '10.0000'},
-        ('ol_catalog_product.info', (138, u'3', None, 'id')): {'categories': ['32'],
+        ('ol_catalog_product.info', (138, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['32'],
                                                             'color': '24',
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -17529,7 +17541,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '10.0000'},
-        ('ol_catalog_product.info', (139, None, None, 'id')): {'categories': ['32'],
+        ('ol_catalog_product.info', (139, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['32'],
                                                             'color': '23',
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -17582,7 +17594,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '10.0000'},
-        ('ol_catalog_product.info', (139, u'2', None, 'id')): {'categories': ['32'],
+        ('ol_catalog_product.info', (139, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['32'],
                                                             'color': '23',
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -17635,7 +17647,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '10.0000'},
-        ('ol_catalog_product.info', (139, u'3', None, 'id')): {'categories': ['32'],
+        ('ol_catalog_product.info', (139, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['32'],
                                                             'color': '23',
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -17688,7 +17700,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '10.0000'},
-        ('ol_catalog_product.info', (140, None, None, 'id')): {'categories': ['15',
+        ('ol_catalog_product.info', (140, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['15',
                                                                            '31'],
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -17742,7 +17754,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (140, u'2', None, 'id')): {'categories': ['15',
+        ('ol_catalog_product.info', (140, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['15',
                                                                            '31'],
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -17796,7 +17808,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (140, u'3', None, 'id')): {'categories': ['15',
+        ('ol_catalog_product.info', (140, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['15',
                                                                            '31'],
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -17850,7 +17862,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (141, None, None, 'id')): {'categories': ['15',
+        ('ol_catalog_product.info', (141, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['15',
                                                                            '31'],
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -17904,7 +17916,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (141, u'2', None, 'id')): {'categories': ['15',
+        ('ol_catalog_product.info', (141, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['15',
                                                                            '31'],
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -17958,7 +17970,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (141, u'3', None, 'id')): {'categories': ['15',
+        ('ol_catalog_product.info', (141, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['15',
                                                                            '31'],
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -18012,7 +18024,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (142, None, None, 'id')): {'categories': [],
+        ('ol_catalog_product.info', (142, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': [],
                                                             'cost': None,
                                                             'created_at': '2008-07-25 01:02:54',
                                                             'custom_design': '',
@@ -18061,7 +18073,7 @@ magento_base_responses = \
                                                             'url_path': '1-year-extended-warranty-parts-and-labor.html',
                                                             'visibility': '1',
                                                             'websites': ['1']},
-        ('ol_catalog_product.info', (143, None, None, 'id')): {'categories': ['15',
+        ('ol_catalog_product.info', (143, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['15',
                                                                            '31'],
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -18115,7 +18127,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (143, u'2', None, 'id')): {'categories': ['15',
+        ('ol_catalog_product.info', (143, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['15',
                                                                            '31'],
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -18169,7 +18181,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (143, u'3', None, 'id')): {'categories': ['15',
+        ('ol_catalog_product.info', (143, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['15',
                                                                            '31'],
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -18223,7 +18235,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (144, None, None, 'id')): {'categories': [],
+        ('ol_catalog_product.info', (144, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': [],
                                                             'cost': None,
                                                             'created_at': '2008-07-25 01:06:02',
                                                             'custom_design': '',
@@ -18272,7 +18284,7 @@ magento_base_responses = \
                                                             'url_path': '1-year-extended-warranty-parts-and-labor-144.html',
                                                             'visibility': '1',
                                                             'websites': ['1']},
-        ('ol_catalog_product.info', (145, None, None, 'id')): {'categories': ['33'],
+        ('ol_catalog_product.info', (145, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['33'],
                                                             'cost': None,
                                                             'country_of_manufacture': None,
                                                             'cpu_speed': '113',
@@ -18325,7 +18337,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (145, u'2', None, 'id')): {'categories': ['33'],
+        ('ol_catalog_product.info', (145, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['33'],
                                                             'cost': None,
                                                             'country_of_manufacture': None,
                                                             'cpu_speed': '113',
@@ -18378,7 +18390,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (145, u'3', None, 'id')): {'categories': ['33'],
+        ('ol_catalog_product.info', (145, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['33'],
                                                             'cost': None,
                                                             'country_of_manufacture': None,
                                                             'cpu_speed': '113',
@@ -18431,7 +18443,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (146, None, None, 'id')): {'categories': [],
+        ('ol_catalog_product.info', (146, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': [],
                                                             'cost': None,
                                                             'created_at': '2008-07-25 01:07:50',
                                                             'custom_design': '',
@@ -18480,7 +18492,7 @@ magento_base_responses = \
                                                             'url_path': '1-year-extended-warranty-parts-and-labor-146.html',
                                                             'visibility': '1',
                                                             'websites': ['1']},
-        ('ol_catalog_product.info', (147, None, None, 'id')): {'categories': ['30'],
+        ('ol_catalog_product.info', (147, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['30'],
                                                             'contrast_ratio': '110',
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -18536,7 +18548,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (147, u'2', None, 'id')): {'categories': ['30'],
+        ('ol_catalog_product.info', (147, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['30'],
                                                             'contrast_ratio': '110',
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -18592,7 +18604,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (147, u'3', None, 'id')): {'categories': ['30'],
+        ('ol_catalog_product.info', (147, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['30'],
                                                             'contrast_ratio': '110',
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -18648,7 +18660,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (148, None, None, 'id')): {'categories': ['33'],
+        ('ol_catalog_product.info', (148, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['33'],
                                                             'cost': None,
                                                             'country_of_manufacture': None,
                                                             'cpu_speed': '115',
@@ -18701,7 +18713,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (148, u'2', None, 'id')): {'categories': ['33'],
+        ('ol_catalog_product.info', (148, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['33'],
                                                             'cost': None,
                                                             'country_of_manufacture': None,
                                                             'cpu_speed': '115',
@@ -18754,7 +18766,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (148, u'3', None, 'id')): {'categories': ['33'],
+        ('ol_catalog_product.info', (148, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['33'],
                                                             'cost': None,
                                                             'country_of_manufacture': None,
                                                             'cpu_speed': '115',
@@ -18807,7 +18819,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (149, None, None, 'id')): {'categories': ['29'],
+        ('ol_catalog_product.info', (149, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['29'],
                                                             'cost': None,
                                                             'country_of_manufacture': None,
                                                             'created_at': '2008-07-25 01:12:44',
@@ -18861,7 +18873,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (149, u'2', None, 'id')): {'categories': ['29'],
+        ('ol_catalog_product.info', (149, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['29'],
                                                             'cost': None,
                                                             'country_of_manufacture': None,
                                                             'created_at': '2008-07-25 01:12:44',
@@ -18915,7 +18927,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (149, u'3', None, 'id')): {'categories': ['29'],
+        ('ol_catalog_product.info', (149, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['29'],
                                                             'cost': None,
                                                             'country_of_manufacture': None,
                                                             'created_at': '2008-07-25 01:12:44',
@@ -18969,7 +18981,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (150, None, None, 'id')): {'categories': ['29'],
+        ('ol_catalog_product.info', (150, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['29'],
                                                             'cost': None,
                                                             'country_of_manufacture': None,
                                                             'created_at': '2008-07-25 01:12:44',
@@ -19023,7 +19035,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (150, u'2', None, 'id')): {'categories': ['29'],
+        ('ol_catalog_product.info', (150, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['29'],
                                                             'cost': None,
                                                             'country_of_manufacture': None,
                                                             'created_at': '2008-07-25 01:12:44',
@@ -19077,7 +19089,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (150, u'3', None, 'id')): {'categories': ['29'],
+        ('ol_catalog_product.info', (150, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['29'],
                                                             'cost': None,
                                                             'country_of_manufacture': None,
                                                             'created_at': '2008-07-25 01:12:44',
@@ -19131,7 +19143,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (151, None, None, 'id')): {'categories': ['33'],
+        ('ol_catalog_product.info', (151, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['33'],
                                                             'cost': None,
                                                             'country_of_manufacture': None,
                                                             'cpu_speed': '112',
@@ -19184,7 +19196,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (151, u'2', None, 'id')): {'categories': ['33'],
+        ('ol_catalog_product.info', (151, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['33'],
                                                             'cost': None,
                                                             'country_of_manufacture': None,
                                                             'cpu_speed': '112',
@@ -19237,7 +19249,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (151, u'3', None, 'id')): {'categories': ['33'],
+        ('ol_catalog_product.info', (151, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['33'],
                                                             'cost': None,
                                                             'country_of_manufacture': None,
                                                             'cpu_speed': '112',
@@ -19290,7 +19302,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (152, None, None, 'id')): {'categories': ['30'],
+        ('ol_catalog_product.info', (152, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['30'],
                                                             'contrast_ratio': '106',
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -19346,7 +19358,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (152, u'2', None, 'id')): {'categories': ['30'],
+        ('ol_catalog_product.info', (152, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['30'],
                                                             'contrast_ratio': '106',
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -19402,7 +19414,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (152, u'3', None, 'id')): {'categories': ['30'],
+        ('ol_catalog_product.info', (152, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['30'],
                                                             'contrast_ratio': '106',
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -19458,7 +19470,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (153, None, None, 'id')): {'categories': ['33'],
+        ('ol_catalog_product.info', (153, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['33'],
                                                             'cost': None,
                                                             'country_of_manufacture': None,
                                                             'cpu_speed': '114',
@@ -19511,7 +19523,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (153, u'2', None, 'id')): {'categories': ['33'],
+        ('ol_catalog_product.info', (153, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['33'],
                                                             'cost': None,
                                                             'country_of_manufacture': None,
                                                             'cpu_speed': '114',
@@ -19564,7 +19576,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (153, u'3', None, 'id')): {'categories': ['33'],
+        ('ol_catalog_product.info', (153, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['33'],
                                                             'cost': None,
                                                             'country_of_manufacture': None,
                                                             'cpu_speed': '114',
@@ -19617,7 +19629,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (154, None, None, 'id')): {'categories': ['29'],
+        ('ol_catalog_product.info', (154, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['29'],
                                                             'cost': None,
                                                             'country_of_manufacture': None,
                                                             'created_at': '2008-07-25 01:16:03',
@@ -19671,7 +19683,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (154, u'2', None, 'id')): {'categories': ['29'],
+        ('ol_catalog_product.info', (154, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['29'],
                                                             'cost': None,
                                                             'country_of_manufacture': None,
                                                             'created_at': '2008-07-25 01:16:03',
@@ -19725,7 +19737,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (154, u'3', None, 'id')): {'categories': ['29'],
+        ('ol_catalog_product.info', (154, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['29'],
                                                             'cost': None,
                                                             'country_of_manufacture': None,
                                                             'created_at': '2008-07-25 01:16:03',
@@ -19779,7 +19791,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (155, None, None, 'id')): {'categories': ['29'],
+        ('ol_catalog_product.info', (155, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['29'],
                                                             'cost': None,
                                                             'country_of_manufacture': None,
                                                             'created_at': '2008-07-25 01:16:03',
@@ -19833,7 +19845,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (155, u'2', None, 'id')): {'categories': ['29'],
+        ('ol_catalog_product.info', (155, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['29'],
                                                             'cost': None,
                                                             'country_of_manufacture': None,
                                                             'created_at': '2008-07-25 01:16:03',
@@ -19887,7 +19899,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (155, u'3', None, 'id')): {'categories': ['29'],
+        ('ol_catalog_product.info', (155, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['29'],
                                                             'cost': None,
                                                             'country_of_manufacture': None,
                                                             'created_at': '2008-07-25 01:16:03',
@@ -19941,7 +19953,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (156, None, None, 'id')): {'categories': ['30'],
+        ('ol_catalog_product.info', (156, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['30'],
                                                             'contrast_ratio': '106',
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -19997,7 +20009,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (156, u'2', None, 'id')): {'categories': ['30'],
+        ('ol_catalog_product.info', (156, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['30'],
                                                             'contrast_ratio': '106',
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -20053,7 +20065,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (156, u'3', None, 'id')): {'categories': ['30'],
+        ('ol_catalog_product.info', (156, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['30'],
                                                             'contrast_ratio': '106',
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -20109,7 +20121,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (157, None, None, 'id')): {'categories': ['30'],
+        ('ol_catalog_product.info', (157, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['30'],
                                                             'contrast_ratio': '107',
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -20165,7 +20177,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (157, u'2', None, 'id')): {'categories': ['30'],
+        ('ol_catalog_product.info', (157, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['30'],
                                                             'contrast_ratio': '107',
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -20221,7 +20233,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (157, u'3', None, 'id')): {'categories': ['30'],
+        ('ol_catalog_product.info', (157, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['30'],
                                                             'contrast_ratio': '107',
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -20277,7 +20289,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (158, None, None, 'id')): {'_bundle_data': {'options': []},
+        ('ol_catalog_product.info', (158, None, PRODUCT_ATTRIBUTES, 'id')): {'_bundle_data': {'options': []},
                                                             'categories': ['28'],
                                                             'country_of_manufacture': None,
                                                             'created_at': '2008-07-25 01:21:23',
@@ -20331,7 +20343,7 @@ magento_base_responses = \
                                                             'websites': ['1'],
                                                             'weight': None,
                                                             'weight_type': '0'},
-        ('ol_catalog_product.info', (159, None, None, 'id')): {'categories': ['34'],
+        ('ol_catalog_product.info', (159, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['34'],
                                                             'color': None,
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -20384,7 +20396,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (159, u'2', None, 'id')): {'categories': ['34'],
+        ('ol_catalog_product.info', (159, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['34'],
                                                             'color': None,
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -20437,7 +20449,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (159, u'3', None, 'id')): {'categories': ['34'],
+        ('ol_catalog_product.info', (159, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['34'],
                                                             'color': None,
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -20490,7 +20502,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (160, None, None, 'id')): {'categories': ['34'],
+        ('ol_catalog_product.info', (160, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['34'],
                                                             'color': '59',
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -20543,7 +20555,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (160, u'2', None, 'id')): {'categories': ['34'],
+        ('ol_catalog_product.info', (160, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['34'],
                                                             'color': '59',
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -20596,7 +20608,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (160, u'3', None, 'id')): {'categories': ['34'],
+        ('ol_catalog_product.info', (160, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['34'],
                                                             'color': '59',
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -20649,7 +20661,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (161, None, None, 'id')): {'categories': ['34'],
+        ('ol_catalog_product.info', (161, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['34'],
                                                             'color': None,
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -20702,7 +20714,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (161, u'2', None, 'id')): {'categories': ['34'],
+        ('ol_catalog_product.info', (161, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['34'],
                                                             'color': None,
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -20755,7 +20767,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (161, u'3', None, 'id')): {'categories': ['34'],
+        ('ol_catalog_product.info', (161, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['34'],
                                                             'color': None,
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -20808,7 +20820,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (162, None, None, 'id')): {'categories': ['34'],
+        ('ol_catalog_product.info', (162, None, PRODUCT_ATTRIBUTES, 'id')): {'categories': ['34'],
                                                             'color': '24',
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -20861,7 +20873,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (162, u'2', None, 'id')): {'categories': ['34'],
+        ('ol_catalog_product.info', (162, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['34'],
                                                             'color': '24',
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -20914,7 +20926,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (162, u'3', None, 'id')): {'categories': ['34'],
+        ('ol_catalog_product.info', (162, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'categories': ['34'],
                                                             'color': '24',
                                                             'cost': None,
                                                             'country_of_manufacture': None,
@@ -20967,7 +20979,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '1.0000'},
-        ('ol_catalog_product.info', (163, None, None, 'id')): {'_bundle_data': {'options': []},
+        ('ol_catalog_product.info', (163, None, PRODUCT_ATTRIBUTES, 'id')): {'_bundle_data': {'options': []},
                                                             'categories': ['15', '27'],
                                                             'country_of_manufacture': None,
                                                             'created_at': '2008-07-25 01:34:24',
@@ -21021,7 +21033,7 @@ magento_base_responses = \
                                                             'websites': ['1'],
                                                             'weight': None,
                                                             'weight_type': '0'},
-        ('ol_catalog_product.info', (164, None, None, 'id')): {'_bundle_data': {'options': []},
+        ('ol_catalog_product.info', (164, None, PRODUCT_ATTRIBUTES, 'id')): {'_bundle_data': {'options': []},
                                                             'categories': ['27'],
                                                             'country_of_manufacture': None,
                                                             'created_at': '2008-07-25 01:36:33',
@@ -21075,7 +21087,7 @@ magento_base_responses = \
                                                             'websites': ['1'],
                                                             'weight': '20.0000',
                                                             'weight_type': '1'},
-        ('ol_catalog_product.info', (165, None, None, 'id')): {'_bundle_data': {'options': []},
+        ('ol_catalog_product.info', (165, None, PRODUCT_ATTRIBUTES, 'id')): {'_bundle_data': {'options': []},
                                                             'categories': ['27'],
                                                             'country_of_manufacture': None,
                                                             'created_at': '2008-07-25 01:40:27',
@@ -21129,7 +21141,7 @@ magento_base_responses = \
                                                             'websites': ['1'],
                                                             'weight': '10.0000',
                                                             'weight_type': '1'},
-        ('ol_catalog_product.info', (166, None, None, 'id')): {'activation_information': '',
+        ('ol_catalog_product.info', (166, None, PRODUCT_ATTRIBUTES, 'id')): {'activation_information': '',
                                                             'categories': ['8'],
                                                             'color': '24',
                                                             'cost': None,
@@ -21186,7 +21198,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '0.3000'},
-        ('ol_catalog_product.info', (166, u'2', None, 'id')): {'activation_information': '',
+        ('ol_catalog_product.info', (166, u'2', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'activation_information': '',
                                                             'categories': ['8'],
                                                             'color': '24',
                                                             'cost': None,
@@ -21243,7 +21255,7 @@ magento_base_responses = \
                                                             'visibility': '4',
                                                             'websites': ['1'],
                                                             'weight': '0.3000'},
-        ('ol_catalog_product.info', (166, u'3', None, 'id')): {'activation_information': '',
+        ('ol_catalog_product.info', (166, u'3', PRODUCT_TRANSLATION_ATTRIBUTES, 'id')): {'activation_information': '',
                                                             'categories': ['8'],
                                                             'color': '24',
                                                             'cost': None,
@@ -19,17 +19,24 @@
 #
 ##############################################################################
 
+import hashlib
+import json
+import threading
 import urllib2
 import mock
+import psycopg2
+import unittest2
 from base64 import b64encode
 
 from openerp.addons.magentoerpconnect.unit.import_synchronizer import (
     import_batch, import_record)
+from openerp.addons.connector.exception import RetryableJobError
 from openerp.addons.connector.session import ConnectorSession
 import openerp.tests.common as common
 from .common import mock_api, MockResponseImage
 from .test_data import magento_base_responses
 from .test_data_product import simple_product_and_images
+from openerp.addons.magentoerpconnect import product
 from openerp.addons.magentoerpconnect.product import (
     CatalogImageImporter,
     ProductProductAdapter,
@@ -92,13 +99,14 @@ class test_import_product_image(common.TransactionCase):
         """ An image responds a 404 error, skip and take the first valid """
         env = mock.MagicMock()
         env.get_connector_unit.return_value = ProductProductAdapter(env)
+        env.session.browse.return_value.image_sync_data = False
         importer = CatalogImageImporter(env)
         url_tee1 = ('http://localhost:9100/media/catalog/product'
                     '/i/n/ink-eater-krylon-bombear-destroyed-tee-1.jpg')
         url_tee2 = ('http://localhost:9100/media/catalog/product/'
                     'i/n/ink-eater-krylon-bombear-destroyed-tee-2.jpg')
         with mock.patch('urllib2.urlopen') as urlopen:
-            def image_url_response(url):
+            def image_url_response(url, timeout=None):
                 if url in (url_tee1, url_tee2):
                     raise urllib2.HTTPError(url, 404, '404', None, None)
                 else:
@@ -108,21 +116,22 @@ class test_import_product_image(common.TransactionCase):
             with mock_api(simple_product_and_images):
                 importer.run(122, 999)
 
-        env.session.write.assert_called_with(mock.ANY,
-                                             999,
-                                             {'image': B64_PNG_IMG_4PX_GREEN})
+        env.session.write.assert_called_with(
+            mock.ANY, 999, {'image': B64_PNG_IMG_4PX_GREEN,
+                            'image_sync_data': mock.ANY})
 
     def test_import_images_403(self):
         """ Import a product when an image respond a 403 error, should fail """
         env = mock.MagicMock()
         env.get_connector_unit.return_value = ProductProductAdapter(env)
+        env.session.browse.return_value.image_sync_data = False
         importer = CatalogImageImporter(env)
         url_tee1 = ('http://localhost:9100/media/catalog/product'
                     '/i/n/ink-eater-krylon-bombear-destroyed-tee-1.jpg')
         url_tee2 = ('http://localhost:9100/media/catalog/product/'
                     'i/n/ink-eater-krylon-bombear-destroyed-tee-2.jpg')
         with mock.patch('urllib2.urlopen') as urlopen:
-            def image_url_response(url):
+            def image_url_response(url, timeout=None):
                 url = url.get_full_url()
                 if url == url_tee2:
                     raise urllib2.HTTPError(url, 404, '404', None, None)
@@ -135,3 +144,158 @@ class test_import_product_image(common.TransactionCase):
             with mock_api(simple_product_and_images):
                 with self.assertRaises(urllib2.HTTPError):
                     importer.run(122, 999)
+
+
+class test_image_download(unittest2.TestCase):
+    """ Test the conditional and concurrent downloads of the images """
+
+    def setUp(self):
+        super(test_image_download, self).setUp()
+        self.env = mock.MagicMock()
+        self.env.backend_record.auth_basic_username = False
+        self.importer = CatalogImageImporter(self.env)
+        self.images = [{'url': u'http://localhost/%s.png' % name,
+                        'types': [], 'position': position}
+                       for name, position in (('a', '3'), ('b', '2'),
+                                              ('c', '1'))]
+        self.importer._get_images = mock.Mock(return_value=self.images)
+        self.binding = self.env.session.browse.return_value
+
+    def _run(self, urlopen):
+        with mock.patch('urllib2.urlopen') as patched:
+            patched.side_effect = urlopen
+            self.importer.run(122, 999)
+        return patched
+
+    def test_concurrent(self):
+        """ The image with the higher priority is written """
+        self.binding.image_sync_data = False
+
+        def urlopen(request, timeout=None):
+            return MockResponseImage(request.get_full_url())
+        self._run(urlopen)
+        self.env.session.write.assert_called_once_with(
+            mock.ANY, 999, {'image': b64encode('http://localhost/c.png'),
+                            'image_attachment_id': mock.ANY,
+                            'image_sync_data': mock.ANY})
+        values = self.env.session.write.call_args[0][2]
+        self.assertEquals(json.loads(values['image_sync_data'])['url'],
+                          'http://localhost/c.png')
+
+    def test_not_modified(self):
+        """ A conditional request is sent for the last imported image """
+        self.binding.image_sync_data = json.dumps(
+            {'url': 'http://localhost/c.png', 'etag': '"42"',
+             'modified': None, 'hash': 'x'})
+
+        def urlopen(request, timeout=None):
+            if request.get_header('If-none-match') == '"42"':
+                raise urllib2.HTTPError(request.get_full_url(), 304,
+                                        'Not Modified', None, None)
+            return MockResponseImage(PNG_IMG_4PX_GREEN)
+        self._run(urlopen)
+        self.assertFalse(self.env.session.write.called)
+
+    def test_same_content(self):
+        """ An image with the same content is not written again """
+        self.binding.image_sync_data = json.dumps(
+            {'url': 'http://localhost/c.png', 'etag': None,
+             'modified': None,
+             'hash': hashlib.sha256(PNG_IMG_4PX_GREEN).hexdigest()})
+
+        def urlopen(request, timeout=None):
+            return MockResponseImage(PNG_IMG_4PX_GREEN)
+        self._run(urlopen)
+        self.assertFalse(self.env.session.write.called)
+
+    def _download(self, response, cancelled=None):
+        request = urllib2.Request('http://localhost/a.png')
+        with mock.patch('urllib2.urlopen', return_value=response), \
+                mock.patch.object(product.tempfile,
+                                  'TemporaryFile') as temporary_file:
+            result = CatalogImageImporter._download_image(request,
+                                                          cancelled)
+        return result, temporary_file.return_value
+
+    def test_read_error(self):
+        """ The temporary file is closed when the download fails """
+        response = mock.Mock(name='response')
+        response.read.side_effect = IOError('timeout')
+        result, image_file = self._download(response)
+        self.assertIsInstance(result, IOError)
+        image_file.close.assert_called_once_with()
+
+    def test_cancelled(self):
+        """ A download is skipped or stopped once cancelled """
+        cancelled = threading.Event()
+
+        def read(size):
+            cancelled.set()
+            return 'data'
+        response = mock.Mock(name='response')
+        response.read.side_effect = read
+        result, image_file = self._download(response, cancelled)
+        self.assertIsNone(result)
+        self.assertEquals(response.read.call_count, 1)
+        image_file.close.assert_called_once_with()
+        with mock.patch('urllib2.urlopen') as urlopen:
+            self.assertIsNone(CatalogImageImporter._download_image(
+                urllib2.Request('http://localhost/b.png'), cancelled))
+        self.assertFalse(urlopen.called)
+
+    def test_stored_concurrently(self):
+        """ The job is retried when the image is stored concurrently """
+        self.binding.image_sync_data = False
+
+        class UniqueViolation(psycopg2.IntegrityError):
+            pgcode = psycopg2.errorcodes.UNIQUE_VIOLATION
+        self.env.session.write.side_effect = UniqueViolation()
+
+        def urlopen(request, timeout=None):
+            return MockResponseImage(PNG_IMG_4PX_GREEN)
+        with self.assertRaises(RetryableJobError):
+            self._run(urlopen)
+
+
+class test_image_store(unittest2.TestCase):
+    """ Test the store of the images of the products """
+
+    def setUp(self):
+        super(test_image_store, self).setUp()
+        self.model = product.magento_product_product()
+        self.model.pool = mock.MagicMock(name='pool')
+        self.attachment_obj = self.model.pool.__getitem__.return_value
+        self.digest = hashlib.sha256(PNG_IMG_4PX_GREEN).hexdigest()
+
+    def test_store_new_image(self):
+        """ An image is stored in an attachment named by its SHA-256 """
+        self.attachment_obj.search.return_value = []
+        self.attachment_obj.create.return_value = 8
+        attachment_id = self.model._store_image(
+            mock.sentinel.cr, 1, B64_PNG_IMG_4PX_GREEN)
+        self.assertEquals(attachment_id, 8)
+        self.assertEquals(self.attachment_obj.create.call_args[0][2],
+                          {'name': self.digest,
+                           'res_model': 'magento.product.product',
+                           'datas': B64_PNG_IMG_4PX_GREEN,
+                           'datas_fname': self.digest})
+
+    def test_store_existing_image(self):
+        """ An image with the same content is stored once """
+        self.attachment_obj.search.return_value = [7]
+        attachment_id = self.model._store_image(
+            mock.sentinel.cr, 1, B64_PNG_IMG_4PX_GREEN)
+        self.assertEquals(attachment_id, 7)
+        self.assertIn(('name', '=', self.digest),
+                      self.attachment_obj.search.call_args[0][2])
+        self.assertFalse(self.attachment_obj.create.called)
+
+    def test_cleanup(self):
+        """ The images no longer used by a binding are deleted """
+        cr = mock.Mock(name='cursor')
+        cr.fetchall.return_value = [(7,), (8,)]
+        self.model._scheduler_cleanup_image_store(cr, 1)
+        query, params = cr.execute.call_args[0]
+        self.assertIn('NOT EXISTS', query)
+        self.assertEquals(params, ('magento.product.product',))
+        self.assertEquals(self.attachment_obj.unlink.call_args[0][2], [7, 8])
@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+##############################################################################
+#
+#    Author: Guewen Baconnier
+#    Copyright 2014 Camptocamp SA
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Affero General Public License as
+#    published by the Free Software Foundation, either version 3 of the
+#    License, or (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Affero General Public License for more details.
+#
+#    You should have received a copy of the GNU Affero General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+##############################################################################
+
+
+import xmlrpclib
+from datetime import datetime, timedelta
+
+import mock
+import unittest2
+
+from openerp.tools import DEFAULT_SERVER_DATETIME_FORMAT
+from openerp.addons.magentoerpconnect import magento_model, product
+
+
+class test_inventory_export(unittest2.TestCase):
+    """ Test the export of the inventory of several products """
+
+    def setUp(self):
+        super(test_inventory_export, self).setUp()
+        environment = mock.MagicMock(name='environment')
+        self.exporter = product.ProductInventoryExport(environment)
+        self.exporter.session = mock.MagicMock(name='session')
+        self.exporter.model = mock.Mock(name='model')
+        self.exporter.model._name = 'magento.product.product'
+        self.products = []
+        for binding_id, qty in ((1, 10.0), (2, 0.0), (3, 4.0)):
+            record = mock.Mock(name='product %s' % binding_id)
+            record.id = binding_id
+            record.magento_qty = qty
+            self.products.append(record)
+        self.exporter.session.browse.return_value = self.products
+        self.binder = mock.Mock(name='binder')
+        self.binder.to_backend.side_effect = {1: '101', 2: None, 3: '103'}.get
+        self.adapter = mock.Mock(name='adapter')
+
+    def _run_many(self):
+        with mock.patch.object(product.ProductInventoryExport,
+                               'get_binder_for_model',
+                               return_value=self.binder, create=True), \
+                mock.patch.object(product.ProductInventoryExport,
+                                  'backend_adapter', self.adapter,
+                                  create=True), \
+                mock.patch.object(product, 'delay_export_product_inventory',
+                                  return_value=('uuid', True)) as delay:
+            self.exporter.run_many([1, 2, 3], ['magento_qty'])
+        return delay
+
+    def test_run_many(self):
+        """ The inventories are sent in one request """
+        self.adapter.update_inventory_many.return_value = [True, True]
+        delay = self._run_many()
+        self.adapter.update_inventory_many.assert_called_once_with(
+            [('101', {'qty': 10.0, 'is_in_stock': 1}),
+             ('103', {'qty': 4.0, 'is_in_stock': 1})])
+        self.assertFalse(delay.called)
+
+    def test_run_many_failure(self):
+        """ A failing product is exported in its own job """
+        self.adapter.update_inventory_many.return_value = [
+            True, xmlrpclib.Fault(1, 'boom')]
+        delay = self._run_many()
+        delay.assert_called_once_with(
+            self.exporter.session, 'magento.product.product', 3,
+            fields=['magento_qty'], priority=20)
+
+
+class test_inventory_coalescing(unittest2.TestCase):
+    """ Test the coalescing of the inventory exports of a product """
+
+    def test_merge_fields(self):
+        """ The fields of the waiting job are merged with the new ones """
+        merged = product._merge_inventory_kwargs(
+            {'fields': ['magento_qty']},
+            {'fields': ['backorders', 'magento_qty']})
+        self.assertEquals(merged, {'fields': ['magento_qty', 'backorders']})
+
+    def test_delay(self):
+        """ The jobs are delayed with an identity key per binding """
+        session = mock.MagicMock(name='session')
+        with mock.patch.object(product, 'delay_unique',
+                               return_value=('uuid', False)) as delay:
+            product.delay_export_product_inventory(
+                session, 'magento.product.product', 7,
+                fields=['magento_qty'], priority=20)
+        delay.assert_called_once_with(
+            session, product.export_product_inventory,
+            'export_product_inventory:magento.product.product,7',
+            ('magento.product.product', 7),
+            {'fields': ['magento_qty'], 'priority': 20},
+            merge=product._merge_inventory_kwargs,
+            states=(product.PENDING, product.ENQUEUED))
+
+
+class test_stock_computation(unittest2.TestCase):
+    """ Test the computation of the quantities on the stock moves """
+
+    def setUp(self):
+        super(test_stock_computation, self).setUp()
+        self.model = product.magento_product_product()
+        self.model._table = 'magento_product_product'
+        self.model.pool = mock.MagicMock(name='pool')
+        self.uom = self.model.pool['product.uom']
+        self.cr = mock.Mock(name='cursor')
+        self.backend = mock.Mock(name='backend')
+        self.backend.id = 1
+
+    def test_stock_move_quantities(self):
+        """ The quantities of all the products are read in one query """
+        self.model.pool['stock.location'].search.return_value = [12, 13]
+        # product 5 has moves in its unit and in a unit of 12
+        self.cr.fetchall.return_value = [(4, 1, 1, 3.0),
+                                         (5, 1, 1, -2.0),
+                                         (5, 2, 1, 1.0)]
+        self.uom._compute_qty.return_value = 12.0
+        quantities = self.model._stock_move_quantities(
+            self.cr, 1, self.backend, mock.Mock(id=12), ('done',))
+        self.assertEquals(quantities, {4: 3.0, 5: 10.0})
+        self.assertEquals(self.cr.execute.call_count, 1)
+        params = self.cr.execute.call_args[0][1]
+        self.assertEquals(params, {'locations': (12, 13),
+                                   'states': ('done',),
+                                   'backend_id': 1})
+        self.uom._compute_qty.assert_called_once_with(self.cr, 1, 2, 1.0, 1)
+
+    def test_changes_sql(self):
+        """ The 'sql' stock computation uses the quantities of the moves
+        and still calls ``_magento_qty`` """
+        self.backend.product_stock_engine = 'sql'
+        self.backend.product_stock_field_id.name = 'qty_available'
+        self.model.read = mock.Mock(return_value=[
+            {'id': 1, 'openerp_id': (4, 'A'), 'magento_qty': 3.0},
+            {'id': 2, 'openerp_id': (5, 'B'), 'magento_qty': 3.0},
+            {'id': 3, 'openerp_id': (6, 'C'), 'magento_qty': 1.0}])
+        self.model._stock_move_quantities = mock.Mock(
+            return_value={4: 3.0, 5: 10.0})
+        with mock.patch.object(product.magento_product_product,
+                               '_magento_qty',
+                               side_effect=lambda cr, uid, record, *args,
+                               **kwargs: record['qty_available']) as hook:
+            binding_ids, quantities = self.model._magento_qty_changes(
+                self.cr, 1, self.backend, [{'id': 1}, {'id': 2}, {'id': 3}])
+        self.assertEquals(list(binding_ids), [2, 3])
+        self.assertEquals(list(quantities), [10.0, 0.0])
+        self.assertEquals(hook.call_count, 3)
+        self.model._stock_move_quantities.assert_called_once_with(
+            self.cr, 1, self.backend, self.backend.warehouse_id.lot_stock_id,
+            ('done',), context={})
+        self.assertEquals(self.model.read.call_args[0][3],
+                          ['magento_qty', 'openerp_id'])
+
+
+class test_incremental_stock_sync(unittest2.TestCase):
+    """ Test the stock synchronization of the products moved since the
+    last run """
+
+    def setUp(self):
+        super(test_incremental_stock_sync, self).setUp()
+        self.model = magento_model.magento_backend()
+        self.model.pool = mock.MagicMock(name='pool')
+        self.product_model = self.model.pool.get.return_value
+        self.model.write = mock.Mock(name='write')
+        self.model.update_product_stock_qty = mock.Mock(name='full')
+        self.cr = mock.Mock(name='cursor')
+        self.backend = mock.Mock(name='backend')
+        self.backend.id = 1
+        self.model.browse = mock.Mock(return_value=[self.backend])
+        now = datetime.now()
+        fmt = DEFAULT_SERVER_DATETIME_FORMAT
+        self.recent = (now - timedelta(hours=1)).strftime(fmt)
+        self.old = (now - timedelta(days=2)).strftime(fmt)
+
+    def test_moved_products(self):
+        """ Only the products of the moves modified are recomputed """
+        self.backend.stock_moves_sync_date = self.recent
+        self.backend.stock_full_sync_date = self.recent
+        self.cr.fetchall.return_value = [(4,), (5,)]
+        self.product_model.search.return_value = [14, 15]
+        self.model.update_product_stock_qty_incremental(self.cr, 1, [1])
+        self.assertEquals(self.cr.execute.call_args[0][1], (self.recent,))
+        domain = self.product_model.search.call_args[0][2]
+        self.assertIn(('openerp_id', 'in', [4, 5]), domain)
+        self.product_model.recompute_magento_qty.assert_called_once_with(
+            self.cr, 1, [14, 15], context=None)
+        self.assertFalse(self.model.update_product_stock_qty.called)
+        values = self.model.write.call_args[0][3]
+        self.assertEquals(values.keys(), ['stock_moves_sync_date'])
+        self.assertTrue(values['stock_moves_sync_date'] > self.recent)
+
+    def test_full_reconciliation(self):
+        """ All the products are recomputed once in the interval """
+        self.backend.stock_moves_sync_date = self.recent
+        self.backend.stock_full_sync_date = self.old
+        self.model.update_product_stock_qty_incremental(self.cr, 1, [1])
+        self.assertFalse(self.cr.execute.called)
+        self.model.update_product_stock_qty.assert_called_once_with(
+            self.cr, 1, [1], context=None)
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+##############################################################################
+#
+#    Author: Guewen Baconnier
+#    Copyright 2014 Camptocamp SA
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Affero General Public License as
+#    published by the Free Software Foundation, either version 3 of the
+#    License, or (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Affero General Public License for more details.
+#
+#    You should have received a copy of the GNU Affero General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+##############################################################################
+
+
+import mock
+import unittest2
+
+from openerp.addons.connector.unit.mapper import (mapping,
+                                                  changed_by,
+                                                  ExportMapper)
+from openerp.addons.magentoerpconnect import consumer
+from openerp.addons.magentoerpconnect.unit.mapper import export_source_fields
+
+
+def convert(field, conv_type):
+    def modifier(self, record, to_attr):
+        return conv_type(record[field])
+    return modifier
+
+
+class test_export_source_fields(unittest2.TestCase):
+    """ Test the fields read by the export mappers """
+
+    def test_declared_fields(self):
+        """ Fields of the direct mappings and @changed_by """
+        class MyMapper(ExportMapper):
+            direct = [('name', 'name'),
+                      (convert('weight', float), 'weight')]
+
+            @changed_by('list_price', 'currency_id')
+            @mapping
+            def price(self, record):
+                return {}
+
+            @changed_by()
+            @mapping
+            def constant(self, record):
+                return {'status': 1}
+
+        self.assertEquals(export_source_fields(MyMapper),
+                          frozenset(['name', 'weight', 'list_price',
+                                     'currency_id']))
+
+    def test_undeclared_mapping(self):
+        """ A @mapping without @changed_by may read any field """
+        class MyMapper(ExportMapper):
+            direct = [('name', 'name')]
+
+            @mapping
+            def price(self, record):
+                return {}
+
+        self.assertIsNone(export_source_fields(MyMapper))
+
+    def test_inherited_mapping(self):
+        """ The @changed_by of the parent classes are used """
+        class MyMapper(ExportMapper):
+            @changed_by('list_price')
+            @mapping
+            def price(self, record):
+                return {}
+
+        class MySubMapper(MyMapper):
+            direct = [('name', 'name')]
+
+            @changed_by('currency_id')
+            @mapping
+            def price(self, record):
+                return {}
+
+        self.assertEquals(export_source_fields(MySubMapper),
+                          frozenset(['name', 'list_price', 'currency_id']))
+
+
+class test_export_needed(unittest2.TestCase):
+    """ Test the filter of the writes in the consumers """
+
+    def test_export_needed(self):
+        """ The writes on fields not mapped are not exported """
+        class MyMapper(ExportMapper):
+            direct = [('name', 'name')]
+
+        session = mock.Mock(name='session')
+        binding = mock.Mock(name='binding', magento_id='42')
+        env = mock.Mock(name='environment')
+        env.get_connector_unit.return_value = MyMapper(env)
+        with mock.patch.object(consumer, 'get_environment',
+                               return_value=env):
+            self.assertTrue(
+                consumer._export_needed(session, binding, ['name', 'ean13']))
+            self.assertFalse(
+                consumer._export_needed(session, binding, ['ean13']))
+            # not exported yet: always exported
+            binding.magento_id = False
+            self.assertTrue(
+                consumer._export_needed(session, binding, ['ean13']))
@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+##############################################################################
+#
+#    Author: Guewen Baconnier
+#    Copyright 2014 Camptocamp SA
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Affero General Public License as
+#    published by the Free Software Foundation, either version 3 of the
+#    License, or (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Affero General Public License for more details.
+#
+#    You should have received a copy of the GNU Affero General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+##############################################################################
+
+
+import mock
+import unittest2
+
+from openerp.addons.magentoerpconnect import consumer, queue_job
+from openerp.addons.magentoerpconnect.queue_job import delay_unique
+from openerp.addons.magentoerpconnect.unit import import_synchronizer
+from openerp.addons.magentoerpconnect.unit import export_synchronizer
+from openerp.addons.magentoerpconnect.unit.export_synchronizer import (
+    delay_export_record,
+)
+from openerp.addons.magentoerpconnect.unit.import_synchronizer import (
+    delay_import_record,
+    import_identity_key,
+)
+
+
+class test_delay_unique(unittest2.TestCase):
+    """ Test the identity keys on the jobs """
+
+    def setUp(self):
+        super(test_delay_unique, self).setUp()
+        self.session = mock.MagicMock(name='session')
+        self.job_model = self.session.pool.__getitem__.return_value
+        self.job_model.search.return_value = []
+        self.job_func = mock.Mock(name='job_func')
+        self.job_func.delay.return_value = 'new-uuid'
+        patcher = mock.patch.object(queue_job, 'OpenERPJobStorage')
+        self.storage = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+
+    def _waiting(self, state, kwargs):
+        """ Simulate a waiting job """
+        self.job_model.search.return_value = [10]
+        self.job_model.read.return_value = [
+            {'id': 10, 'uuid': 'waiting-uuid', 'state': state,
+             'identity_key': 'key'}]
+        job = mock.Mock(name='job', uuid='waiting-uuid', kwargs=kwargs)
+        self.storage.load.return_value = job
+        return job
+
+    def test_no_waiting_job(self):
+        """ A job is delayed and its identity key is stored """
+        self.job_model.search.side_effect = [[], [42]]
+        result = delay_unique(self.session, self.job_func, 'key',
+                              ('model', 1), {'priority': 5})
+        self.assertEquals(result, ('new-uuid', True))
+        self.job_func.delay.assert_called_once_with(self.session, 'model', 1,
+                                                    priority=5)
+        self.assertEquals(self.job_model.write.call_args[0][2], [42])
+        self.assertEquals(self.job_model.write.call_args[0][3],
+                          {'identity_key': 'key'})
+
+    def test_waiting_job(self):
+        """ No job is delayed when an equivalent job is waiting """
+        self._waiting('started', {})
+        result = delay_unique(self.session, self.job_func, 'key',
+                              ('model', 1), {'priority': 5})
+        self.assertEquals(result, ('waiting-uuid', False))
+        self.assertFalse(self.job_func.delay.called)
+
+    def test_merge_pending_job(self):
+        """ The arguments are merged into a pending job """
+        job = self._waiting('pending', {'force': False})
+        result = delay_import_record(self.session, 'model', 1, 42,
+                                     force=True)
+        self.assertEquals(result, ('waiting-uuid', False))
+        self.assertEquals(job.kwargs, {'force': True})
+        self.storage.store.assert_called_once_with(job)
+        self.assertFalse(self.job_func.delay.called)
+
+    def test_merge_started_job(self):
+        """ A new job is delayed when a running job must be promoted """
+        self._waiting('started', {'force': False})
+        self.job_model.search.side_effect = [[10], [42]]
+        with mock.patch.object(import_synchronizer,
+                               'import_record') as job_func:
+            job_func.delay.return_value = 'new-uuid'
+            result = delay_import_record(self.session, 'model', 1, 42,
+                                         force=True)
+        self.assertEquals(result, ('new-uuid', True))
+        self.assertFalse(self.storage.store.called)
+
+    def test_merge_export_fields(self):
+        """ The fields of a new export are merged in the pending one """
+        job = self._waiting('pending', {'fields': ['name', 'price']})
+        result = delay_export_record(self.session, 'model', 42,
+                                     fields=['price', 'weight'])
+        self.assertEquals(result, ('waiting-uuid', False))
+        self.assertEquals(job.kwargs, {'fields': ['name', 'price', 'weight']})
+
+    def test_merge_export_all_fields(self):
+        """ An export of all the fields is promoted to a full export """
+        job = self._waiting('pending', {'fields': ['name']})
+        delay_export_record(self.session, 'model', 42, fields=None)
+        self.assertEquals(job.kwargs, {'fields': None})
+        self.storage.store.assert_called_once_with(job)
+        self.storage.store.reset_mock()
+        job = self._waiting('pending', {'fields': None})
+        delay_export_record(self.session, 'model', 42, fields=['name'])
+        self.assertEquals(job.kwargs, {'fields': None})
+        self.assertFalse(self.storage.store.called)
+
+    def test_export_started_not_considered(self):
+        """ The started exports are not looked for """
+        self.job_model.search.side_effect = [[], [42]]
+        with mock.patch.object(export_synchronizer,
+                               'export_record') as job_func:
+            job_func.delay.return_value = 'new-uuid'
+            result = delay_export_record(self.session, 'model', 42,
+                                         fields=['name'])
+        self.assertEquals(result, ('new-uuid', True))
+        domain = self.job_model.search.call_args_list[0][0][2]
+        self.assertIn(('state', 'in', ['pending', 'enqueued']), domain)
+
+    def test_postpone_pending_job(self):
+        """ The eta of a pending job is postponed by a new delay """
+        job = self._waiting('pending', {'fields': ['name']})
+        result = delay_export_record(self.session, 'model', 42,
+                                     fields=['name'], eta=30)
+        self.assertEquals(result, ('waiting-uuid', False))
+        self.assertEquals(job.eta, 30)
+        self.storage.store.assert_called_once_with(job)
+
+    def test_export_debounce(self):
+        """ The exports are delayed according to the binding model """
+        binding = mock.Mock(name='binding', id=42, magento_id=False)
+        binding._model._name = 'model'
+        self.session.pool.__getitem__.return_value._export_debounce = 30
+        with mock.patch.object(consumer, 'delay_export_record') as delay:
+            consumer._delay_export(self.session, binding, ['name'])
+        delay.assert_called_once_with(self.session, 'model', 42,
+                                      fields=['name'], eta=30)
+        self.session.pool.__getitem__.return_value._export_debounce = 0
+        with mock.patch.object(consumer, 'delay_export_record') as delay:
+            consumer._delay_export(self.session, binding, ['name'])
+        delay.assert_called_once_with(self.session, 'model', 42,
+                                      fields=['name'])
+
+    def test_import_identity_key(self):
+        """ The identity key does not depend on the type of the ID """
+        self.assertEquals(import_identity_key('model', 1, 42),
+                          import_identity_key('model', 1, '42'))
+
+    def test_record_keys(self):
+        """ The keys of the records of a job are found while it waits """
+        self.job_model.search.return_value = [42]
+        queue_job.set_record_keys(self.session, 'uuid', ['key1', 'key2'])
+        self.assertEquals(self.job_model.write.call_args[0][3],
+                          {'record_key_ids': [(0, 0, {'name': 'key1'}),
+                                              (0, 0, {'name': 'key2'})]})
+        self.job_model.read.return_value = [{'id': 1, 'name': 'key2'}]
+        keys = queue_job.find_waiting_record_keys(self.session,
+                                                  ['key2', 'key3'])
+        self.assertEquals(keys, set(['key2']))
+        domain = self.job_model.search.call_args[0][2]
+        self.assertIn(('name', 'in', ['key2', 'key3']), domain)
+
+    def test_merge_enqueued_meanwhile(self):
+        """ A job enqueued since it has been read is not modified """
+        self._waiting('pending', {'force': False})
+        self.job_model.search.side_effect = [[10], [42]]
+        self.session.cr.fetchone.return_value = None
+        with mock.patch.object(import_synchronizer,
+                               'import_record') as job_func:
+            job_func.delay.return_value = 'new-uuid'
+            result = delay_import_record(self.session, 'model', 1, 42,
+                                         force=True)
+        self.assertEquals(result, ('new-uuid', True))
+        self.assertFalse(self.storage.store.called)
+        query, params = self.session.cr.execute.call_args_list[1][0]
+        self.assertIn('FOR UPDATE NOWAIT', query)
+        self.assertEquals(params, ('waiting-uuid', 'pending'))
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+##############################################################################
+#
+#    Author: Guewen Baconnier
+#    Copyright 2014 Camptocamp SA
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Affero General Public License as
+#    published by the Free Software Foundation, either version 3 of the
+#    License, or (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Affero General Public License for more details.
+#
+#    You should have received a copy of the GNU Affero General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+##############################################################################
+
+
+import mock
+import unittest2
+
+from openerp.addons.connector.exception import RetryableJobError
+from openerp.addons.magentoerpconnect.unit import export_synchronizer
+from openerp.addons.magentoerpconnect.unit import record_lock
+
+
+class test_record_lock(unittest2.TestCase):
+    """ Test the advisory locks of the records """
+
+    def setUp(self):
+        super(test_record_lock, self).setUp()
+        record_lock.lock_stats.reset()
+        self.cr = mock.Mock(name='cursor')
+
+    def _acquire(self, result):
+        self.cr.fetchone.return_value = (result,)
+        return record_lock.acquire_record_lock(
+            self.cr, 1, 'magento.product.product', 42)
+
+    def test_key(self):
+        """ The keys are signed 64 bits integers, distinct by record """
+        key = record_lock.record_lock_key(1, 'magento.product.product', 42)
+        self.assertTrue(-2 ** 63 <= key < 2 ** 63)
+        self.assertEquals(
+            key, record_lock.record_lock_key(1, 'magento.product.product', 42))
+        self.assertNotEquals(
+            key, record_lock.record_lock_key(2, 'magento.product.product', 42))
+        self.assertNotEquals(
+            key, record_lock.record_lock_key(1, 'product.product', 42))
+
+    def test_acquire(self):
+        """ The lock is acquired """
+        self.assertTrue(self._acquire(True))
+        key = record_lock.record_lock_key(1, 'magento.product.product', 42)
+        self.cr.execute.assert_called_once_with(
+            "SELECT pg_try_advisory_xact_lock(%s)", (key,))
+        self.assertEquals(record_lock.lock_stats.as_dict()['acquired'], 1)
+        self.assertEquals(record_lock.lock_stats.as_dict()['held'], 0)
+
+    def test_held(self):
+        """ A lock held by another transaction is not waited for """
+        self.assertFalse(self._acquire(False))
+        self.assertEquals(self.cr.execute.call_count, 1)
+        stats = record_lock.lock_stats.as_dict()
+        self.assertEquals(stats['held'], 1)
+        self.assertEquals(stats['acquired'], 0)
+
+    def test_log_stats(self):
+        """ The counters are logged at most once per interval """
+        with mock.patch.object(record_lock, '_logger') as logger, \
+                mock.patch.object(record_lock.time, 'time') as now:
+            now.return_value = record_lock.lock_stats._logged_at + 1
+            self._acquire(True)
+            self.assertFalse(logger.info.called)
+            now.return_value += record_lock.LOCK_STATS_LOG_INTERVAL
+            self._acquire(False)
+            self._acquire(True)
+        logger.info.assert_called_once_with(
+            'Record locks: %s', 'acquired 1, held 1, unique_violations 0')
+
+
+class test_exporter_lock(unittest2.TestCase):
+    """ Test the locks taken by the exporters """
+
+    def setUp(self):
+        super(test_exporter_lock, self).setUp()
+        environment = mock.MagicMock(name='environment')
+        environment.backend_record.id = 1
+        self.exporter = export_synchronizer.MagentoExporter(environment)
+        self.exporter.model = mock.Mock(_name='magento.product.product')
+        self.exporter.binding_id = 42
+
+    def test_lock_held(self):
+        """ The export does not wait for a lock held, it is retried """
+        with mock.patch.object(export_synchronizer, 'acquire_record_lock',
+                               return_value=False) as acquire:
+            self.assertRaises(RetryableJobError, self.exporter._lock)
+        acquire.assert_called_once_with(self.exporter.session.cr, 1,
+                                        'magento.product.product', 42)
+
+    def test_dependency_binding_lock_held(self):
+        """ The binding of a dependency is not created when another job
+        is creating it """
+        relation = mock.Mock(name='product.category', id=7)
+        relation._model._name = 'product.category'
+        self.exporter.session.search.return_value = []
+        with mock.patch.object(export_synchronizer, 'acquire_record_lock',
+                               return_value=False) as acquire:
+            self.assertRaises(RetryableJobError,
+                              self.exporter._get_dependency_binding_id,
+                              relation, 'magento.product.category')
+        self.assertEquals(acquire.call_args[0][2:], ('product.category', 7))
+        self.assertFalse(self.exporter.session.create.called)
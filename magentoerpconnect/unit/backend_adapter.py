@@ -19,20 +19,39 @@
 #
 ##############################################################################
 
+import copy
 import socket
 import logging
+import threading
+import time
 import xmlrpclib
 
 import magento as magentolib
 from openerp.addons.connector.unit.backend_adapter import CRUDAdapter
 from openerp.addons.connector.exception import (NetworkRetryableError,
-                                                RetryableJobError)
+                                                RetryableJobError,
+                                                IDMissingInBackend)
 from datetime import datetime
+from .transport import get_transport
 _logger = logging.getLogger(__name__)
 
 
 MAGENTO_DATETIME_FORMAT = '%Y/%m/%d %H:%M:%S'
 
+# fault returned by Magento when the session id is no longer valid
+SESSION_EXPIRED_FAULT = 5
+
+API_POOL_MAX_SIZE = 10  # idle sessions kept by the pool
+API_POOL_IDLE_TTL = 600  # seconds
+
+# maximum number of calls sent in one ``multiCall`` request
+MULTI_CALL_CHUNK_SIZE = 100
+
+# number of records expected in a page of a paginated search
+SEARCH_PAGE_SIZE = 500
+# highest value of the Magento ids (int(10) unsigned columns)
+MAX_ENTITY_ID = 4294967295
+
 
 recorder = {}
 
@@ -79,7 +98,7 @@ def output_recorder(filename):
 class MagentoLocation(object):
 
     def __init__(self, location, username, password,
-                 use_custom_api_path=False):
+                 use_custom_api_path=False, transport=None):
         self._location = location
         self.username = username
         self.password = password
@@ -88,6 +107,22 @@ class MagentoLocation(object):
         self.use_auth_basic = False
         self.auth_basic_username = None
         self.auth_basic_password = None
+        self._transport = transport
+
+    @property
+    def transport(self):
+        """ XML-RPC transport used to reach the API
+
+        By default, a transport keeping the HTTP connections alive,
+        shared between the threads.
+        """
+        if self._transport is None:
+            return get_transport(self.location)
+        return self._transport
+
+    @transport.setter
+    def transport(self, transport):
+        self._transport = transport
 
     @property
     def location(self):
@@ -101,9 +136,138 @@ class MagentoLocation(object):
         return location
 
 
+class MagentoAPIPool(object):
+    """ Per-process pool of authenticated sessions on the Magento API.
+
+    Opening a :class:`magento.API` context logs in on Magento, so
+    without the pool each call pays a ``login`` round trip. The pool
+    keeps the logged in sessions between the calls, per location and
+    credentials, and logs in again when Magento says that a session
+    has expired.
+
+    A session is used by one thread at a time: it is taken from the
+    pool for a call and given back once the call is done. At most
+    ``max_size`` idle sessions are kept, the sessions idle for more
+    than ``idle_ttl`` seconds are closed.
+    """
+
+    def __init__(self, max_size=API_POOL_MAX_SIZE,
+                 idle_ttl=API_POOL_IDLE_TTL):
+        self.max_size = max_size
+        self.idle_ttl = idle_ttl
+        self._lock = threading.Lock()
+        # list of (key, api, last use), the most recently used at the end
+        self._idle = []
+
+    @staticmethod
+    def _key(magento):
+        return (magento.location,
+                magento.username,
+                magento.password,
+                magento.use_custom_api_path)
+
+    def _login(self, magento):
+        api = magentolib.API(magento.location,
+                             magento.username,
+                             magento.password,
+                             full_url=magento.use_custom_api_path,
+                             transport=magento.transport)
+        return api.__enter__()
+
+    def _logout(self, api):
+        try:
+            api.__exit__(None, None, None)
+        except Exception:
+            # the session may already be expired on Magento
+            _logger.debug('Failed to end a Magento session', exc_info=True)
+
+    def _acquire(self, key, magento):
+        api = None
+        with self._lock:
+            limit = time.time() - self.idle_ttl
+            expired = [item[1] for item in self._idle if item[2] < limit]
+            self._idle = [item for item in self._idle if item[2] >= limit]
+            for index in reversed(xrange(len(self._idle))):
+                if self._idle[index][0] == key:
+                    api = self._idle.pop(index)[1]
+                    break
+        for expired_api in expired:
+            self._logout(expired_api)
+        if api is None:
+            api = self._login(magento)
+        return api
+
+    def _release(self, key, api):
+        with self._lock:
+            self._idle.append((key, api, time.time()))
+            overflow = len(self._idle) - self.max_size
+            evicted = []
+            if overflow > 0:
+                evicted = [item[1] for item in self._idle[:overflow]]
+                del self._idle[:overflow]
+        for evicted_api in evicted:
+            self._logout(evicted_api)
+
+    def _execute(self, magento, operation):
+        """ Execute ``operation(api)`` with a session of the pool """
+        key = self._key(magento)
+        api = self._acquire(key, magento)
+        try:
+            try:
+                result = operation(api)
+            except xmlrpclib.Fault as err:
+                if err.faultCode != SESSION_EXPIRED_FAULT:
+                    raise
+                _logger.debug('Magento session expired, login again')
+                api.__enter__()
+                result = operation(api)
+        except xmlrpclib.Fault:
+            # the session is still valid after an error of the API
+            self._release(key, api)
+            raise
+        # on other errors (network, ...), the session is not given
+        # back to the pool because we don't know its state
+        self._release(key, api)
+        return result
+
+    def call(self, magento, method, arguments):
+        """ Call a method of the Magento API using a pooled session
+
+        :param magento: location and credentials of the Magento
+        :type magento: :class:`MagentoLocation`
+        """
+        return self._execute(magento,
+                             lambda api: api.call(method, arguments))
+
+    def multi_call(self, magento, calls):
+        """ Send several calls in one ``multiCall`` request using a
+        pooled session
+
+        :param magento: location and credentials of the Magento
+        :type magento: :class:`MagentoLocation`
+        :param calls: list of ``[method, arguments]``
+        """
+        return self._execute(magento, lambda api: api.multiCall(calls))
+
+    def clear(self):
+        """ Close all the idle sessions """
+        with self._lock:
+            idle = self._idle
+            self._idle = []
+        for __, api, __ in idle:
+            self._logout(api)
+
+
+api_pool = MagentoAPIPool()
+
+
 class MagentoCRUDAdapter(CRUDAdapter):
     """ External Records Adapter for Magento """
 
+    # fault codes returned by the Magento API when the record
+    # does not exist, they are raised as ``IDMissingInBackend``
+    _id_missing_fault_codes = ()
+
     def __init__(self, environment):
         """
 
@@ -149,33 +313,21 @@ class MagentoCRUDAdapter(CRUDAdapter):
         """ Delete a record on the external system """
         raise NotImplementedError
 
-    def _call(self, method, arguments):
+    @staticmethod
+    def _clean_arguments(arguments):
+        # When Magento is installed on PHP 5.4+, the API
+        # may return garble data if the arguments contain
+        # trailing None.
+        if isinstance(arguments, list):
+            while arguments and arguments[-1] is None:
+                arguments.pop()
+        return arguments
+
+    def _execute(self, operation):
+        """ Execute ``operation()`` which calls the Magento API and
+        convert the network errors to retryable errors """
         try:
-            custom_url = self.magento.use_custom_api_path
-            _logger.debug("Start calling Magento api %s", method)
-            with magentolib.API(self.magento.location,
-                                self.magento.username,
-                                self.magento.password,
-                                full_url=custom_url) as api:
-                # When Magento is installed on PHP 5.4+, the API
-                # may return garble data if the arguments contain
-                # trailing None.
-                if isinstance(arguments, list):
-                    while arguments and arguments[-1] is None:
-                        arguments.pop()
-                start = datetime.now()
-                try:
-                    result = api.call(method, arguments)
-                except:
-                    _logger.debug("api.call(%s, %s) failed", method, arguments)
-                    raise
-                else:
-                    _logger.debug("api.call(%s, %s) returned %s in %s seconds",
-                                  method, arguments, result,
-                                  (datetime.now() - start).seconds)
-                # Uncomment to record requests/responses in ``recorder``
-                # record(method, arguments, result)
-                return result
+            return operation()
         except (socket.gaierror, socket.error, socket.timeout) as err:
             raise NetworkRetryableError(
                 'A network error caused the failure of the job: '
@@ -194,12 +346,90 @@ class MagentoCRUDAdapter(CRUDAdapter):
             else:
                 raise
 
+    def _call(self, method, arguments):
+        try:
+            _logger.debug("Start calling Magento api %s", method)
+            arguments = self._clean_arguments(arguments)
+            start = datetime.now()
+            try:
+                result = self._execute(
+                    lambda: api_pool.call(self.magento, method, arguments))
+            except Exception:
+                _logger.debug("api.call(%s, %s) failed", method, arguments)
+                raise
+            else:
+                _logger.debug("api.call(%s, %s) returned %s in %s seconds",
+                              method, arguments, result,
+                              (datetime.now() - start).seconds)
+            # Uncomment to record requests/responses in ``recorder``
+            # record(method, arguments, result)
+            return result
+        except xmlrpclib.Fault as err:
+            if err.faultCode in self._id_missing_fault_codes:
+                raise IDMissingInBackend
+            raise
+
+    def _multi_call(self, calls):
+        """ Send several calls to the Magento API in ``multiCall``
+        requests, by chunks of ``MULTI_CALL_CHUNK_SIZE`` calls.
+
+        A fault on a call does not stop the others. The failed calls
+        get the exception that :meth:`_call` would have raised
+        (``IDMissingInBackend`` or ``xmlrpclib.Fault``) in place of
+        their result.
+
+        :param calls: list of ``(method, arguments)``
+        :return: list of the results in the same order than ``calls``
+        """
+        calls = [[method, self._clean_arguments(arguments)]
+                 for method, arguments in calls]
+        results = []
+        for index in xrange(0, len(calls), MULTI_CALL_CHUNK_SIZE):
+            chunk = calls[index:index + MULTI_CALL_CHUNK_SIZE]
+            _logger.debug("Start calling Magento api multiCall with "
+                          "%d calls", len(chunk))
+            start = datetime.now()
+            try:
+                chunk_results = self._execute(
+                    lambda: api_pool.multi_call(self.magento, chunk))
+            except Exception:
+                _logger.debug("api.multiCall(%s) failed", chunk)
+                raise
+            else:
+                _logger.debug("api.multiCall(%s) returned %s in %s seconds",
+                              chunk, chunk_results,
+                              (datetime.now() - start).seconds)
+            results += [self._multi_call_result(result)
+                        for result in chunk_results]
+        return results
+
+    def _multi_call_result(self, result):
+        """ Return the result of a call of a ``multiCall`` or the
+        exception for a fault """
+        if not (isinstance(result, dict) and result.get('isFault')):
+            return result
+        code = result.get('faultCode')
+        try:
+            # the codes are sometimes returned as strings
+            code = int(code)
+        except (TypeError, ValueError):
+            pass
+        if code in self._id_missing_fault_codes:
+            return IDMissingInBackend(result.get('faultMessage'))
+        return xmlrpclib.Fault(code, result.get('faultMessage'))
+
 
 class GenericAdapter(MagentoCRUDAdapter):
 
     _model_name = None
     _magento_model = None
     _admin_path = None
+    # field used to paginate the searches by ranges of ids, when
+    # None, the searches are done in one page
+    _cursor_field = None
+    # key of the ID in the rows returned by ``search_read``, when set
+    # with ``_cursor_field``, ``read_updated_at`` uses ``search_read``
+    _list_id_field = None
 
     def search(self, filters=None):
         """ Search records according to some criterias
@@ -234,6 +464,65 @@ class GenericAdapter(MagentoCRUDAdapter):
         and returns their information"""
         return self._call('%s.list' % self._magento_model, [filters])
 
+    def search_pages(self, filters=None, page_size=SEARCH_PAGE_SIZE,
+                     **kwargs):
+        """ Search records according to some criterias, page by page
+
+        The keyword arguments are given to :meth:`search`.
+        See :meth:`_paginate`.
+
+        :return: generator of lists of ids
+        """
+        return self._paginate(self.search, filters, page_size, **kwargs)
+
+    def search_read_pages(self, filters=None, page_size=SEARCH_PAGE_SIZE,
+                          **kwargs):
+        """ Search records according to some criterias and returns
+        their information, page by page
+
+        The keyword arguments are given to :meth:`search_read`.
+        See :meth:`_paginate`.
+
+        :return: generator of lists of records
+        """
+        return self._paginate(self.search_read, filters, page_size,
+                              **kwargs)
+
+    def _paginate(self, method, filters, page_size, **kwargs):
+        """ Call a search ``method`` on successive ranges of ids
+
+        The Magento API has no limit / offset on the searches, so the
+        pages are ranges of ``_cursor_field``. The ids are sparse, the
+        width of the range is adapted after each page so it returns
+        about ``page_size`` records: it grows on the gaps and shrinks
+        on the dense parts. A page can still be bigger than
+        ``page_size`` when a large range ends on a dense part.
+
+        Without ``_cursor_field``, the search is done in one page.
+        """
+        if not self._cursor_field:
+            records = method(filters, **kwargs)
+            if records:
+                yield records
+            return
+        lower = 1
+        width = page_size
+        while lower <= MAX_ENTITY_ID:
+            upper = min(lower + width - 1, MAX_ENTITY_ID)
+            # the search methods modify the filters in place
+            page_filters = copy.deepcopy(filters) if filters else {}
+            page_filters[self._cursor_field] = {'from': lower, 'to': upper}
+            records = method(page_filters, **kwargs)
+            if records:
+                yield records
+            lower = upper + 1
+            if not records:
+                width *= 8
+            elif len(records) < page_size // 2:
+                width *= 2
+            elif len(records) > page_size * 2:
+                width = max(width * page_size // len(records), 1)
+
     def create(self, data):
         """ Create a record on the external system """
         return self._call('%s.create' % self._magento_model, [data])
@@ -243,6 +532,61 @@ class GenericAdapter(MagentoCRUDAdapter):
         return self._call('%s.update' % self._magento_model,
                           [int(id), data])
 
+    def read_many(self, ids, attributes=None):
+        """ Returns the information of several records in one request
+
+        :return: list of dict, or the exception for the records
+                 which could not be read
+        :rtype: list
+        """
+        calls = []
+        for id in ids:
+            arguments = [int(id)]
+            if attributes:
+                arguments.append(attributes)
+            calls.append(('%s.info' % self._magento_model, arguments))
+        return self._multi_call(calls)
+
+    def read_updated_at(self, ids):
+        """ Returns the last update date of several records
+
+        Uses a ``search_read`` filtered on the ids when the adapter
+        has a ``_cursor_field`` and a ``_list_id_field``, completed by
+        ``read_many`` for the rows without ``updated_at``.
+
+        :return: dict ``{id: updated_at}``, the records which could not
+                 be read are missing
+        """
+        ids = [str(id) for id in ids]
+        updated_at = {}
+        if self._cursor_field and self._list_id_field and ids:
+            filters = {self._cursor_field: {'in': [int(id) for id in ids]}}
+            for row in self.search_read(filters):
+                if row.get('updated_at'):
+                    updated_at[str(row[self._list_id_field])] = \
+                        row['updated_at']
+        missing = [id for id in ids if id not in updated_at]
+        if missing:
+            records = self.read_many(missing, attributes=['updated_at'])
+            for id, record in zip(missing, records):
+                if not isinstance(record, Exception):
+                    updated_at[id] = record.get('updated_at')
+        return updated_at
+
+    def write_many(self, records):
+        """ Update several records on the external system in one request
+
+        :param records: list of ``(id, data)``, or of
+                        ``(id, data, storeview_id)`` for the adapters
+                        which update the records per store view
+        :return: list of the results, or the exception for the records
+                 which could not be updated
+        :rtype: list
+        """
+        return self._multi_call([('%s.update' % self._magento_model,
+                                  [int(record[0])] + list(record[1:]))
+                                 for record in records])
+
     def delete(self, id):
         """ Delete a record on the external system """
         return self._call('%s.delete' % self._magento_model, [int(id)])
@@ -19,11 +19,123 @@
 #
 ##############################################################################
 
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
 from openerp.tools import DEFAULT_SERVER_DATETIME_FORMAT
 from openerp.addons.connector.connector import Binder
 from ..backend import magento
 
+BINDING_CACHE_SIZE = 20000  # entries kept by the cache of the binders
+BINDING_CACHE_TTL = 300  # seconds
+
+
+class BindingCache(object):
+    """ Per-process LRU cache of the bindings, used by the binders.
+
+    It contains two kinds of entries:
+
+    * ``('id', dbname, model, binding_id)``:
+      ``(backend_id, magento_id, openerp_id)``
+    * ``('magento', dbname, model, backend_id, magento_id)`` or
+      ``('openerp', dbname, model, backend_id, openerp_id)``:
+      ``binding_id``
+
+    The binders only cache the bindings committed in the database,
+    so a rollback cannot leave a binding in the cache, and exported
+    (having a Magento ID): a binding not exported yet is bound by the
+    export, possibly in another process, it would stay unexported in
+    the cache. The bindings are invalidated when they are modified or
+    deleted in this process (see ``magento.binding``); the ``ttl``
+    limits the time an entry modified by another process can stay in
+    the cache.
+
+    A transaction started before the commit of a change can still
+    cache the former row. The exporters do not rely on the cache for
+    the Magento ID of the record they export, they read it on the
+    binding.
+
+    The ``'magento'`` and ``'openerp'`` entries are used only along
+    with the ``'id'`` entry of the binding they point to, and when
+    they are consistent with it.
+    """
+
+    def __init__(self, max_size=BINDING_CACHE_SIZE, ttl=BINDING_CACHE_TTL):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        """ Return the value of a key, or None """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return None
+            value, expire = entry
+            if expire < time.time():
+                return None
+            # move it at the end, as most recently used
+            self._entries[key] = entry
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (value, time.time() + self.ttl)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def get_binding(self, dbname, model, binding_id):
+        """ Return ``(backend_id, magento_id, openerp_id)`` or None """
+        return self.get(('id', dbname, model, binding_id))
+
+    def set_binding(self, dbname, model, binding_id,
+                    backend_id, magento_id, openerp_id):
+        self.set(('id', dbname, model, binding_id),
+                 (backend_id, magento_id, openerp_id))
+        if magento_id:
+            self.set(('magento', dbname, model, backend_id, magento_id),
+                     binding_id)
+        if openerp_id is not None:
+            self.set(('openerp', dbname, model, backend_id, openerp_id),
+                     binding_id)
+
+    def find_binding(self, dbname, model, backend_id, magento_id=None,
+                     openerp_id=None):
+        """ Return the binding id for a Magento ID or an OpenERP ID,
+        or None """
+        if magento_id is not None:
+            binding_id = self.get(('magento', dbname, model,
+                                   backend_id, magento_id))
+            index, value = 1, magento_id
+        else:
+            binding_id = self.get(('openerp', dbname, model,
+                                   backend_id, openerp_id))
+            index, value = 2, openerp_id
+        if binding_id is None:
+            return None
+        binding = self.get_binding(dbname, model, binding_id)
+        if binding is None or binding[0] != backend_id:
+            return None
+        if binding[index] != value:
+            return None
+        return binding_id
+
+    def invalidate(self, dbname, model, binding_ids):
+        """ Remove bindings from the cache """
+        with self._lock:
+            for binding_id in binding_ids:
+                self._entries.pop(('id', dbname, model, binding_id), None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+binding_cache = BindingCache()
+
 
 class MagentoBinder(Binder):
     """ Generic Binder for Magento """
@@ -55,6 +167,59 @@ class MagentoModelBinder(MagentoBinder):
         'magento.account.invoice',
     ]
 
+    def _read_bindings(self, column, values, backend=True):
+        """ Read the bindings having a value of ``values`` in ``column``
+
+        The bindings which have been committed in the database and
+        exported are stored in the cache.
+
+        :param backend: when True, search only the bindings of the
+                        current backend
+        :return: list of tuples ``(binding_id, backend_id,
+                 magento_id, openerp_id)``
+        """
+        if 'openerp_id' in self.model._columns:
+            openerp_column = 'openerp_id'
+        else:
+            openerp_column = 'NULL'
+        # the bindings created or modified in the current transaction
+        # have a write date equal to now()
+        query = ("SELECT id, backend_id, magento_id, %s, "
+                 "COALESCE(write_date, create_date) "
+                 "< (now() at time zone 'UTC') "
+                 "FROM %s WHERE %s IN %%s" %
+                 (openerp_column, self.model._table, column))
+        params = [tuple(values)]
+        if backend:
+            query += " AND backend_id = %s"
+            params.append(self.backend_record.id)
+        query += " ORDER BY id"
+        cr = self.session.cr
+        cr.execute(query, params)
+        bindings = []
+        for binding_id, backend_id, magento_id, openerp_id, committed \
+                in cr.fetchall():
+            if magento_id is None:
+                magento_id = False  # as returned by the ORM
+            if committed and magento_id:
+                binding_cache.set_binding(cr.dbname, self.model._name,
+                                          binding_id, backend_id,
+                                          magento_id, openerp_id)
+            bindings.append((binding_id, backend_id, magento_id, openerp_id))
+        return bindings
+
+    def _get_binding(self, binding_id):
+        """ Return ``(backend_id, magento_id, openerp_id)`` for a binding """
+        dbname = self.session.cr.dbname
+        binding = binding_cache.get_binding(dbname, self.model._name,
+                                            binding_id)
+        if binding is None:
+            bindings = self._read_bindings('id', [binding_id],
+                                           backend=False)
+            assert bindings, "Binding %s not found" % binding_id
+            binding = bindings[0][1:]
+        return binding
+
     def to_openerp(self, external_id, unwrap=False):
         """ Give the OpenERP ID for an external ID
 
@@ -65,19 +230,21 @@ class MagentoModelBinder(MagentoBinder):
                  or None if the external_id is not mapped
         :rtype: int
         """
-        with self.session.change_context({'active_test': False}):
-            binding_ids = self.session.search(
-                self.model._name,
-                [('magento_id', '=', str(external_id)),
-                 ('backend_id', '=', self.backend_record.id)])
-        if not binding_ids:
-            return None
-        assert len(binding_ids) == 1, "Several records found: %s" % binding_ids
-        binding_id = binding_ids[0]
+        external_id = str(external_id)
+        binding_id = binding_cache.find_binding(
+            self.session.cr.dbname, self.model._name,
+            self.backend_record.id, magento_id=external_id)
+        if binding_id is None:
+            bindings = self._read_bindings('magento_id', [external_id])
+            if not bindings:
+                return None
+            assert len(bindings) == 1, (
+                "Several records found: %s" % [b[0] for b in bindings])
+            binding_id, __, __, openerp_id = bindings[0]
+        elif unwrap:
+            openerp_id = self._get_binding(binding_id)[2]
         if unwrap:
-            return self.session.read(self.model._name,
-                                     binding_id,
-                                     ['openerp_id'])['openerp_id'][0]
+            return openerp_id
         else:
             return binding_id
 
@@ -92,21 +259,96 @@ class MagentoModelBinder(MagentoBinder):
         :return: backend identifier of the record
         """
         if wrap:
-            with self.session.change_context({'active_test': False}):
-                erp_id = self.session.search(
-                    self.model._name,
-                    [('openerp_id', '=', record_id),
-                     ('backend_id', '=', self.backend_record.id)
-                     ])
-            if erp_id:
-                record_id = erp_id[0]
+            binding_id = binding_cache.find_binding(
+                self.session.cr.dbname, self.model._name,
+                self.backend_record.id, openerp_id=record_id)
+            if binding_id is None:
+                bindings = self._read_bindings('openerp_id', [record_id])
+                if not bindings:
+                    return None
+                return bindings[0][2]
+            record_id = binding_id
+        return self._get_binding(record_id)[1]
+
+    def to_openerp_many(self, external_ids, unwrap=False):
+        """ Give the OpenERP IDs for a list of external IDs
+
+        The bindings which are not in the cache are read with one
+        query, including their ``openerp_id``.
+
+        :param external_ids: external IDs for which we want the OpenERP IDs
+        :param unwrap: if True, returns the openerp_id of the magento_xxxx
+                       records, else return the ids (binding ids)
+        :return: dict ``{external_id: record_id}``, the external IDs
+                 which are not mapped are not in the dict
+        :rtype: dict
+        """
+        dbname = self.session.cr.dbname
+        backend_id = self.backend_record.id
+        result = {}
+        missing = {}
+        for external_id in external_ids:
+            binding_id = binding_cache.find_binding(
+                dbname, self.model._name, backend_id,
+                magento_id=str(external_id))
+            if binding_id is None:
+                missing[str(external_id)] = external_id
+            elif unwrap:
+                result[external_id] = self._get_binding(binding_id)[2]
             else:
-                return None
-        magento_record = self.session.read(self.model._name,
-                                           record_id,
-                                           ['magento_id'])
-        assert magento_record
-        return magento_record['magento_id']
+                result[external_id] = binding_id
+        if missing:
+            for binding_id, __, magento_id, openerp_id in \
+                    self._read_bindings('magento_id', missing):
+                external_id = missing[magento_id]
+                assert external_id not in result, (
+                    "Several records found for %s" % external_id)
+                result[external_id] = openerp_id if unwrap else binding_id
+        return result
+
+    def to_backend_many(self, record_ids, wrap=False):
+        """ Give the external IDs for a list of OpenERP IDs
+
+        The bindings which are not in the cache are read with one
+        query.
+
+        :param record_ids: OpenERP IDs for which we want the external ids
+        :param wrap: if False, record_ids are IDs of bindings,
+            if True, record_ids are IDs of the normal records
+        :return: dict ``{record_id: external_id}``, the records which
+                 have no binding are not in the dict
+        :rtype: dict
+        """
+        dbname = self.session.cr.dbname
+        backend_id = self.backend_record.id
+        result = {}
+        missing = set()
+        for record_id in record_ids:
+            if wrap:
+                binding_id = binding_cache.find_binding(
+                    dbname, self.model._name, backend_id,
+                    openerp_id=record_id)
+            else:
+                binding_id = record_id
+            binding = None
+            if binding_id is not None:
+                binding = binding_cache.get_binding(dbname, self.model._name,
+                                                    binding_id)
+            if binding is None:
+                missing.add(record_id)
+            else:
+                result[record_id] = binding[1]
+        if missing:
+            if wrap:
+                bindings = self._read_bindings('openerp_id', missing)
+                key = 3  # openerp_id
+            else:
+                bindings = self._read_bindings('id', missing, backend=False)
+                key = 0  # binding id
+            for binding in bindings:
+                # the first binding found, as to_backend
+                result.setdefault(binding[key], binding[2])
+        return result
 
     def bind(self, external_id, binding_id):
         """ Create the link between an external ID and an OpenERP ID and
@@ -141,9 +383,7 @@ class MagentoModelBinder(MagentoBinder):
         :param browse: when True, returns a browse_record instance
                        rather than an ID
         """
-        binding = self.session.read(self.model._name, binding_id,
-                                    ['openerp_id'])
-        openerp_id = binding['openerp_id'][0]
+        openerp_id = self._get_binding(binding_id)[2]
         if browse:
             return self.session.browse(self.unwrap_model(),
                                        openerp_id)
@@ -19,6 +19,8 @@
 #
 ##############################################################################
 
+import hashlib
+import json
 import logging
 
 from contextlib import contextmanager
@@ -29,16 +31,37 @@ import psycopg2
 from openerp import SUPERUSER_ID
 from openerp.tools.translate import _
 from openerp.tools import DEFAULT_SERVER_DATETIME_FORMAT
-from openerp.addons.connector.queue.job import job, related_action
+from openerp.addons.connector.queue.job import (job,
+                                                related_action,
+                                                PENDING,
+                                                ENQUEUED,
+                                                )
 from openerp.addons.connector.unit.synchronizer import ExportSynchronizer
 from openerp.addons.connector.exception import (IDMissingInBackend,
                                                 RetryableJobError)
-from .import_synchronizer import import_record
+from .import_synchronizer import delay_import_record
+from .record_lock import acquire_record_lock, lock_stats
+from ..queue_job import delay_unique
 from ..connector import get_environment
 from ..related_action import unwrap_binding
 
 _logger = logging.getLogger(__name__)
 
+# number of records exported in a transaction by export_records_batch
+BATCH_EXPORT_GROUP_SIZE = 50
+# number of records exported by an export_records_batch job
+BATCH_EXPORT_JOB_SIZE = 500
+
+# exporter classes already warned about their _export_dependencies
+_warned_export_dependencies = set()
+
+
+def value_hash(value):
+    """ Return a short hash of an exported value, stored on the
+    bindings to know which values have changed since the last export """
+    dump = json.dumps(value, sort_keys=True, default=repr)
+    return hashlib.md5(dump).hexdigest()[:12]
+
 
 """
 
@@ -64,6 +87,11 @@ class MagentoBaseExporter(ExportSynchronizer):
         super(MagentoBaseExporter, self).__init__(environment)
         self.binding_id = None
         self.magento_id = None
+        # ``{magento_id: updated_at}`` of the exported records and the
+        # Magento IDs to read together at the first need, can be shared
+        # between exporters, see :meth:`_get_magento_updated_at`
+        self.updated_at_cache = {}
+        self.updated_at_prefetch = []
 
     def _delay_import(self):
         """ Schedule an import of the record.
@@ -74,7 +102,7 @@ class MagentoBaseExporter(ExportSynchronizer):
         # force is True because the sync_date will be more recent
         # so the import would be skipped
         assert self.magento_id
-        import_record.delay(self.session, self.model._name,
+        delay_import_record(self.session, self.model._name,
                             self.backend_record.id, self.magento_id,
                             force=True)
 
@@ -90,16 +118,34 @@ class MagentoBaseExporter(ExportSynchronizer):
         sync = self.binding_record.sync_date
         if not sync:
             return True
-        record = self.backend_adapter.read(self.magento_id,
-                                           attributes=['updated_at'])
-        if not record['updated_at']:
+        updated_at = self._get_magento_updated_at()
+        if not updated_at:
             # in rare case it can be empty, in doubt, import it
             return False
         fmt = DEFAULT_SERVER_DATETIME_FORMAT
         sync_date = datetime.strptime(sync, fmt)
-        magento_date = datetime.strptime(record['updated_at'], fmt)
+        magento_date = datetime.strptime(updated_at, fmt)
         return sync_date < magento_date
 
+    def _get_magento_updated_at(self):
+        """ Return the last update date of the record on Magento
+
+        When the record is in ``updated_at_prefetch``, the dates of all
+        the records of this list are read in one request and kept in
+        ``updated_at_cache``.
+        """
+        magento_id = str(self.magento_id)
+        cache = self.updated_at_cache
+        if magento_id not in cache and magento_id in self.updated_at_prefetch:
+            magento_ids = self.updated_at_prefetch[:]
+            del self.updated_at_prefetch[:]
+            cache.update(self.backend_adapter.read_updated_at(magento_ids))
+        if magento_id in cache:
+            return cache[magento_id]
+        record = self.backend_adapter.read(self.magento_id,
+                                           attributes=['updated_at'])
+        return record['updated_at']
+
     def _get_openerp_data(self):
         """ Return the raw OpenERP data for ``self.binding_id`` """
         return self.session.browse(self.model._name, self.binding_id)
@@ -111,12 +157,31 @@ class MagentoBaseExporter(ExportSynchronizer):
     def run(self, binding_id, *args, **kwargs):
         """ Run the synchronization
 
+        :param binding_id: identifier of the binding record to export
+        """
+        result = self._export(binding_id, *args, **kwargs)
+
+        self.binder.bind(self.magento_id, self.binding_id)
+        self._save_export_hashes()
+        # Commit so we keep the external ID when there are several
+        # exports (due to dependencies) and one of them fails.
+        # The commit will also release the lock acquired on the binding
+        # record
+        self.session.commit()
+        self._after_export()
+        return result
+
+    def _export(self, binding_id, *args, **kwargs):
+        """ Export the record, without binding it nor committing
+
         :param binding_id: identifier of the binding record to export
         """
         self.binding_id = binding_id
         self.binding_record = self._get_openerp_data()
 
-        self.magento_id = self.binder.to_backend(self.binding_id)
+        # read on the binding rather than in the cache of the binder,
+        # which may not know yet that another process exported it
+        self.magento_id = self.binding_record.magento_id
         try:
             should_import = self._should_import()
         except IDMissingInBackend:
@@ -125,16 +190,12 @@ class MagentoBaseExporter(ExportSynchronizer):
         if should_import:
             self._delay_import()
 
-        result = self._run(*args, **kwargs)
+        return self._run(*args, **kwargs)
 
-        self.binder.bind(self.magento_id, self.binding_id)
-        # Commit so we keep the external ID when there are several
-        # exports (due to dependencies) and one of them fails.
-        # The commit will also release the lock acquired on the binding
-        # record
-        self.session.commit()
-        self._after_export()
-        return result
+    def _save_export_hashes(self):
+        """ Store the hashes of the exported values on the binding,
+        implemented in inherited classes """
+        return
 
     def _run(self):
         """ Flow of the synchronization, implemented in inherited classes"""
@@ -142,7 +203,16 @@ class MagentoBaseExporter(ExportSynchronizer):
 
 
 class MagentoExporter(MagentoBaseExporter):
-    """ A common flow for the exports to Magento """
+    """ A common flow for the exports to Magento
+
+    A hash of each exported value is stored on the binding
+    (``export_hashes``), per store view. On the updates, the values
+    unchanged since the last export are not sent again.
+    """
+
+    # keys always sent in the updates, even when their values did not
+    # change, because the update needs them
+    _export_required_keys = ()
 
     def __init__(self, environment):
         """
@@ -151,6 +221,15 @@ class MagentoExporter(MagentoBaseExporter):
         """
         super(MagentoExporter, self).__init__(environment)
         self.binding_record = None
+        # when a list, the updates are appended to it instead of being
+        # sent, used by :func:`export_records_batch`
+        self.deferred_writes = None
+        self.dependencies_exported = False
+        # hashes of the values exported by the current run, per scope
+        # ('default' or the Magento ID of the store view)
+        self._export_hash_scope = 'default'
+        self._new_hashes = {}
+        self._reset_hashes = False
 
     def _lock(self):
         """ Lock the binding record.
@@ -167,13 +246,14 @@ class MagentoExporter(MagentoBaseExporter):
         with :meth:`_export_dependencies`. Each level will set its own lock
         on the binding record it has to export.
 
+        The lock is an advisory lock (see :mod:`.record_lock`). The job
+        does not wait for it: the transaction has already read the
+        record and would not see the changes of the job holding the
+        lock, it is retried in a new transaction instead.
+
         """
-        sql = ("SELECT id FROM %s WHERE ID = %%s FOR UPDATE NOWAIT" %
-               self.model._table)
-        try:
-            self.session.cr.execute(sql, (self.binding_id, ),
-                                    log_exceptions=False)
-        except psycopg2.OperationalError:
+        if not acquire_record_lock(self.session.cr, self.backend_record.id,
+                                   self.model._name, self.binding_id):
             _logger.info('A concurrent job is already exporting the same '
                          'record (%s with id %s). Job delayed later.',
                          self.model._name, self.binding_id)
@@ -210,6 +290,7 @@ class MagentoExporter(MagentoBaseExporter):
             yield
         except psycopg2.IntegrityError as err:
             if err.pgcode == psycopg2.errorcodes.UNIQUE_VIOLATION:
+                lock_stats.add(unique_violations=1)
                 raise RetryableJobError(
                     'A database error caused the failure of the job:\n'
                     '%s\n\n'
@@ -264,6 +345,22 @@ class MagentoExporter(MagentoBaseExporter):
         if exporter_class is None:
             exporter_class = MagentoExporter
         rel_binder = self.get_binder_for_model(binding_model)
+        binding_id = self._get_dependency_binding_id(
+            relation, binding_model, binding_field=binding_field,
+            binding_extra_vals=binding_extra_vals)
+        if not rel_binder.to_backend(binding_id):
+            exporter = self.get_connector_unit_for_model(exporter_class,
+                                                         binding_model)
+            exporter.run(binding_id)
+
+    def _get_dependency_binding_id(self, relation, binding_model,
+                                   binding_field='magento_bind_ids',
+                                   binding_extra_vals=None):
+        """ Return the ID of the binding of a dependency, the binding
+        is created and committed when it does not exist yet.
+
+        See :meth:`_export_dependency` for the arguments.
+        """
         # wrap is typically True if the relation is for instance a
         # 'product.product' record but the binding model is
         # 'magento.product.product'
@@ -277,47 +374,82 @@ class MagentoExporter(MagentoBaseExporter):
                 assert len(binding_ids) == 1, (
                     'only 1 binding for a backend is '
                     'supported in _export_dependency')
-                binding_id = binding_ids[0]
+                return binding_ids[0]
             # we are working with a unwrapped record (e.g.
             # product.category) and the binding does not exist yet.
             # Example: I created a product.product and its binding
             # magento.product.product and we are exporting it, but we need to
             # create the binding for the product.category on which it
             # depends.
-            else:
-                ctx = {'connector_no_export': True}
-                with self.session.change_context(ctx):
-                    with self.session.change_user(SUPERUSER_ID):
-                        bind_values = {'backend_id': self.backend_record.id,
-                                       'openerp_id': relation.id}
-                        if binding_extra_vals:
-                            bind_values.update(binding_extra_vals)
-                        # If 2 jobs create it at the same time, retry
-                        # one later. A unique constraint (backend_id,
-                        # openerp_id) should exist on the binding model
-                        with self._retry_unique_violation():
-                            binding_id = self.session.create(binding_model,
-                                                             bind_values)
-                            # Eager commit to avoid having 2 jobs
-                            # exporting at the same time. The constraint
-                            # will pop if an other job already created
-                            # the same binding. It will be caught and
-                            # raise a RetryableJobError.
-                            self.session.commit()
-        else:
-            # If magento_bind_ids does not exist we are typically in a
-            # "direct" binding (the binding record is the same record).
-            # If wrap is True, relation is already a binding record.
-            binding_id = relation.id
-
-        if not rel_binder.to_backend(binding_id):
-            exporter = self.get_connector_unit_for_model(exporter_class,
-                                                         binding_model)
-            exporter.run(binding_id)
+            # The lock of the unwrapped record serializes the jobs
+            # creating its binding. A job finding it held is retried in
+            # a new transaction, which will see the binding created by
+            # the other job.
+            if not acquire_record_lock(self.session.cr,
+                                       self.backend_record.id,
+                                       relation._model._name, relation.id):
+                raise RetryableJobError(
+                    'A concurrent job is already creating the binding of '
+                    '%s with id %s. The job will be retried later.' %
+                    (relation._model._name, relation.id))
+            ctx = {'connector_no_export': True}
+            with self.session.change_context(ctx):
+                with self.session.change_user(SUPERUSER_ID):
+                    bind_values = {'backend_id': self.backend_record.id,
+                                   'openerp_id': relation.id}
+                    if binding_extra_vals:
+                        bind_values.update(binding_extra_vals)
+                    # If 2 jobs create it at the same time, retry
+                    # one later. A unique constraint (backend_id,
+                    # openerp_id) should exist on the binding model
+                    with self._retry_unique_violation():
+                        binding_id = self.session.create(binding_model,
+                                                         bind_values)
+                        # Eager commit to avoid having 2 jobs
+                        # exporting at the same time. The constraint
+                        # will pop if an other job already created
+                        # the same binding. It will be caught and
+                        # raise a RetryableJobError.
+                        self.session.commit()
+            return binding_id
+        # If magento_bind_ids does not exist we are typically in a
+        # "direct" binding (the binding record is the same record).
+        # If wrap is True, relation is already a binding record.
+        return relation.id
+
+    def _dependencies(self):
+        """ Return the records to export before the record
+
+        Each dependency is a tuple ``(relation, binding_model)`` or
+        ``(relation, binding_model, binding_extra_vals)``, see
+        :meth:`_export_dependency` for the meaning of the values.
+        The dependencies are exported by :class:`ExportPlanner`.
+        """
+        return []
 
     def _export_dependencies(self):
-        """ Export the dependencies for the record"""
-        return
+        """ Export the dependencies for the record
+
+        The dependencies returned by :meth:`_dependencies` are
+        exported by an :class:`ExportPlanner`, with their own
+        dependencies, in topological order.
+        """
+        planner = ExportPlanner(self.session, self.backend_record.id,
+                                raise_errors=True)
+        planner.add(self.model._name, [self.binding_id])
+        planner.export()
+
+    def _overrides_export_dependencies(self):
+        """ Return True when the exporter overrides
+        :meth:`_export_dependencies` to export its dependencies itself
+
+        Such an exporter predates :meth:`_dependencies`: the
+        :class:`ExportPlanner` does not know its dependencies, so its
+        :meth:`_export_dependencies` is still called when the planner
+        runs it.
+        """
+        method = type(self)._export_dependencies.im_func
+        return method is not MagentoExporter._export_dependencies.im_func
 
     def _map_data(self):
         """ Returns an instance of
@@ -336,9 +468,67 @@ class MagentoExporter(MagentoBaseExporter):
         """
         return
 
+    def _exported_hashes(self):
+        """ Return the hashes of the values exported the last time in
+        the current scope """
+        if self._reset_hashes or not self.binding_record.export_hashes:
+            return {}
+        try:
+            hashes = json.loads(self.binding_record.export_hashes)
+        except ValueError:
+            return {}
+        return hashes.get(str(self._export_hash_scope), {})
+
+    def _filter_unchanged(self, data):
+        """ Remove the values unchanged since the last export and keep
+        the hashes of the others, return an empty dict when nothing
+        changed """
+        exported = self._exported_hashes()
+        new_hashes = self._new_hashes.setdefault(
+            str(self._export_hash_scope), {})
+        changed = {}
+        for key, value in data.iteritems():
+            digest = value_hash(value)
+            if exported.get(key) == digest:
+                continue
+            changed[key] = value
+            new_hashes[key] = digest
+        if not changed:
+            return {}
+        for key in self._export_required_keys:
+            if key in data:
+                changed[key] = data[key]
+        return changed
+
+    def _save_export_hashes(self):
+        """ Store the hashes of the exported values on the binding """
+        if not self._new_hashes:
+            return
+        hashes = {}
+        if not self._reset_hashes:
+            stored = self.session.read(self.model._name, self.binding_id,
+                                       ['export_hashes'])['export_hashes']
+            try:
+                hashes = json.loads(stored or '{}')
+            except ValueError:
+                pass
+        for scope, new_hashes in self._new_hashes.iteritems():
+            hashes.setdefault(scope, {}).update(new_hashes)
+        with self.session.change_context({'connector_no_export': True}):
+            self.session.write(self.model._name, self.binding_id,
+                               {'export_hashes': json.dumps(hashes,
+                                                            sort_keys=True)})
+        self._new_hashes = {}
+        self._reset_hashes = False
+
     def _create_data(self, map_record, fields=None, **kwargs):
         """ Get the data to pass to :py:meth:`_create` """
-        return map_record.values(for_create=True, fields=fields, **kwargs)
+        data = map_record.values(for_create=True, fields=fields, **kwargs)
+        # new record on Magento, forget the values sent to a former one
+        self._reset_hashes = True
+        self._new_hashes = {}
+        self._filter_unchanged(data)
+        return data
 
     def _create(self, data):
         """ Create the Magento record """
@@ -347,14 +537,19 @@ class MagentoExporter(MagentoBaseExporter):
         return self.backend_adapter.create(data)
 
     def _update_data(self, map_record, fields=None, **kwargs):
-        """ Get the data to pass to :py:meth:`_update` """
-        return map_record.values(fields=fields, **kwargs)
+        """ Get the data to pass to :py:meth:`_update`, without the
+        values unchanged since the last export """
+        data = map_record.values(fields=fields, **kwargs)
+        return self._filter_unchanged(data)
 
     def _update(self, data):
         """ Update an Magento record """
         assert self.magento_id
         # special check on data before export
         self._validate_data(data)
+        if self.deferred_writes is not None:
+            self.deferred_writes.append((self.magento_id, data))
+            return
         self.backend_adapter.write(self.magento_id, data)
 
     def _run(self, fields=None):
@@ -369,7 +564,16 @@ class MagentoExporter(MagentoBaseExporter):
             return
 
         # export the missing linked resources
-        self._export_dependencies()
+        if not self.dependencies_exported:
+            self._export_dependencies()
+        elif self._overrides_export_dependencies():
+            if type(self) not in _warned_export_dependencies:
+                _warned_export_dependencies.add(type(self))
+                _logger.warning('%s overrides _export_dependencies, it '
+                                'should return its dependencies with '
+                                '_dependencies instead',
+                                type(self).__name__)
+            self._export_dependencies()
 
         # prevent other jobs to export the same record
         # will be released on commit (or rollback)
@@ -422,23 +626,152 @@ class MagentoTranslationExporter(MagentoExporter):
         if lang_storeviews:
             translatable_fields = self._get_translatable_field(fields)   
             if translatable_fields:
+                binder = self.get_binder_for_model('magento.storeview')
                 for storeview in lang_storeviews:
                     session.context['lang'] = storeview.lang_id.code
+                    magento_storeview_id = binder.to_backend(storeview.id)
+                    self._export_hash_scope = magento_storeview_id
                     self.binding_record = self._get_openerp_data()
                     map_record = self._map_data()
                     record = self._update_data(
                          map_record, fields=translatable_fields)
-                    if not map_record:
-                        return _('nothing to export.')
+                    if not record:
+                        continue
                     # special check on data before export
                     self._validate_data(record)
-                    binder = self.get_binder_for_model('magento.storeview')
-                    magento_storeview_id = binder.to_backend(storeview.id)
+                    if self.deferred_writes is not None:
+                        self.deferred_writes.append(
+                            (self.magento_id, record, magento_storeview_id))
+                        continue
                     self.backend_adapter.write(
                         self.magento_id, record, magento_storeview_id)
+                self._export_hash_scope = 'default'
         return res
 
 
+class ExportPlanner(object):
+    """ Export the dependencies of a set of bindings
+
+    The dependencies returned by :meth:`MagentoExporter._dependencies`
+    and not yet exported are collected recursively in a graph, which is
+    exported in topological order, level by level: first the records
+    without dependencies to export, then the records depending only on
+    them, and so on. Each record is exported once, whatever the number
+    of records depending on it, and with its dependencies already
+    exported.
+
+    The bindings given to :meth:`add` are not exported, only their
+    dependencies.
+
+    :param raise_errors: when False, a failing dependency is logged and
+                         the records depending on it are not exported
+    """
+
+    def __init__(self, session, backend_id, raise_errors=False):
+        self.session = session
+        self.backend_id = backend_id
+        self.raise_errors = raise_errors
+        # (binding model, binding id) -> dependencies to export before
+        self.graph = {}
+        self.roots = []
+        self._exporters = {}
+
+    def _get_exporter(self, binding_model):
+        """ Return a new exporter for a binding model """
+        env = get_environment(self.session, binding_model, self.backend_id)
+        return env.get_connector_unit(MagentoExporter)
+
+    def _collect(self, node):
+        """ Return the dependencies not yet exported of a node """
+        binding_model, binding_id = node
+        if binding_model not in self._exporters:
+            self._exporters[binding_model] = self._get_exporter(binding_model)
+        exporter = self._exporters[binding_model]
+        exporter.binding_id = binding_id
+        exporter.binding_record = exporter._get_openerp_data()
+        dependencies = []
+        for dependency in exporter._dependencies():
+            relation, dependency_model = dependency[:2]
+            if not relation:
+                continue
+            extra_vals = dependency[2] if len(dependency) > 2 else None
+            dependency_id = exporter._get_dependency_binding_id(
+                relation, dependency_model, binding_extra_vals=extra_vals)
+            binder = exporter.get_binder_for_model(dependency_model)
+            if not binder.to_backend(dependency_id):
+                dependencies.append((dependency_model, dependency_id))
+        return dependencies
+
+    def add(self, binding_model, binding_ids):
+        """ Add bindings to the graph with their dependencies """
+        nodes = [(binding_model, binding_id) for binding_id in binding_ids]
+        self.roots += nodes
+        while nodes:
+            node = nodes.pop()
+            if node in self.graph:
+                continue
+            self.graph[node] = self._collect(node)
+            nodes += self.graph[node]
+
+    def _levels(self):
+        """ Return the level of each node of the graph, 0 for the
+        nodes without dependencies, the level of a node being above
+        the levels of its dependencies """
+        levels = {}
+        for start in self.graph:
+            if start in levels:
+                continue
+            # depth-first walk, ``path`` is the current branch
+            path = [start]
+            iterators = [iter(self.graph[start])]
+            while iterators:
+                for dependency in iterators[-1]:
+                    if dependency in levels:
+                        continue
+                    assert dependency not in path, (
+                        'cyclic dependencies between %s' % path)
+                    path.append(dependency)
+                    iterators.append(iter(self.graph[dependency]))
+                    break
+                else:
+                    iterators.pop()
+                    node = path.pop()
+                    levels[node] = max([levels[dependency] + 1
+                                        for dependency in self.graph[node]]
+                                       or [0])
+        return levels
+
+    def export(self):
+        """ Export the dependencies of the graph
+
+        :return: the bindings given to :meth:`add` which have a
+                 dependency that failed, as ``(binding_model, id)``
+        """
+        levels = self._levels()
+        roots = set(self.roots)
+        nodes = sorted((node for node in self.graph if node not in roots),
+                       key=lambda node: (levels[node], node))
+        failed = set()
+        for node in nodes:
+            if failed.intersection(self.graph[node]):
+                failed.add(node)
+                continue
+            binding_model, binding_id = node
+            exporter = self._get_exporter(binding_model)
+            exporter.dependencies_exported = True
+            try:
+                exporter.run(binding_id)
+            except Exception:
+                if self.raise_errors:
+                    raise
+                self.session.rollback()
+                _logger.exception('Export of the dependency %s with id %s '
+                                  'failed', binding_model, binding_id)
+                failed.add(node)
+        return set(root for root in roots
+                   if failed.intersection(self.graph[root]))
+
+
 @job
 @related_action(action=unwrap_binding)
 def export_record(session, model_name, binding_id, fields=None):
@@ -447,3 +780,188 @@ def export_record(session, model_name, binding_id, fields=None):
     env = get_environment(session, model_name, record.backend_id.id)
     exporter = env.get_connector_unit(MagentoExporter)
     return exporter.run(binding_id, fields=fields)
+
+
+@job
+def export_records_batch(session, model_name, backend_id, binding_ids,
+                         fields=None):
+    """ Export several records on Magento
+
+    The records are exported by groups of ``BATCH_EXPORT_GROUP_SIZE``
+    with the same environment, the updates of a group are sent in
+    ``multiCall`` requests and the group is committed at once. See
+    :func:`_export_batch_group`.
+    """
+    env = get_environment(session, model_name, backend_id)
+    results = []
+    for index in xrange(0, len(binding_ids), BATCH_EXPORT_GROUP_SIZE):
+        group = binding_ids[index:index + BATCH_EXPORT_GROUP_SIZE]
+        results += _export_batch_group(env, group, fields=fields)
+    return '\n'.join(results)
+
+
+def delay_export_records_batch(session, model_name, backend_id, binding_ids,
+                               fields=None, **kwargs):
+    """ Delay :func:`export_records_batch` jobs exporting the bindings
+    by chunks of ``BATCH_EXPORT_JOB_SIZE``
+
+    :return: list of the UUIDs of the jobs
+    """
+    return [export_records_batch.delay(
+                session, model_name, backend_id,
+                binding_ids[index:index + BATCH_EXPORT_JOB_SIZE],
+                fields=fields, **kwargs)
+            for index in xrange(0, len(binding_ids), BATCH_EXPORT_JOB_SIZE)]
+
+
+def _export_batch_group(env, binding_ids, fields=None):
+    """ Export a group of records in the same transaction
+
+    * the dependencies of the group are exported first by an
+      :class:`ExportPlanner`, as they commit, each of them once
+    * the records not yet exported are exported in their own job,
+      their creation has to be committed right away; the jobs are
+      delayed after the planner, which rolls back the failed exports
+    * the last update dates on Magento are read at once, if needed
+    * each record is exported in a savepoint and locked as in
+      :meth:`MagentoExporter._lock`, the updates are kept aside
+    * the updates are sent with ``write_many``
+    * the exported records are bound and the group is committed
+
+    A record failing at any step is exported in its own job so the
+    other records are still exported.
+
+    :return: list of lines describing the result of each record
+    """
+    session = env.session
+    model_name = env.model_name
+    results = []
+
+    def export_alone(binding_id, reason):
+        job_uuid, __ = delay_export_record(session, model_name,
+                                           binding_id, fields=fields)
+        results.append('%s: %s, exported in job %s' %
+                       (binding_id, reason, job_uuid))
+
+    exporters = []
+    not_exported = []
+    for binding_id in binding_ids:
+        exporter = env.get_connector_unit(MagentoExporter)
+        exporter.magento_id = exporter.binder.to_backend(binding_id)
+        if not exporter.magento_id:
+            not_exported.append(binding_id)
+            continue
+        exporter.binding_id = binding_id
+        exporters.append(exporter)
+
+    planner = ExportPlanner(session, env.backend_record.id)
+    planner.add(model_name, [item.binding_id for item in exporters])
+    blocked = planner.export()
+    for binding_id in not_exported:
+        export_alone(binding_id, 'not yet exported')
+    for exporter in exporters[:]:
+        if (model_name, exporter.binding_id) in blocked:
+            exporters.remove(exporter)
+            export_alone(exporter.binding_id, 'failed dependency')
+            continue
+        exporter.binding_record = exporter._get_openerp_data()
+        exporter.dependencies_exported = True
+
+    # the dates compared in _should_import are read in one request
+    updated_at_cache = {}
+    updated_at_prefetch = [str(exporter.magento_id)
+                           for exporter in exporters]
+    for exporter in exporters:
+        exporter.updated_at_cache = updated_at_cache
+        exporter.updated_at_prefetch = updated_at_prefetch
+
+    cr = session.cr
+    pending = []
+    done = []
+    exported = []
+    for exporter in exporters:
+        binding_id = exporter.binding_id
+        magento_id = exporter.magento_id
+        exporter.deferred_writes = []
+        cr.execute('SAVEPOINT export_records_batch')
+        try:
+            result = exporter._export(binding_id, fields=fields)
+        except Exception as err:
+            cr.execute('ROLLBACK TO SAVEPOINT export_records_batch')
+            export_alone(binding_id, 'failed (%s)' % err)
+            continue
+        cr.execute('RELEASE SAVEPOINT export_records_batch')
+        if exporter.magento_id != magento_id:
+            # the record was missing on Magento and has been created
+            # again, it is bound right away so its new ID is kept even
+            # if its updates fail; it is committed with the group, a
+            # commit now would release the locks of the other records
+            exporter.binder.bind(exporter.magento_id, binding_id)
+        if exporter.deferred_writes:
+            pending.append(exporter)
+        else:
+            done.append((exporter, result))
+
+    if pending:
+        adapter = pending[0].backend_adapter
+        responses = adapter.write_many([write for exporter in pending
+                                        for write in exporter.deferred_writes])
+        position = 0
+        for exporter in pending:
+            count = len(exporter.deferred_writes)
+            errors = [response for response
+                      in responses[position:position + count]
+                      if isinstance(response, Exception)]
+            position += count
+            if errors:
+                export_alone(exporter.binding_id, 'failed (%s)' % errors[0])
+                continue
+            done.append((exporter,
+                         _('Record exported with ID %s on Magento.') %
+                         exporter.magento_id))
+
+    for exporter, result in done:
+        exporter.binder.bind(exporter.magento_id, exporter.binding_id)
+        exporter._save_export_hashes()
+        results.append('%s: %s' % (exporter.binding_id, result))
+        exported.append(exporter)
+    # release the locks
+    session.commit()
+    for exporter in exported:
+        exporter._after_export()
+    return results
+
+
+def export_identity_key(model_name, binding_id):
+    """ Identity key of the :func:`export_record` jobs """
+    return 'export_record:%s,%s' % (model_name, binding_id)
+
+
+def _merge_export_kwargs(waiting_kwargs, kwargs):
+    """ Merge the fields to export, ``None`` meaning all the fields """
+    waiting_fields = waiting_kwargs.get('fields')
+    fields = kwargs.get('fields')
+    if waiting_fields is None or fields is None:
+        waiting_kwargs['fields'] = None
+    else:
+        waiting_kwargs['fields'] = waiting_fields + [
+            field for field in fields if field not in waiting_fields]
+    return waiting_kwargs
+
+
+def delay_export_record(session, model_name, binding_id, **kwargs):
+    """ Delay an :func:`export_record` job, unless an export of the
+    same binding is waiting to be run.
+
+    The fields are merged in the pending export. The started exports
+    are not considered, they may have read the record before the
+    last changes.
+
+    :return: tuple with the UUID of the job and True if a new job has
+             been delayed
+    """
+    return delay_unique(session, export_record,
+                        export_identity_key(model_name, binding_id),
+                        (model_name, binding_id),
+                        kwargs, merge=_merge_export_kwargs,
+                        states=(PENDING, ENQUEUED))
@@ -26,9 +26,16 @@ from openerp.tools import DEFAULT_SERVER_DATETIME_FORMAT
 from openerp.addons.connector.queue.job import job, related_action
 from openerp.addons.connector.connector import ConnectorUnit
 from openerp.addons.connector.unit.synchronizer import ImportSynchronizer
-from openerp.addons.connector.exception import IDMissingInBackend
+from openerp.addons.connector.exception import (IDMissingInBackend,
+                                                RetryableJobError)
 from ..backend import magento
 from ..connector import get_environment, add_checkpoint
+from ..queue_job import (delay_unique,
+                         find_waiting_jobs,
+                         find_waiting_record_keys,
+                         set_record_keys,
+                         )
+from .mapper import magento_attributes
 from ..related_action import link
 
 _logger = logging.getLogger(__name__)
@@ -49,6 +56,10 @@ are already bound, to update the last sync date.
 class MagentoImportSynchronizer(ImportSynchronizer):
     """ Base importer for Magento """
 
+    # attributes used by the importer itself, they are read in
+    # addition of the attributes declared by the mapper
+    _magento_attributes = ['updated_at']
+
     def __init__(self, environment):
         """
         :param environment: current environment (backend, session, ...)
@@ -58,9 +69,21 @@ class MagentoImportSynchronizer(ImportSynchronizer):
         self.magento_id = None
         self.magento_record = None
 
+    def _get_magento_attributes(self):
+        """ Return the attributes to read on Magento, or None to read
+        all of them when the mapper does not declare its attributes """
+        attributes = magento_attributes(self.mapper)
+        if attributes is None:
+            return None
+        return sorted(set(attributes) | set(self._magento_attributes))
+
     def _get_magento_data(self):
         """ Return the raw Magento data for ``self.magento_id`` """
-        return self.backend_adapter.read(self.magento_id)
+        attributes = self._get_magento_attributes()
+        if attributes is None:
+            return self.backend_adapter.read(self.magento_id)
+        return self.backend_adapter.read(self.magento_id,
+                                         attributes=attributes)
 
     def _before_import(self):
         """ Hook called before the import, when we have the Magento
@@ -186,6 +209,9 @@ class MagentoImportSynchronizer(ImportSynchronizer):
         """ Update an OpenERP record """
         # special check on data before import
         self._validate_data(data)
+        # the values may have been modified on Magento, they all have
+        # to be sent again at the next export
+        data['export_hashes'] = False
         with self.session.change_context({'connector_no_export': True}):
             self.session.write(self.model._name, binding_id, data)
         _logger.debug('%s %d updated from magento %s',
@@ -242,7 +268,52 @@ class BatchImportSynchronizer(ImportSynchronizer):
 
     def run(self, filters=None):
         """ Run the synchronization """
-        record_ids = self.backend_adapter.search(filters)
+        for record_ids in self.backend_adapter.search_pages(filters):
+            self._import_records(record_ids)
+
+    def _skip_uptodate(self, records):
+        """ Filter out the records already up-to-date in OpenERP
+
+        Same check as :meth:`MagentoImportSynchronizer._is_uptodate`
+        done before the jobs are created, using the ``updated_at``
+        returned by the search and the ``sync_date`` of the bindings,
+        read with one query. The records without ``updated_at`` are
+        kept.
+
+        :param records: list of ``(magento_id, updated_at)``
+        :return: list of the Magento IDs to import
+        """
+        if not records:
+            return []
+        self.session.cr.execute(
+            "SELECT magento_id, sync_date FROM %s "
+            "WHERE backend_id = %%s AND magento_id IN %%s" %
+            self.model._table,
+            (self.backend_record.id,
+             tuple(str(magento_id) for magento_id, __ in records)))
+        sync_dates = dict(self.session.cr.fetchall())
+        fmt = DEFAULT_SERVER_DATETIME_FORMAT
+        record_ids = []
+        for magento_id, updated_at in records:
+            sync = sync_dates.get(str(magento_id))
+            if updated_at and sync:
+                if isinstance(sync, basestring):
+                    sync = datetime.strptime(sync[:19], fmt)
+                try:
+                    magento_date = datetime.strptime(updated_at, fmt)
+                except ValueError:
+                    magento_date = None
+                if magento_date and magento_date < sync:
+                    continue
+            record_ids.append(magento_id)
+        skipped = len(records) - len(record_ids)
+        if skipped:
+            _logger.info('%d %s records already up-to-date are skipped',
+                         skipped, self.model._name)
+        return record_ids
+
+    def _import_records(self, record_ids):
+        """ Import a list of records, one by one by default """
         for record_id in record_ids:
             self._import_record(record_id)
 
@@ -267,16 +338,83 @@ class DirectBatchImport(BatchImportSynchronizer):
 
 
 class DelayedBatchImport(BatchImportSynchronizer):
-    """ Delay import of the records """
+    """ Delay import of the records
+
+    When ``_chunk_size`` is set, a job imports ``_chunk_size`` records
+    (see :func:`import_record_chunk`) instead of a job per record.
+    """
     _model_name = None
+    _chunk_size = None
+
+    def _import_records(self, record_ids):
+        """ Delay the import of the records, by chunks if
+        ``_chunk_size`` is set
+
+        The records having already an import job waiting are not
+        delayed again.
+
+        :return: number of records not delayed because a job is
+                 already waiting
+        """
+        record_ids = list(record_ids)
+        if self._chunk_size:
+            waiting = self._waiting_imports(record_ids)
+            to_import = [record_id for record_id in record_ids
+                         if record_id not in waiting]
+            for index in xrange(0, len(to_import), self._chunk_size):
+                self._import_chunk(to_import[index:index + self._chunk_size])
+            duplicates = len(record_ids) - len(to_import)
+        else:
+            duplicates = 0
+            for record_id in record_ids:
+                if not self._import_record(record_id):
+                    duplicates += 1
+        if duplicates:
+            _logger.info('%d %s records already have a waiting import job, '
+                         'no job delayed for them', duplicates,
+                         self.model._name)
+        return duplicates
+
+    def _waiting_imports(self, record_ids):
+        """ Return the IDs of the records having a waiting
+        :func:`import_record` or :func:`import_record_chunk` job """
+        keys = dict((import_identity_key(self.model._name,
+                                         self.backend_record.id,
+                                         record_id), record_id)
+                    for record_id in record_ids)
+        jobs = find_waiting_jobs(self.session, keys)
+        waiting = set(job['identity_key'] for job in jobs)
+        waiting.update(find_waiting_record_keys(self.session, keys))
+        return set(keys[key] for key in waiting)
+
+    def _import_chunk(self, record_ids, **kwargs):
+        """ Delay the import of a chunk of records
+
+        The job carries the identity key of the import of each record.
+        """
+        job_uuid = import_record_chunk.delay(self.session,
+                                             self.model._name,
+                                             self.backend_record.id,
+                                             record_ids,
+                                             **kwargs)
+        set_record_keys(self.session, job_uuid,
+                        [import_identity_key(self.model._name,
+                                             self.backend_record.id,
+                                             record_id)
+                         for record_id in record_ids])
 
     def _import_record(self, record_id, **kwargs):
-        """ Delay the import of the records"""
-        import_record.delay(self.session,
-                            self.model._name,
-                            self.backend_record.id,
-                            record_id,
-                            **kwargs)
+        """ Delay the import of the records
+
+        :return: True if a job has been delayed, False if a job was
+                 already waiting for the record
+        """
+        __, delayed = delay_import_record(self.session,
+                                          self.model._name,
+                                          self.backend_record.id,
+                                          record_id,
+                                          **kwargs)
+        return delayed
 
 
 @magento
@@ -300,9 +438,12 @@ class TranslationImporter(ImportSynchronizer):
                    'magento.product.product',
                    ]
 
-    def _get_magento_data(self, storeview_id=None):
+    def _get_magento_data(self, storeview_id=None, attributes=None):
         """ Return the raw Magento data for ``self.magento_id`` """
-        return self.backend_adapter.read(self.magento_id, storeview_id)
+        if attributes is None:
+            return self.backend_adapter.read(self.magento_id, storeview_id)
+        return self.backend_adapter.read(self.magento_id, storeview_id,
+                                         attributes=attributes)
 
     def run(self, magento_id, binding_id, mapper_class=None):
         self.magento_id = magento_id
@@ -328,8 +469,10 @@ class TranslationImporter(ImportSynchronizer):
         else:
             mapper = self.get_connector_unit_for_model(mapper_class)
 
+        attributes = magento_attributes(mapper)
         for storeview in lang_storeviews:
-            lang_record = self._get_magento_data(storeview.magento_id)
+            lang_record = self._get_magento_data(storeview.magento_id,
+                                                 attributes=attributes)
             map_record = mapper.map_record(lang_record)
             record = map_record.values()
 
@@ -376,3 +519,69 @@ def import_record(session, model_name, backend_id, magento_id, force=False):
     env = get_environment(session, model_name, backend_id)
     importer = env.get_connector_unit(MagentoImportSynchronizer)
     importer.run(magento_id, force=force)
+
+
+def import_identity_key(model_name, backend_id, magento_id):
+    """ Identity key of the :func:`import_record` jobs """
+    return 'import_record:%s,%s,%s' % (model_name, backend_id, magento_id)
+
+
+def _merge_import_kwargs(waiting_kwargs, kwargs):
+    """ A waiting import is promoted to a forced import """
+    if kwargs.get('force'):
+        waiting_kwargs['force'] = True
+    return waiting_kwargs
+
+
+def delay_import_record(session, model_name, backend_id, magento_id,
+                        **kwargs):
+    """ Delay an :func:`import_record` job, unless an import of the
+    same record is already waiting.
+
+    When the waiting job is still pending, it is promoted to a forced
+    import if ``force`` is True.
+
+    :return: tuple with the UUID of the job and True if a new job has
+             been delayed
+    """
+    return delay_unique(session, import_record,
+                        import_identity_key(model_name, backend_id,
+                                            magento_id),
+                        (model_name, backend_id, magento_id),
+                        kwargs, merge=_merge_import_kwargs)
+
+
+@job
+def import_record_chunk(session, model_name, backend_id, magento_ids,
+                        force=False):
+    """ Import several records from Magento
+
+    Each record is imported in a savepoint. When the import of a
+    record fails, its changes are rolled back and the record is
+    imported in its own job, so the other records are still imported.
+    Returns the result of the import of each record.
+    """
+    env = get_environment(session, model_name, backend_id)
+    cr = session.cr
+    results = []
+    for magento_id in magento_ids:
+        importer = env.get_connector_unit(MagentoImportSynchronizer)
+        cr.execute('SAVEPOINT import_record_chunk')
+        try:
+            result = importer.run(magento_id, force=force)
+        except RetryableJobError:
+            # retry the whole chunk later
+            raise
+        except Exception as err:
+            cr.execute('ROLLBACK TO SAVEPOINT import_record_chunk')
+            _logger.debug('Import of %s %s failed', model_name, magento_id,
+                          exc_info=True)
+            job_uuid, __ = delay_import_record(session, model_name,
+                                               backend_id, magento_id,
+                                               force=force)
+            results.append(_('%s: failed (%s), retried in job %s') %
+                           (magento_id, err, job_uuid))
+        else:
+            cr.execute('RELEASE SAVEPOINT import_record_chunk')
+            results.append('%s: %s' % (magento_id, result or _('Imported')))
+    return '\n'.join(results)
@@ -19,6 +19,8 @@
 #
 ##############################################################################
 
+import inspect
+
 
 def normalize_datetime(field):
     """Change a invalid date which comes from Magento, if
@@ -29,3 +31,90 @@ def normalize_datetime(field):
             return None
         return record[field]
     return modifier
+
+
+def magento_attributes(mapper):
+    """ Return the Magento attributes used by an import mapper
+
+    A mapper declares the attributes used by its ``direct`` and
+    ``@mapping`` in ``_magento_attributes``, and in
+    ``_magento_sub_mappers`` the mapper classes it delegates to.
+    The declaration is not inherited: a subclass may use other
+    attributes, so it has to declare them again.
+
+    :param mapper: instance of an import mapper
+    :return: list of attributes, or None when all the attributes
+             are needed (no declaration)
+    """
+    cls = type(mapper)
+    attributes = vars(cls).get('_magento_attributes')
+    if attributes is None:
+        return None
+    attributes = set(attributes)
+    for sub_mapper_class in getattr(cls, '_magento_sub_mappers', ()):
+        sub_mapper = mapper.get_connector_unit_for_model(sub_mapper_class)
+        sub_attributes = magento_attributes(sub_mapper)
+        if sub_attributes is None:
+            return None
+        attributes.update(sub_attributes)
+    return sorted(attributes)
+
+
+_source_fields_cache = {}
+
+
+def _direct_source_field(source):
+    """ Return the source field of a ``direct`` mapping, going through
+    the modifiers (functions with a ``field`` in their closure), or
+    None when it cannot be found """
+    while callable(source):
+        code = getattr(source, 'func_code', None)
+        if code is None or not source.func_closure:
+            return None
+        cells = dict(zip(code.co_freevars,
+                         (cell.cell_contents
+                          for cell in source.func_closure)))
+        if 'field' not in cells:
+            return None
+        source = cells['field']
+    return source
+
+
+def export_source_fields(mapper_class):
+    """ Return the OpenERP fields read by an export mapper
+
+    The fields are the sources of the ``direct`` mappings and the
+    fields declared with ``@changed_by`` on the ``@mapping`` methods.
+    The result is computed once per class.
+
+    :param mapper_class: class of an export mapper
+    :return: frozenset of field names, or None when a ``@mapping``
+             does not declare its fields, meaning any field may be used
+    """
+    if mapper_class in _source_fields_cache:
+        return _source_fields_cache[mapper_class]
+    fields = set()
+    for source, __ in getattr(mapper_class, 'direct', None) or []:
+        source = _direct_source_field(source)
+        if source is None:
+            fields = None
+            break
+        fields.add(source)
+    if fields is not None:
+        classes = inspect.getmro(mapper_class)
+        names = set(getattr(mapper_class, '_map_methods', None) or ())
+        for cls in classes:
+            names.update(name for name, attr in vars(cls).iteritems()
+                         if getattr(attr, 'is_mapping', False))
+        for name in names:
+            declared = [vars(cls)[name].changed_by for cls in classes
+                        if hasattr(vars(cls).get(name), 'changed_by')]
+            if not declared:
+                fields = None
+                break
+            for changed_by in declared:
+                fields.update(changed_by)
+    if fields is not None:
+        fields = frozenset(fields)
+    _source_fields_cache[mapper_class] = fields
+    return fields
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+##############################################################################
+#
+#    Author: Guewen Baconnier
+#    Copyright 2014 Camptocamp SA
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Affero General Public License as
+#    published by the Free Software Foundation, either version 3 of the
+#    License, or (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Affero General Public License for more details.
+#
+#    You should have received a copy of the GNU Affero General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+##############################################################################
+
+
+"""
+Locks serializing the jobs working on the same record.
+
+The locks are transaction-level advisory locks of PostgreSQL, keyed on
+the backend, the model and the ID of the record, so a lock can be taken
+on a record which has no binding yet. They are released at the end of
+the transaction (commit or rollback).
+
+A job finding a lock held does not wait for it: the transactions of
+OpenERP are in REPEATABLE READ, they see the database as it was at
+their first query, so a transaction which waited for a lock would not
+see the changes committed by the transaction which held it. The job
+has to be retried in a new transaction instead.
+
+The locks are counted per process in ``lock_stats``, logged every
+``LOCK_STATS_LOG_INTERVAL`` seconds.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+
+_logger = logging.getLogger(__name__)
+
+LOCK_STATS_LOG_INTERVAL = 600  # seconds between 2 logs of the counters
+
+
+class LockStats(object):
+    """ Per-process counters of the record locks
+
+    * ``acquired``: locks acquired
+    * ``held``: locks not acquired, held by another transaction
+    * ``unique_violations``: bindings created concurrently, see
+      :meth:`~.export_synchronizer.MagentoExporter._retry_unique_violation`
+
+    The counters are logged at most every ``LOCK_STATS_LOG_INTERVAL``
+    seconds, when they change.
+    """
+
+    _counters = ('acquired', 'held', 'unique_violations')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._values = dict.fromkeys(self._counters, 0)
+            self._logged_at = time.time()
+
+    def add(self, **values):
+        with self._lock:
+            for name, value in values.iteritems():
+                self._values[name] += value
+            now = time.time()
+            if now - self._logged_at < LOCK_STATS_LOG_INTERVAL:
+                return
+            self._logged_at = now
+            counters = dict(self._values)
+        _logger.info('Record locks: %s',
+                     ', '.join('%s %s' % (name, counters[name])
+                               for name in self._counters))
+
+    def as_dict(self):
+        """ Return a copy of the counters """
+        with self._lock:
+            return dict(self._values)
+
+
+lock_stats = LockStats()
+
+
+def record_lock_key(backend_id, model_name, record_id):
+    """ Return the key of the advisory lock of a record, a signed
+    64 bits integer """
+    key = '%s,%s,%s' % (backend_id, model_name, record_id)
+    value = int(hashlib.md5(key).hexdigest()[:16], 16)
+    if value >= 2 ** 63:
+        value -= 2 ** 64
+    return value
+
+
+def acquire_record_lock(cr, backend_id, model_name, record_id):
+    """ Acquire the advisory lock of a record for the transaction,
+    without waiting
+
+    :return: True if the lock has been acquired, False if it is held
+             by another transaction
+    """
+    key = record_lock_key(backend_id, model_name, record_id)
+    cr.execute("SELECT pg_try_advisory_xact_lock(%s)", (key,))
+    if cr.fetchone()[0]:
+        lock_stats.add(acquired=1)
+        return True
+    lock_stats.add(held=1)
+    _logger.debug('Lock of %s with id %s held by another transaction',
+                  model_name, record_id)
+    return False
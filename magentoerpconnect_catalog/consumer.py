@@ -41,9 +41,33 @@ EXCLUDED_FIELDS_WRITING = {
 
 def exclude_fields_from_synchro(model_name, fields):
     if fields and EXCLUDED_FIELDS_WRITING.get(model_name):
-        fields = list(set(fields).difference(EXCLUDED_FIELDS_WRITING))
+        fields = list(set(fields).difference(
+            EXCLUDED_FIELDS_WRITING[model_name]))
     return fields
 
+
+def _exclude_vals(model_name, vals):
+    """ Remove the fields excluded from the synchronization, return
+    None when all the written fields are excluded """
+    if not vals:
+        return vals
+    fields = exclude_fields_from_synchro(model_name, vals.keys())
+    if not fields:
+        return None
+    return dict((field, vals[field]) for field in fields)
+
+
+def _attribute_vals(model_name, vals):
+    """ The attributes of the products are custom fields (``x_...``),
+    unknown from the export mapper: a write on one of them is exported
+    as a change of the attribute groups of the product """
+    if model_name not in ('product.product', 'magento.product.product'):
+        return vals
+    if any(field.startswith('x_') for field in vals):
+        vals = dict(vals, attribute_group_ids=True)
+    return vals
+
+
 @on_record_create(model_names=[
         'magento.product.category',
         'magento.product.product',
@@ -61,6 +85,10 @@ def exclude_fields_from_synchro(model_name, fields):
         #'magento.product.storeview',
     ])
 def delay_export(session, model_name, record_id, vals=None):
+    vals = _exclude_vals(model_name, vals)
+    if vals is None:
+        return
+    vals = _attribute_vals(model_name, vals)
     magentoerpconnect.delay_export(session, model_name,
                                    record_id, vals=vals)
 
@@ -72,7 +100,10 @@ def delay_export(session, model_name, record_id, vals=None):
         'attribute.option',
     ])
 def delay_export_all_bindings(session, model_name, record_id, vals=None):
-    #fields = exclude_fields_from_synchro(model_name, fields)
+    vals = _exclude_vals(model_name, vals)
+    if vals is None:
+        return
+    vals = _attribute_vals(model_name, vals)
     magentoerpconnect.delay_export_all_bindings(session, model_name,
                                                 record_id, vals=vals)
 
@@ -24,6 +24,8 @@ import logging
 from openerp.osv import orm, fields
 from openerp.addons.connector.session import ConnectorSession
 from openerp.addons.magentoerpconnect.unit.import_synchronizer import import_batch
+from openerp.addons.magentoerpconnect.unit.export_synchronizer import (
+    delay_export_records_batch)
 
 
 _logger = logging.getLogger(__name__)
@@ -41,6 +43,20 @@ class magento_backend(orm.Model):
             import_batch.delay(session, 'magento.attribute.set', backend_id)
         return True
 
+    def export_products(self, cr, uid, ids, context=None):
+        """ Export all the products bound to the backends, by batches """
+        if not hasattr(ids, '__iter__'):
+            ids = [ids]
+        self.check_magento_structure(cr, uid, ids, context=context)
+        session = ConnectorSession(cr, uid, context=context)
+        binding_model = 'magento.product.product'
+        for backend_id in ids:
+            binding_ids = session.search(binding_model,
+                                         [('backend_id', '=', backend_id)])
+            delay_export_records_batch(session, binding_model, backend_id,
+                                       binding_ids)
+        return True
+
     _columns = {
         'attribute_set_tpl_id': fields.many2one(
             'magento.attribute.set',
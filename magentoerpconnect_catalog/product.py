@@ -23,6 +23,7 @@
 
 from openerp.osv import fields, orm
 from openerp.addons.connector.unit.mapper import (mapping,
+                                                  changed_by,
                                                   ExportMapper)
 from openerp.addons.magentoerpconnect.unit.delete_synchronizer import (
     MagentoDeleteSynchronizer)
@@ -30,9 +31,6 @@ from openerp.addons.magentoerpconnect.unit.export_synchronizer import (
     MagentoTranslationExporter)
 from openerp.addons.magentoerpconnect.backend import magento
 from openerp.addons.connector.exception import MappingError
-from openerp.addons.magentoerpconnect.unit.export_synchronizer import (
-    export_record
-)
 import openerp.addons.magentoerpconnect.consumer as magentoerpconnect
 from openerp.addons.connector.event import on_record_write
 from openerp.addons.connector.connector import ConnectorUnit
@@ -236,12 +234,12 @@ class ProductProductExporter(MagentoTranslationExporter):
         self._validate_data(data)
         return self.backend_adapter.create(product_type, attr_set_id, sku, data)
 
-    def _export_dependencies(self):
-        """ Export the dependencies for the product"""
+    def _dependencies(self):
+        """ Options of the attributes of the product"""
         #TODO add export of category
         attribute_binder = self.get_binder_for_model('magento.product.attribute')
-        option_binder = self.get_binder_for_model('magento.attribute.option')
         record = self.binding_record
+        dependencies = []
         for group in record.attribute_group_ids:
             for attribute in group.attribute_ids:
                 attribute_ext_id = attribute_binder.to_backend(
@@ -253,16 +251,10 @@ class ProductProductExporter(MagentoTranslationExporter):
                     elif attribute.ttype == 'many2many':
                         options = record[attribute.name]
                     for option in options:
-                        if not option_binder.to_backend(option.id, wrap=True):
-                            ctx = self.session.context.copy()
-                            ctx['connector_no_export'] = True
-                            binding_id = self.session.pool['magento.attribute.option'].create(
-                                self.session.cr, self.session.uid, {
-                                    'backend_id': self.backend_record.id,
-                                    'openerp_id': option.id,
-                                    'name': option.name,
-                                }, context=ctx)
-                            export_record(self.session, 'magento.attribute.option', binding_id)
+                        dependencies.append((option,
+                                             'magento.attribute.option',
+                                             {'name': option.name}))
+        return dependencies
 
     def _after_export(self):
         """ Export the link for the configurable product"""
@@ -290,6 +282,9 @@ class ProductProductExportMapper(ExportMapper):
     #           ('visibility', 'visibility'),
     #           ('product_type', 'product_type')
     #           ]
+    @changed_by('name', 'description', 'weight', 'lst_price',
+                'description_sale', 'product_type', 'created_at',
+                'status', 'visibility')
     @mapping
     def all(self, record):
         return {'name': record.name,
@@ -304,6 +299,7 @@ class ProductProductExportMapper(ExportMapper):
                 'visibility': record.visibility,
                 'product_type': record.product_type }
 
+    @changed_by('default_code')
     @mapping
     def sku(self, record):
         sku = record.default_code
@@ -311,12 +307,14 @@ class ProductProductExportMapper(ExportMapper):
             raise MappingError("The product attribute default code cannot be empty.")
         return {'sku': sku}
 
+    @changed_by('attribute_set_id')
     @mapping
     def set(self, record):
         binder = self.get_binder_for_model('magento.attribute.set')
         set_id = binder.to_backend(record.attribute_set_id.id, wrap=True)
         return {'attrset': set_id}
 
+    @changed_by('updated_at')
     @mapping
     def updated_at(self, record):
         updated_at = record.updated_at
@@ -324,6 +322,7 @@ class ProductProductExportMapper(ExportMapper):
             updated_at = '1970-01-01'
         return {'updated_at': updated_at}
 
+    @changed_by('website_ids')
     @mapping
     def website_ids(self, record):
         website_ids = []
@@ -332,6 +331,7 @@ class ProductProductExportMapper(ExportMapper):
             website_ids.append(magento_id)
         return {'website_ids': website_ids}
 
+    @changed_by('categ_id', 'categ_ids')
     @mapping
     def category(self, record):
         categ_ids = []
@@ -346,6 +346,9 @@ class ProductProductExportMapper(ExportMapper):
                     categ_ids.append(m_categ.magento_id)
         return {'categories': categ_ids}
 
+    # the attribute fields are custom fields, a write on one of them is
+    # exported as a change of the attribute groups, see consumer.py
+    @changed_by('attribute_set_id', 'attribute_group_ids')
     @mapping
     def get_product_attribute_option(self, record):
         result = {}
@@ -371,8 +374,12 @@ class ProductProductExportMapper(ExportMapper):
                 elif attribute.ttype == 'many2many':
                     options = record[attribute.name]
                     if options:
+                        option_ids = [option.id for option in options]
+                        magento_options = option_binder.to_backend_many(
+                            option_ids, wrap=True)
                         result[magento_attribute.attribute_code] = \
-                            [option_binder.to_backend(option.id, wrap=True) for option in options]
+                            [magento_options.get(option_id)
+                             for option_id in option_ids]
                     else:
                         result[magento_attribute.attribute_code] = False
                 else:
@@ -28,7 +28,7 @@ from openerp.osv import fields, orm
 from openerp.osv.osv import except_osv
 from openerp.addons.connector.unit.mapper import (
     mapping,
-    #changed_by,
+    changed_by,
     only_create,
     ImportMapper,
     ExportMapper,)
@@ -184,6 +184,7 @@ class AttributeSetExportMapper(ExportMapper):
     ]
 
     @only_create
+    @changed_by()
     @mapping
     def skeletonSetId(self, record):
         tmpl_set_id = self.backend_record.attribute_set_tpl_id.id
@@ -422,6 +423,7 @@ class ProductAttributeExportMapper(ExportMapper):
         ('entity_type_id', 'entity_type_id'),
         ]
 
+    @changed_by('frontend_label')
     @mapping
     def frontend_label(self, record):
         #required
@@ -513,6 +515,7 @@ class AttributeOptionDeleteSynchronizer(MagentoDeleteSynchronizer):
 @magento
 class AttributeOptionExporter(MagentoExporter):
     _model_name = ['magento.attribute.option']
+    _export_required_keys = ('attribute',)
 
     def _update(self, data):
         """ Update an Magento record """
@@ -524,11 +527,10 @@ class AttributeOptionExporter(MagentoExporter):
         "Attributes in magento doesn't retrieve infos on dates"
         return False
 
-    def _export_dependencies(self):
-        """Export attribute if necessary"""
-        self._export_dependency(self.binding_record.openerp_id.attribute_id,
-                                    'magento.product.attribute',
-                                    exporter_class=ProductAttributeExporter)
+    def _dependencies(self):
+        """Attribute of the option"""
+        return [(self.binding_record.openerp_id.attribute_id,
+                 'magento.product.attribute')]
 
 @magento
 class AttributeOptionExportMapper(ExportMapper):
@@ -536,6 +538,7 @@ class AttributeOptionExportMapper(ExportMapper):
 
     direct = []
 
+    @changed_by('magento_name', 'name')
     @mapping
     def label(self, record):
         if record._context:
@@ -557,17 +560,20 @@ class AttributeOptionExportMapper(ExportMapper):
                 })
         return {'label': label}
 
+    @changed_by('attribute_id')
     @mapping
     def attribute(self, record):
         binder = self.get_binder_for_model('magento.product.attribute')
         magento_attribute_id = binder.to_backend(record.openerp_id.attribute_id.id, wrap=True)
         return {'attribute': magento_attribute_id}
 
+    @changed_by('sequence')
     @mapping
     def order(self, record):
         #TODO FIXME
         return {'order': record.openerp_id.sequence + 1 }
 
+    @changed_by('is_default')
     @mapping
     def is_default(self, record):
         return {'is_default': int(record.is_default)}
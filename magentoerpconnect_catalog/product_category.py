@@ -22,7 +22,7 @@
 
 from openerp.osv import fields, orm
 from openerp.addons.connector.unit.mapper import (mapping,
-                                                  #changed_by,
+                                                  changed_by,
                                                   ExportMapper)
 from openerp.addons.magentoerpconnect.unit.delete_synchronizer import (
         MagentoDeleteSynchronizer)
@@ -163,17 +163,11 @@ class ProductCategoryExporter(MagentoTranslationExporter):
         self._backend_adapter = get_unit(ProductCategoryAdapter)
         return self._backend_adapter
 
-    def _export_dependencies(self):
-        """Export parent of the category"""
+    def _dependencies(self):
+        """Parent of the category"""
         record = self.binding_record
-        if record.magento_parent_id:
-            self._export_dependency(record.magento_parent_id,
-                                    'magento.product.category',
-                                    exporter_class=ProductCategoryExporter)
-        elif record.parent_id:
-            self._export_dependency(record.parent_id,
-                                    'magento.product.category',
-                                    exporter_class=ProductCategoryExporter)
+        parent = record.magento_parent_id or record.parent_id
+        return [(parent, 'magento.product.category')]
 
 
 @magento
@@ -198,10 +192,12 @@ class ProductCategoryExportMapper(ExportMapper):
               ('image_name', 'thumbnail'),
              ]
 
+    @changed_by()
     @mapping
     def sort(self, record):
         return {'default_sort_by':'price', 'available_sort_by': 'price'}
 
+    @changed_by('parent_id', 'magento_parent_id')
     @mapping
     def parent(self, record):
         """ Magento root category's Id equals 1 """
@@ -215,6 +211,7 @@ class ProductCategoryExportMapper(ExportMapper):
             parent_id = 1
         return {'parent_id':parent_id}
 
+    @changed_by('is_active')
     @mapping
     def active(self, record):
         is_active = record['is_active']
@@ -222,6 +219,7 @@ class ProductCategoryExportMapper(ExportMapper):
             is_active = 0
         return {'is_active':is_active}
 
+    @changed_by('include_in_menu')
     @mapping
     def menu(self, record):
         include_in_menu = record['include_in_menu']
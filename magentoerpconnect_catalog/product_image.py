@@ -23,6 +23,7 @@ import mimetypes
 
 from openerp.osv import fields, orm
 from openerp.addons.connector.unit.mapper import (mapping,
+                                                  changed_by,
                                                   ExportMapper)
 from openerp.addons.magentoerpconnect.unit.binder import MagentoModelBinder
 from openerp.addons.magentoerpconnect.unit.delete_synchronizer import (
@@ -96,11 +97,17 @@ class ProductImageDeleteSynchronizer(MagentoDeleteSynchronizer):
 @magento
 class ProductImageExporter(MagentoExporter):
     _model_name = ['magento.product.image']
+    _export_required_keys = ('product',)
 
     def _should_import(self):
         "Images in magento doesn't retrieve infos on dates"
         return False
 
+    def _dependencies(self):
+        """Product of the image"""
+        return [(self.binding_record.openerp_id.product_id,
+                 'magento.product.product')]
+
 @magento
 class ProductImageExportMapper(ExportMapper):
     _model_name = 'magento.product.image'
@@ -110,6 +117,7 @@ class ProductImageExportMapper(ExportMapper):
             ('sequence', 'position'),
         ]
 
+    @changed_by('product_id')
     @mapping
     def product(self, record):
         binder = self.get_binder_for_model('magento.product.product')
@@ -117,10 +125,12 @@ class ProductImageExportMapper(ExportMapper):
             record.openerp_id.product_id.id, True)
         return {'product': str(external_product_id)}
 
+    @changed_by()
     @mapping
     def identifierType(self, record):
         return {'identifierType': 'ID'}
 
+    @changed_by('product_id', 'sequence')
     @mapping
     def types(self, record):
         product_obj = self.session.pool['product.product']
@@ -133,6 +143,7 @@ class ProductImageExportMapper(ExportMapper):
         else:
             return {'types': []}
 
+    @changed_by('image', 'file_name', 'name')
     @mapping
     def file(self, record):
         ctx = record._context.copy()
@@ -110,3 +110,32 @@ class TestAutoBindProduct(SetUpProduct):
         self.assertEqual(mag_product.status, '1')
 
 
+
+
+class TestExportNeeded(SetUpProduct):
+    """ Only the writes on the exported fields enqueue an export """
+
+    def setUp(self):
+        super(TestExportNeeded, self).setUp()
+        self.job_model = self.registry('queue.job')
+        self.active_product_autobind()
+        self.product_id = self.add_product('My product')
+        binding_ids = self.get_product_binding(self.product_id)
+        self.mag_product_model.write(
+            self.cr, self.uid, binding_ids, {'magento_id': '42'},
+            context={'connector_no_export': True})
+
+    def _new_jobs(self, vals):
+        job_ids = self.job_model.search(self.cr, self.uid, [])
+        self.product_model.write(self.cr, self.uid, [self.product_id], vals)
+        return self.job_model.search(self.cr, self.uid,
+                                     [('id', 'not in', job_ids)])
+
+    def test_10_no_export_unused_fields(self):
+        self.assertFalse(self._new_jobs({'image': False}))
+        self.assertFalse(self._new_jobs({
+            'message_follower_ids': [(6, 0, [])],
+            }))
+
+    def test_20_export_used_fields(self):
+        self.assertEqual(len(self._new_jobs({'default_code': 'SKU-42'})), 1)
@@ -27,6 +27,7 @@ from openerp.addons.magentoerpconnect import product
 @magento(replacing=product.IsActiveProductImportMapper)
 class ProductImportMapper(product.IsActiveProductImportMapper):
     _model_name = 'magento.product.product'
+    _magento_attributes = ['status']
 
     @mapping
     def is_active(self, record):
@@ -25,6 +25,7 @@ from openerp.addons.connector.event import (
     on_record_create)
 from openerp.addons.connector.unit.mapper import (
     mapping,
+    changed_by,
     ImportMapChild,
     ImportMapper,
     ExportMapper)
@@ -273,6 +274,7 @@ class SaleCommentExportMapper(ExportMapper):
         ('is_customer_notified', 'notify'),
     ]
 
+    @changed_by('body')
     @mapping
     def comment(self, record):
         "clean html tags but keep break lines"
@@ -281,11 +283,13 @@ class SaleCommentExportMapper(ExportMapper):
             comment = comment.replace(elm, elm + '\n')
         return {'comment': BeautifulSoup(comment).get_text()}
 
+    @changed_by('magento_sale_order_id')
     @mapping
     def status(self, record):
         state = record.magento_sale_order_id.openerp_id.state
         return {'status': sale.ORDER_STATUS_MAPPING.get(state, 'pending')}
 
+    @changed_by('magento_sale_order_id')
     @mapping
     def order_increment(self, record):
         binder = self.get_binder_for_model('magento.sale.order')
@@ -41,6 +41,7 @@ from openerp.addons.magentoerpconnect.related_action import (
 @magento(replacing=product.ProductImportMapper)
 class ProductImportMapper(product.ProductImportMapper):
     _model_name = 'magento.product.product'
+    _magento_attributes = product.ProductImportMapper._magento_attributes
 
     @only_create
     @mapping
@@ -76,6 +77,17 @@ class ProductPriceExporter(MagentoBaseExporter):
         self.backend_adapter.write(self.magento_id, data,
                                    storeview_id=storeview_id)
 
+    def _update_many(self, updates):
+        """ Update the prices of several websites in one request
+
+        :param updates: list of ``(data, storeview_id)``
+        """
+        records = [(self.magento_id, data, storeview_id)
+                   for data, storeview_id in updates]
+        for result in self.backend_adapter.write_many(records):
+            if isinstance(result, Exception):
+                raise result
+
     def _run(self, website_id=None):
         """ Export the product inventory to Magento
 
@@ -99,6 +111,7 @@ class ProductPriceExporter(MagentoBaseExporter):
         # export the price for websites if they have a different
         # pricelist
         storeview_binder = self.get_binder_for_model('magento.storeview')
+        updates = []
         for website in self.backend_record.website_ids:
             if website_id is not None and website.id != website_id:
                 continue
@@ -125,7 +138,12 @@ class ProductPriceExporter(MagentoBaseExporter):
                 continue
             magento_storeview = storeview_binder.to_backend(storeview_ids[0])
             price = self._get_price(site_pricelist_id)
-            self._update({'price': price}, storeview_id=magento_storeview)
+            updates.append(({'price': price}, magento_storeview))
+        if len(updates) == 1:
+            data, storeview_id = updates[0]
+            self._update(data, storeview_id=storeview_id)
+        elif updates:
+            self._update_many(updates)
         self.binder.bind(self.magento_id, self.binding_id)
         return _('Prices have been updated.')
 